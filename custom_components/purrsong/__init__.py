@@ -6,22 +6,64 @@ from lavviebot.exceptions import LavviebotAuthError
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_EMAIL, CONF_USERNAME, CONF_PASSWORD
 from homeassistant.core import HomeAssistant
+import homeassistant.helpers.config_validation as cv
+from homeassistant.helpers.storage import Store
+from homeassistant.helpers.typing import ConfigType
 
-from .const import DOMAIN, LOGGER, PLATFORMS
+from .const import (
+    ANALYTICS_STORAGE_KEY,
+    DOMAIN,
+    HISTORY_STORAGE_KEY,
+    LOGGER,
+    PLATFORMS,
+    SNAPSHOT_STORAGE_KEY,
+    STORAGE_VERSION,
+)
 from .coordinator import LavviebotDataUpdateCoordinator
+from .services import async_register_services
 from .util import NoDevicesError, async_validate_api
+from .websocket_api import async_register_websocket_commands
+
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up the PurrSong websocket API and services."""
+
+    async_register_websocket_commands(hass)
+    async_register_services(hass)
+    return True
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up PurrSong from a config entry."""
 
     coordinator = LavviebotDataUpdateCoordinator(hass, entry)
-    await coordinator.async_config_entry_first_refresh()
+    await coordinator.analytics.async_load()
+    await coordinator.history.async_load()
+    # Serve the last good data immediately and revalidate in the background
+    if await coordinator.async_restore_snapshot():
+        entry.async_create_background_task(
+            hass, coordinator.async_refresh(), f'{DOMAIN}_{entry.entry_id}_revalidate'
+        )
+    else:
+        await coordinator.async_config_entry_first_refresh()
     hass.data.setdefault(DOMAIN, {})[entry.entry_id] = coordinator
+    entry.async_on_unload(coordinator.async_start_watchdog())
+    entry.async_on_unload(entry.add_update_listener(async_update_options))
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
     return True
 
+async def async_update_options(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Apply changed PurrSong options to the running coordinator."""
+
+    coordinator: LavviebotDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+    # Summary mode changes which entities exist, so it needs the platforms set up again
+    if coordinator.summary_options() != coordinator.entity_options:
+        await hass.config_entries.async_reload(entry.entry_id)
+        return
+    coordinator.async_apply_options()
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload PurrSong config entry."""
     if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
@@ -30,6 +72,12 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             del hass.data[DOMAIN]
     return unload_ok
 
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove data stored on disk for a PurrSong config entry."""
+
+    for key in (SNAPSHOT_STORAGE_KEY, ANALYTICS_STORAGE_KEY, HISTORY_STORAGE_KEY):
+        await Store(hass, STORAGE_VERSION, f"{key}.{entry.entry_id}").async_remove()
+
 async def async_migrate_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Migrate old entry."""
     # Also set PurrSong account user_id as config unique_id
@@ -0,0 +1,1320 @@
+""" Derived statistics for the PurrSong integration.
+
+Each tracker is updated incrementally from coordinator data after every
+refresh and is saved to disk, so no recorder history is needed.
+"""
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Collection
+from datetime import date, datetime, timedelta
+from math import sqrt
+from statistics import median
+from typing import Any
+
+from lavviebot.model import Cat, LavviebotData, LitterBox
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+import homeassistant.util.dt as dt_util
+
+from .const import (
+    ACTIVITY_DAYS,
+    ACTIVITY_HOURS,
+    ACTIVITY_MIN_DAYS,
+    ANALYTICS_SAVE_DELAY,
+    ANALYTICS_STORAGE_KEY,
+    ANOMALY_MIN_DAYS,
+    ANOMALY_MIN_STD_DURATION,
+    ANOMALY_MIN_STD_VISITS,
+    ANOMALY_MIN_WEEKDAY_DAYS,
+    BATTERY_MIN_SAMPLES,
+    BATTERY_MIN_SPAN,
+    BATTERY_REPLACEMENT_JUMP,
+    BATTERY_SAMPLE_INTERVAL,
+    CADENCE_MAX_SPREAD,
+    CADENCE_MIN_GAPS,
+    CADENCE_WINDOW,
+    CLEANING_TIMEOUT,
+    CLOUD_RESET_GRACE,
+    CLOUD_TIME_ZONE,
+    CONNECTIVITY_DEFAULT_GAP,
+    CONNECTIVITY_GAP_FACTOR,
+    CONNECTIVITY_MIN_SILENCE,
+    CONNECTIVITY_WINDOW_DAYS,
+    EVENT_CLEANING_CYCLE,
+    FORECAST_EWMA_ALPHA,
+    LITTER_BUFFER_SIZE,
+    LITTER_MIN_SPAN,
+    LITTER_NOISE_PNDS,
+    LITTER_SAMPLE_INTERVAL,
+    STORAGE_VERSION,
+    WEIGHT_EWMA_ALPHA,
+    WEIGHT_HISTORY_DAYS,
+    WEIGHT_MEDIAN_WINDOW,
+    WEIGHT_OUTLIER_MIN,
+    WEIGHT_OUTLIER_SIGMA,
+    WEIGHT_RELEARN_COUNT,
+)
+from .history import EventHistory
+
+
+class WeightFilter:
+    """ Outlier-resistant streaming filter for a cat's weight.
+
+    New readings pass through a short rolling median followed by an EWMA.
+    Readings far from the filtered weight, such as a cat stepping off the
+    scale or two cats in the box, are rejected unless several in a row
+    agree, in which case the filter relearns from them. One filtered value
+    per day is kept to compute weight change over 7 and 30 days.
+    """
+
+    def __init__(self) -> None:
+        self.window: deque[float] = deque(maxlen=WEIGHT_MEDIAN_WINDOW)
+        self.ewma: float | None = None
+        self.variance: float = 0.0
+        self.last_raw: float | None = None
+        self.rejected: int = 0
+        self.consecutive_rejections: int = 0
+        # (date ordinal, filtered weight) for each day with a reading
+        self.daily: deque[tuple[int, float]] = deque(maxlen=WEIGHT_HISTORY_DAYS)
+
+    def update(self, raw: float, today: date) -> None:
+        """ Add a weight reading in pounds. Repeated or empty readings are ignored. """
+
+        if raw <= 0 or raw == self.last_raw:
+            return
+        self.last_raw = raw
+
+        if self.ewma is not None:
+            limit = max(WEIGHT_OUTLIER_MIN, WEIGHT_OUTLIER_SIGMA * sqrt(self.variance))
+            if abs(raw - self.ewma) > limit:
+                self.rejected += 1
+                self.consecutive_rejections += 1
+                if self.consecutive_rejections < WEIGHT_RELEARN_COUNT:
+                    return
+                # Several outliers in a row mean the weight really changed
+                self.window.clear()
+                self.ewma = None
+        self.consecutive_rejections = 0
+
+        self.window.append(raw)
+        smoothed = median(self.window)
+        if self.ewma is None:
+            self.ewma = smoothed
+            self.variance = 0.0
+        else:
+            diff = smoothed - self.ewma
+            self.ewma += WEIGHT_EWMA_ALPHA * diff
+            self.variance = (1 - WEIGHT_EWMA_ALPHA) * (self.variance + WEIGHT_EWMA_ALPHA * diff * diff)
+
+        ordinal = today.toordinal()
+        if self.daily and self.daily[-1][0] == ordinal:
+            self.daily[-1] = (ordinal, self.ewma)
+        else:
+            self.daily.append((ordinal, self.ewma))
+
+    def change(self, days: int, today: date) -> float | None:
+        """ Return the change in filtered weight over the last number of days. """
+
+        if self.ewma is None:
+            return None
+        target = today.toordinal() - days
+        for ordinal, weight in reversed(self.daily):
+            if ordinal <= target:
+                return self.ewma - weight
+        return None
+
+    def as_dict(self) -> dict[str, Any]:
+        """ Return filter state for storage. """
+
+        return {
+            'window': list(self.window),
+            'ewma': self.ewma,
+            'variance': self.variance,
+            'last_raw': self.last_raw,
+            'rejected': self.rejected,
+            'consecutive_rejections': self.consecutive_rejections,
+            'daily': [list(point) for point in self.daily],
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> WeightFilter:
+        """ Restore filter state from storage. """
+
+        weight_filter = cls()
+        weight_filter.window.extend(data['window'])
+        weight_filter.ewma = data['ewma']
+        weight_filter.variance = data['variance']
+        weight_filter.last_raw = data['last_raw']
+        weight_filter.rejected = data['rejected']
+        weight_filter.consecutive_rejections = data['consecutive_rejections']
+        weight_filter.daily.extend(tuple(point) for point in data['daily'])
+        return weight_filter
+
+
+class Welford:
+    """ Running mean and variance using Welford's algorithm. """
+
+    def __init__(self, count: int = 0, mean: float = 0.0, m2: float = 0.0) -> None:
+        self.count = count
+        self.mean = mean
+        self.m2 = m2
+
+    def add(self, value: float) -> None:
+        """ Add a sample. """
+
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+
+    @property
+    def std(self) -> float:
+        """ Return the sample standard deviation. """
+
+        if self.count < 2:
+            return 0.0
+        return sqrt(self.m2 / (self.count - 1))
+
+    def as_list(self) -> list[float]:
+        """ Return state for storage. """
+
+        return [self.count, self.mean, self.m2]
+
+
+class UsageBaseline:
+    """ Per-cat baseline of daily litter box visits and visit duration.
+
+    Days follow the cloud's timezone, as that is when a cat's totals for
+    today reset. A day is closed once its visit count drops, or once the
+    reset grace period after the cloud's midnight has passed without a drop,
+    as happens after a day without visits. Completed days are added to
+    Welford accumulators for their weekday and for all days. Today's values
+    are scored against the weekday baseline, or the all-days baseline until
+    enough weeks have been seen. Visits are compared to the share of the
+    daily mean expected by this time of the cloud's day, and nothing is
+    scored while waiting for the reset.
+    """
+
+    METRICS = ('visits', 'duration')
+
+    def __init__(self) -> None:
+        # Cloud date ordinal of the day being accumulated
+        self.day: int | None = None
+        self.today: dict[str, float] = {'visits': 0, 'duration': 0.0}
+        self.weekday: dict[str, list[Welford]] = {
+            metric: [Welford() for _ in range(7)] for metric in self.METRICS
+        }
+        self.overall: dict[str, Welford] = {metric: Welford() for metric in self.METRICS}
+        self.scores: dict[str, float] = {'visits': 0.0, 'duration': 0.0}
+        self.expected_visits: float | None = None
+
+    @property
+    def score(self) -> float:
+        """ Return the largest absolute deviation score for today. """
+
+        return max(abs(score) for score in self.scores.values())
+
+    def update(self, visits: int, duration: float, now: datetime) -> None:
+        """ Add today's visit count and average duration so far. """
+
+        cloud_now = now.astimezone(dt_util.get_time_zone(CLOUD_TIME_ZONE))
+        ordinal = cloud_now.date().toordinal()
+        values = {'visits': visits, 'duration': duration}
+        if self.day is None:
+            self.day = ordinal
+        elif visits < self.today['visits']:
+            # The totals reset, possibly a little before the cloud's midnight here
+            self._close_day()
+            self.day = max(ordinal, self.day + 1)
+        elif ordinal > self.day:
+            midnight = cloud_now.replace(hour=0, minute=0, second=0, microsecond=0)
+            if (cloud_now - midnight).total_seconds() < CLOUD_RESET_GRACE:
+                # Still yesterday's totals until they drop
+                self.today = values
+                self.scores = {'visits': 0.0, 'duration': 0.0}
+                self.expected_visits = None
+                return
+            self._close_day()
+            self.day = ordinal
+        self.today = values
+        self._score(cloud_now)
+
+    def _close_day(self) -> None:
+        """ Add the final values of the day being accumulated to the baseline. """
+
+        weekday = date.fromordinal(self.day).weekday()
+        for metric in self.METRICS:
+            # Average duration is meaningless for a day without visits
+            if metric == 'duration' and not self.today['visits']:
+                continue
+            self.weekday[metric][weekday].add(self.today[metric])
+            self.overall[metric].add(self.today[metric])
+
+    def _baseline(self, metric: str, weekday: int) -> Welford | None:
+        """ Return the baseline to score a metric against, if there is enough data. """
+
+        if self.weekday[metric][weekday].count >= ANOMALY_MIN_WEEKDAY_DAYS:
+            return self.weekday[metric][weekday]
+        if self.overall[metric].count >= ANOMALY_MIN_DAYS:
+            return self.overall[metric]
+        return None
+
+    def _score(self, cloud_now: datetime) -> None:
+        """ Score today's trajectory against the baseline. """
+
+        weekday = date.fromordinal(self.day).weekday()
+        if cloud_now.date().toordinal() == self.day:
+            midnight = cloud_now.replace(hour=0, minute=0, second=0, microsecond=0)
+            fraction = max((cloud_now - midnight).total_seconds() / 86400, 1 / 24)
+        else:
+            # The totals reset before the cloud's midnight here, so the day has only begun
+            fraction = 1 / 24
+
+        self.scores = {'visits': 0.0, 'duration': 0.0}
+        self.expected_visits = None
+        if (visits := self._baseline('visits', weekday)) is not None:
+            self.expected_visits = visits.mean * fraction
+            std = max(visits.std * sqrt(fraction), ANOMALY_MIN_STD_VISITS)
+            self.scores['visits'] = (self.today['visits'] - self.expected_visits) / std
+        if (duration := self._baseline('duration', weekday)) is not None and self.today['visits']:
+            std = max(duration.std, ANOMALY_MIN_STD_DURATION)
+            self.scores['duration'] = (self.today['duration'] - duration.mean) / std
+
+    def as_dict(self) -> dict[str, Any]:
+        """ Return baseline state for storage. """
+
+        return {
+            'day': self.day,
+            'today': self.today,
+            'weekday': {
+                metric: [welford.as_list() for welford in accumulators]
+                for metric, accumulators in self.weekday.items()
+            },
+            'overall': {metric: welford.as_list() for metric, welford in self.overall.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> UsageBaseline:
+        """ Restore baseline state from storage. """
+
+        baseline = cls()
+        baseline.day = data['day']
+        baseline.today = data['today']
+        for metric in cls.METRICS:
+            baseline.weekday[metric] = [Welford(*state) for state in data['weekday'][metric]]
+            baseline.overall[metric] = Welford(*data['overall'][metric])
+        return baseline
+
+
+# Cat activity fields tracked by ActivityRollup, in bucket order
+ACTIVITIES = ('zoomies', 'running', 'walking', 'resting', 'sleeping')
+# Activities counted as active time
+ACTIVE = ('running', 'walking')
+# Activities measured in seconds, which make up the activity mix
+TIMED_ACTIVITIES = ('running', 'walking', 'resting', 'sleeping')
+
+
+class ActivityRollup:
+    """ Roll up a cat's LavvieTag activity into hourly, daily and weekly totals.
+
+    The cloud reports running totals for today, which reset at midnight in
+    the cloud's timezone rather than Home Assistant's. Each refresh adds the
+    increase since the previous refresh to the current hour and day buckets,
+    treating a drop in a total as the daily reset. Buckets are fixed-size,
+    so every update is constant time.
+    """
+
+    def __init__(self) -> None:
+        self.day: int | None = None
+        self.last: list[float] = [0.0] * len(ACTIVITIES)
+        # [hour ordinal, *activity totals]
+        self.hours: deque[list[float]] = deque(maxlen=ACTIVITY_HOURS + 1)
+        # [day ordinal, *activity totals]
+        self.days: deque[list[float]] = deque(maxlen=ACTIVITY_DAYS + 1)
+
+    def update(self, cat: Cat, local_now: datetime) -> None:
+        """ Add the latest activity totals of a cat. """
+
+        values = [float(getattr(cat, activity) or 0) for activity in ACTIVITIES]
+        today = local_now.date().toordinal()
+        hour = today * 24 + local_now.hour
+        if self.day is None:
+            # Today's totals so far are known, but not which hours they fell in
+            hour_deltas, day_deltas = [0.0] * len(values), values
+        else:
+            hour_deltas = day_deltas = [
+                value - last if value >= last else value
+                for value, last in zip(values, self.last)
+            ]
+        self._bucket(self.hours, hour, hour_deltas)
+        self._bucket(self.days, today, day_deltas)
+        self.day = today
+        self.last = values
+
+    @staticmethod
+    def _bucket(buckets: deque[list[float]], ordinal: int, deltas: list[float]) -> None:
+        """ Add deltas to the bucket for an hour or day, starting a new one if needed. """
+
+        if not buckets or buckets[-1][0] != ordinal:
+            buckets.append([ordinal, *([0.0] * len(deltas))])
+        bucket = buckets[-1]
+        for index, delta in enumerate(deltas, start=1):
+            bucket[index] += delta
+
+    @staticmethod
+    def _totals(buckets: list[list[float]]) -> dict[str, float]:
+        """ Sum buckets into per-activity totals. """
+
+        return {
+            activity: sum(bucket[index] for bucket in buckets)
+            for index, activity in enumerate(ACTIVITIES, start=1)
+        }
+
+    def hour_totals(self, local_now: datetime, hours_ago: int = 0) -> dict[str, float]:
+        """ Return activity in the hour starting the given number of hours ago. """
+
+        hour = local_now.date().toordinal() * 24 + local_now.hour - hours_ago
+        return self._totals([bucket for bucket in self.hours if bucket[0] == hour])
+
+    def last_day_totals(self, local_now: datetime) -> dict[str, float]:
+        """ Return activity over the last 24 hours. """
+
+        hour = local_now.date().toordinal() * 24 + local_now.hour
+        return self._totals([bucket for bucket in self.hours if bucket[0] > hour - ACTIVITY_HOURS])
+
+    def today_totals(self, today: date) -> dict[str, float]:
+        """ Return activity since midnight. """
+
+        return self._totals([bucket for bucket in self.days if bucket[0] == today.toordinal()])
+
+    def week_totals(self, today: date) -> dict[str, float]:
+        """ Return activity over today and the 6 days before it. """
+
+        start = today.toordinal() - ACTIVITY_DAYS
+        return self._totals([bucket for bucket in self.days if bucket[0] > start])
+
+    def baseline(self, today: date) -> dict[str, float] | None:
+        """ Return the average daily activity over the 7 days before today. """
+
+        start = today.toordinal() - ACTIVITY_DAYS
+        days = [bucket for bucket in self.days if start <= bucket[0] < today.toordinal()]
+        if len(days) < ACTIVITY_MIN_DAYS:
+            return None
+        return {activity: total / len(days) for activity, total in self._totals(days).items()}
+
+    @staticmethod
+    def active(totals: dict[str, float]) -> float:
+        """ Return the active seconds in a set of totals. """
+
+        return sum(totals[activity] for activity in ACTIVE)
+
+    @staticmethod
+    def mix(totals: dict[str, float]) -> dict[str, float] | None:
+        """ Return each timed activity as a percentage of all timed activity. """
+
+        tracked = sum(totals[activity] for activity in TIMED_ACTIVITIES)
+        if not tracked:
+            return None
+        return {activity: totals[activity] / tracked * 100 for activity in TIMED_ACTIVITIES}
+
+    def as_dict(self) -> dict[str, Any]:
+        """ Return rollup state for storage. """
+
+        return {
+            'day': self.day,
+            'last': self.last,
+            'hours': list(self.hours),
+            'days': list(self.days),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> ActivityRollup:
+        """ Restore rollup state from storage. """
+
+        rollup = cls()
+        rollup.day = data['day']
+        rollup.last = [float(value) for value in data['last']]
+        rollup.hours.extend(list(bucket) for bucket in data['hours'])
+        rollup.days.extend(list(bucket) for bucket in data['days'])
+        return rollup
+
+
+class LifetimeCounter:
+    """ Accumulate lifetime totals for a cat or litter box.
+
+    A cat's daily visit count and total visit time are turned into
+    increments: the increase since the previous refresh, or the whole value
+    once the visit count drops. The cloud resets its daily values at
+    midnight in its own timezone, so a drop in the count is the only
+    reliable sign of a new day. Polls missed during the day are covered by
+    the next increase. Totals only ever grow, so they suit long-term
+    statistics.
+    """
+
+    def __init__(self) -> None:
+        self.last: dict[str, float] = {}
+        self.totals: dict[str, float] = {'visits': 0, 'duration': 0.0, 'cleanings': 0}
+
+    def add_daily(self, visits: int, average_duration: float) -> None:
+        """ Add today's visit count and average visit duration so far. """
+
+        reset = visits < self.last.get('visits', 0)
+        saved = bool(self.last)
+        visit_time = visits * average_duration
+        # Today's visit time is kept apart from the average saved by earlier versions
+        for key, last_key, value in (
+            ('visits', 'visits', visits),
+            ('duration', 'visit_time', visit_time),
+        ):
+            # A counter restored without this value starts from its current value
+            last = 0 if reset else self.last.get(last_key, value if saved else 0)
+            # Rounding of the average can make today's visit time dip slightly
+            self.totals[key] += max(value - last, 0)
+            self.last[last_key] = value
+        self.last.pop('duration', None)
+
+    def add(self, key: str, amount: float) -> None:
+        """ Add an increment to a lifetime total. """
+
+        self.totals[key] += amount
+
+    def as_dict(self) -> dict[str, Any]:
+        """ Return counter state for storage. """
+
+        return {'last': self.last, 'totals': self.totals}
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> LifetimeCounter:
+        """ Restore counter state from storage. """
+
+        counter = cls()
+        counter.last = dict(data['last'])
+        counter.totals.update(data['totals'])
+        return counter
+
+
+def _ewma(current: float | None, sample: float) -> float:
+    """ Blend a new sample into an exponentially weighted average. """
+
+    if current is None:
+        return sample
+    return current + FORECAST_EWMA_ALPHA * (sample - current)
+
+
+class VisitCounter:
+    """ Count litter box visits between refreshes.
+
+    times_used_today is counted from the usage history against Home
+    Assistant's local date (see parse_litter_box), so unlike a cat's daily
+    totals it resets at local midnight. New visits are the increase in that
+    count, or the whole count once it drops. A change in last_used with no
+    increase still counts as one visit.
+    """
+
+    def __init__(self) -> None:
+        self.count: int = 0
+        self.last_used: float | None = None
+        self.new_visits: int = 0
+
+    def update(self, times_used_today: int, last_used: datetime) -> int:
+        """ Return the number of visits since the previous refresh. """
+
+        last_used_ts = last_used.timestamp()
+        if self.last_used is None:
+            new_visits = 0
+        elif times_used_today < self.count:
+            new_visits = max(times_used_today, 1 if last_used_ts != self.last_used else 0)
+        elif times_used_today > self.count:
+            new_visits = times_used_today - self.count
+        else:
+            new_visits = 1 if last_used_ts > self.last_used else 0
+        self.count = times_used_today
+        self.last_used = last_used_ts
+        self.new_visits = new_visits
+        return new_visits
+
+    def as_dict(self) -> dict[str, Any]:
+        """ Return counter state for storage. """
+
+        return {'count': self.count, 'last_used': self.last_used}
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> VisitCounter:
+        """ Restore counter state from storage. """
+
+        counter = cls()
+        counter.count = data['count']
+        counter.last_used = data['last_used']
+        return counter
+
+
+class CleaningCycle:
+    """ Infer a litter box's automatic cleaning cycles.
+
+    A small state machine: a new visit moves the box from idle to waiting,
+    and the next sign of a cleaning completes the cycle. Signs of a cleaning
+    are a drop in tray weight (clumps scooped out), the waste drawer getting
+    fuller, or the litter storage getting lower (tray refilled). If no sign
+    appears within the wait time plus a timeout, the box returns to idle.
+    The delay from the visit to the detected cleaning is compared with the
+    box's wait_time setting.
+    """
+
+    IDLE = 'idle'
+    WAITING = 'waiting'
+
+    def __init__(self) -> None:
+        self.state: str = self.IDLE
+        self.visit_at: float | None = None
+        self.bottom: float | None = None
+        self.waste: int | None = None
+        self.storage: int | None = None
+        self.last_cycle: float | None = None
+        self.last_delay: float | None = None
+        self.average_delay: float | None = None
+        self.missed: int = 0
+
+    def update(self, box: LitterBox, new_visits: int, now: datetime) -> float | None:
+        """ Advance the state machine. Return the cleaning delay if a cycle completed. """
+
+        now_ts = now.timestamp()
+        bottom = box.litter_bottom_amount_pnds
+        cleaned = (
+            (self.bottom is not None and bottom - self.bottom <= -LITTER_NOISE_PNDS)
+            or (self.waste is not None and box.waste_drawer_status < self.waste)
+            or (self.storage is not None and box.top_litter_status < self.storage)
+        )
+        if self.bottom is None or abs(bottom - self.bottom) >= LITTER_NOISE_PNDS:
+            self.bottom = bottom
+        self.waste = box.waste_drawer_status
+        self.storage = box.top_litter_status
+
+        delay = None
+        if new_visits:
+            self.state = self.WAITING
+            self.visit_at = box.last_used.timestamp()
+        elif self.state == self.WAITING and cleaned:
+            delay = now_ts - self.visit_at
+            self.last_cycle = now_ts
+            self.last_delay = delay
+            self.average_delay = _ewma(self.average_delay, delay)
+            self.state = self.IDLE
+        elif self.state == self.WAITING:
+            if now_ts - self.visit_at > (box.wait_time or 0) * 60 + CLEANING_TIMEOUT:
+                self.missed += 1
+                self.state = self.IDLE
+        return delay
+
+    def as_dict(self) -> dict[str, Any]:
+        """ Return state machine state for storage. """
+
+        return {
+            'state': self.state,
+            'visit_at': self.visit_at,
+            'bottom': self.bottom,
+            'waste': self.waste,
+            'storage': self.storage,
+            'last_cycle': self.last_cycle,
+            'last_delay': self.last_delay,
+            'average_delay': self.average_delay,
+            'missed': self.missed,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> CleaningCycle:
+        """ Restore state machine state from storage. """
+
+        cycle = cls()
+        cycle.state = data['state']
+        cycle.visit_at = data['visit_at']
+        cycle.bottom = data['bottom']
+        cycle.waste = data['waste']
+        cycle.storage = data['storage']
+        cycle.last_cycle = data['last_cycle']
+        cycle.last_delay = data['last_delay']
+        cycle.average_delay = data['average_delay']
+        cycle.missed = data['missed']
+        return cycle
+
+
+class DrawerForecast:
+    """ Forecast when a litter box waste drawer will be full.
+
+    A fill cycle starts when the drawer is emptied, seen as the status going
+    from full (0) or almost full (1) back to empty (2). When the drawer first
+    reports full, the visits and hours the cycle took are blended into the
+    learned visits per fill and visits per hour. The forecast is the visits
+    still left in the cycle divided by the visit rate.
+    """
+
+    def __init__(self) -> None:
+        self.status: int | None = None
+        self.cycle_start: float | None = None
+        self.cycle_visits: int = 0
+        self.full_at: float | None = None
+        self.visits_per_fill: float | None = None
+        self.visits_per_hour: float | None = None
+        self.cycles: int = 0
+        self.predicted_full: datetime | None = None
+
+    def update(self, status: int, new_visits: int, now: datetime) -> None:
+        """ Add the latest drawer status and the visits since the previous refresh. """
+
+        now_ts = now.timestamp()
+        self.cycle_visits += new_visits
+        if self.status in (0, 1) and status == 2:
+            self.cycle_start = now_ts
+            self.cycle_visits = 0
+            self.full_at = None
+        elif status == 0 and self.full_at is None:
+            self.full_at = now_ts
+            hours = None if self.cycle_start is None else (now_ts - self.cycle_start) / 3600
+            if hours and self.cycle_visits:
+                self.visits_per_fill = _ewma(self.visits_per_fill, self.cycle_visits)
+                self.visits_per_hour = _ewma(self.visits_per_hour, self.cycle_visits / hours)
+                self.cycles += 1
+        self.status = status
+        self._forecast(now)
+
+    def _forecast(self, now: datetime) -> None:
+        """ Compute the predicted full time from the learned rates. """
+
+        if self.full_at is not None:
+            self.predicted_full = dt_util.utc_from_timestamp(self.full_at)
+        elif self.visits_per_fill and self.visits_per_hour:
+            remaining = max(self.visits_per_fill - self.cycle_visits, 0)
+            self.predicted_full = now + timedelta(hours=remaining / self.visits_per_hour)
+        else:
+            self.predicted_full = None
+
+    def hours_remaining(self, now: datetime) -> float | None:
+        """ Return hours until the drawer is predicted to be full. """
+
+        if self.predicted_full is None:
+            return None
+        return max((self.predicted_full - now).total_seconds() / 3600, 0.0)
+
+    def as_dict(self) -> dict[str, Any]:
+        """ Return forecast state for storage. """
+
+        return {
+            'status': self.status,
+            'cycle_start': self.cycle_start,
+            'cycle_visits': self.cycle_visits,
+            'full_at': self.full_at,
+            'visits_per_fill': self.visits_per_fill,
+            'visits_per_hour': self.visits_per_hour,
+            'cycles': self.cycles,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> DrawerForecast:
+        """ Restore forecast state from storage. """
+
+        forecast = cls()
+        forecast.status = data['status']
+        forecast.cycle_start = data['cycle_start']
+        forecast.cycle_visits = data['cycle_visits']
+        forecast.full_at = data['full_at']
+        forecast.visits_per_fill = data['visits_per_fill']
+        forecast.visits_per_hour = data['visits_per_hour']
+        forecast.cycles = data['cycles']
+        forecast._forecast(dt_util.utcnow())
+        return forecast
+
+
+class LitterConsumption:
+    """ Estimate litter consumption and when the litter storage will run out.
+
+    Drops in tray weight after cleaning are counted as litter consumed and
+    rises as litter drawn from the storage compartment. Running totals are
+    sampled hourly into a fixed-size buffer, and rates are taken across the
+    buffer. The storage capacity is learned as the litter drawn between the
+    storage being refilled (top_litter_status back to 2) and it reporting
+    refill needed (0).
+    """
+
+    def __init__(self) -> None:
+        self.bottom: float | None = None
+        self.status: int | None = None
+        self.consumed: float = 0.0
+        self.drawn: float = 0.0
+        self.visits: int = 0
+        self.samples: deque[tuple[float, float, int]] = deque(maxlen=LITTER_BUFFER_SIZE)
+        self.refilled_drawn: float | None = None
+        self.capacity: float | None = None
+        self.empty: bool = False
+        self.daily_rate: float | None = None
+        self.per_visit: float | None = None
+        self.days_until_empty: float | None = None
+        self.tray_days: float | None = None
+
+    def update(self, box: LitterBox, new_visits: int, now: datetime) -> None:
+        """ Add the latest tray weight and storage status of a litter box. """
+
+        bottom = box.litter_bottom_amount_pnds
+        if self.bottom is not None:
+            change = bottom - self.bottom
+            if change <= -LITTER_NOISE_PNDS:
+                self.consumed -= change
+            elif change >= LITTER_NOISE_PNDS:
+                self.drawn += change
+        if self.bottom is None or abs(bottom - self.bottom) >= LITTER_NOISE_PNDS:
+            self.bottom = bottom
+        self.visits += new_visits
+
+        status = box.top_litter_status
+        if self.status in (0, 1) and status == 2:
+            self.refilled_drawn = self.drawn
+            self.empty = False
+        elif status == 0 and not self.empty:
+            self.empty = True
+            if self.refilled_drawn is not None and self.drawn > self.refilled_drawn:
+                self.capacity = _ewma(self.capacity, self.drawn - self.refilled_drawn)
+        self.status = status
+
+        now_ts = now.timestamp()
+        if not self.samples or now_ts - self.samples[-1][0] >= LITTER_SAMPLE_INTERVAL:
+            self.samples.append((now_ts, self.consumed, self.visits))
+        self._forecast(box.min_bottom_weight_pnds)
+
+    def _forecast(self, min_bottom_weight: float) -> None:
+        """ Compute consumption rates and days until litter runs out. """
+
+        self.daily_rate = self.per_visit = self.days_until_empty = self.tray_days = None
+        if len(self.samples) < 2:
+            return
+        first_ts, first_consumed, first_visits = self.samples[0]
+        last_ts, last_consumed, last_visits = self.samples[-1]
+        if last_ts - first_ts < LITTER_MIN_SPAN:
+            return
+        consumed = last_consumed - first_consumed
+        self.daily_rate = consumed / ((last_ts - first_ts) / 86400)
+        if last_visits > first_visits:
+            self.per_visit = consumed / (last_visits - first_visits)
+        if not self.daily_rate:
+            return
+        if self.bottom is not None:
+            self.tray_days = max(self.bottom - min_bottom_weight, 0.0) / self.daily_rate
+        if self.empty:
+            self.days_until_empty = 0.0
+        elif self.capacity is not None and self.refilled_drawn is not None:
+            remaining = max(self.capacity - (self.drawn - self.refilled_drawn), 0.0)
+            self.days_until_empty = remaining / self.daily_rate
+
+    def as_dict(self) -> dict[str, Any]:
+        """ Return consumption state for storage. """
+
+        return {
+            'bottom': self.bottom,
+            'status': self.status,
+            'consumed': self.consumed,
+            'drawn': self.drawn,
+            'visits': self.visits,
+            'samples': [list(sample) for sample in self.samples],
+            'refilled_drawn': self.refilled_drawn,
+            'capacity': self.capacity,
+            'empty': self.empty,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> LitterConsumption:
+        """ Restore consumption state from storage. """
+
+        consumption = cls()
+        consumption.bottom = data['bottom']
+        consumption.status = data['status']
+        consumption.consumed = data['consumed']
+        consumption.drawn = data['drawn']
+        consumption.visits = data['visits']
+        consumption.samples.extend(
+            (timestamp, consumed, visits) for timestamp, consumed, visits in data['samples']
+        )
+        consumption.refilled_drawn = data['refilled_drawn']
+        consumption.capacity = data['capacity']
+        consumption.empty = data['empty']
+        return consumption
+
+
+class BatteryModel:
+    """ Estimate how fast a battery drains and when it will be empty.
+
+    A least-squares line is fitted to the battery level against time, kept
+    as running sums so each sample is added in constant time. Fitting over
+    the whole battery life smooths out the few percent of reporting noise.
+    Samples are taken when the device reports (last_seen advances), at most
+    hourly. A sudden rise in level is taken as a battery replacement, which
+    restarts the fit.
+    """
+
+    def __init__(self) -> None:
+        self.start: float | None = None
+        self.last_seen: float | None = None
+        self.level: float | None = None
+        self.sums: list[float] = [0.0] * 5
+        self.replacements: int = 0
+        self.replaced_at: float | None = None
+
+    def update(self, level: int | None, last_seen: datetime) -> None:
+        """ Add the battery level reported at last_seen. """
+
+        if level is None:
+            return
+        last_seen_ts = last_seen.timestamp()
+        if self.last_seen is not None and last_seen_ts - self.last_seen < BATTERY_SAMPLE_INTERVAL:
+            return
+        if self.level is not None and level - self.level >= BATTERY_REPLACEMENT_JUMP:
+            self.replacements += 1
+            self.replaced_at = last_seen_ts
+            self.start = None
+        if self.start is None:
+            self.start = last_seen_ts
+            self.sums = [0.0] * 5
+        days = (last_seen_ts - self.start) / 86400
+        for index, value in enumerate((1, days, level, days * days, days * level)):
+            self.sums[index] += value
+        self.last_seen = last_seen_ts
+        self.level = level
+
+    def _fit(self) -> tuple[float, float] | None:
+        """ Return the intercept and slope of the fitted line, in percent and percent per day. """
+
+        count, sum_t, sum_y, sum_tt, sum_ty = self.sums
+        if count < BATTERY_MIN_SAMPLES or self.last_seen is None or self.start is None:
+            return None
+        if (self.last_seen - self.start) / 86400 < BATTERY_MIN_SPAN:
+            return None
+        denominator = count * sum_tt - sum_t * sum_t
+        if denominator <= 0:
+            return None
+        slope = (count * sum_ty - sum_t * sum_y) / denominator
+        return (sum_y - slope * sum_t) / count, slope
+
+    @property
+    def drain_rate(self) -> float | None:
+        """ Return the battery drain in percent per day. """
+
+        if (fit := self._fit()) is None:
+            return None
+        return max(-fit[1], 0.0)
+
+    def days_remaining(self, now: datetime) -> float | None:
+        """ Return days until the fitted line reaches 0 percent. """
+
+        if (fit := self._fit()) is None or fit[1] >= 0:
+            return None
+        intercept, slope = fit
+        days = (now.timestamp() - self.start) / 86400
+        return max(-(intercept + slope * days) / slope, 0.0)
+
+    def as_dict(self) -> dict[str, Any]:
+        """ Return battery model state for storage. """
+
+        return {
+            'start': self.start,
+            'last_seen': self.last_seen,
+            'level': self.level,
+            'sums': self.sums,
+            'replacements': self.replacements,
+            'replaced_at': self.replaced_at,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> BatteryModel:
+        """ Restore battery model state from storage. """
+
+        model = cls()
+        model.start = data['start']
+        model.last_seen = data['last_seen']
+        model.level = data['level']
+        model.sums = [float(value) for value in data['sums']]
+        model.replacements = data['replacements']
+        model.replaced_at = data['replaced_at']
+        return model
+
+
+class UploadCadence:
+    """ Learn the period and phase of a device's uploads to the cloud.
+
+    The period is the median of the recent gaps between last_seen values,
+    which ignores an occasional missed or extra upload. It is only trusted
+    when the gaps are regular, measured as their median absolute deviation
+    relative to the period. The phase is anchored on the latest upload.
+    """
+
+    def __init__(self) -> None:
+        self.last_seen: float | None = None
+        self.gaps: deque[float] = deque(maxlen=CADENCE_WINDOW)
+        self.period: float | None = None
+        self.spread: float | None = None
+
+    def update(self, last_seen: datetime) -> None:
+        """ Add the latest last_seen value of a device. """
+
+        last_seen_ts = last_seen.timestamp()
+        if self.last_seen is not None and last_seen_ts > self.last_seen:
+            self.gaps.append(last_seen_ts - self.last_seen)
+            self._learn()
+        if self.last_seen is None or last_seen_ts > self.last_seen:
+            self.last_seen = last_seen_ts
+
+    def _learn(self) -> None:
+        """ Compute the upload period and how regular the uploads are. """
+
+        if len(self.gaps) < CADENCE_MIN_GAPS:
+            self.period = self.spread = None
+            return
+        self.period = median(self.gaps)
+        self.spread = median(abs(gap - self.period) for gap in self.gaps) / self.period
+
+    @property
+    def regular(self) -> bool:
+        """ Return True if the device uploads on a predictable schedule. """
+
+        return self.spread is not None and self.spread <= CADENCE_MAX_SPREAD
+
+    @property
+    def expected_gap(self) -> float | None:
+        """ Return the usual gap between uploads, in seconds.
+
+        Devices without a regular cadence use the 90th percentile of their
+        recent gaps instead of the period.
+        """
+
+        if self.regular:
+            return self.period
+        if len(self.gaps) < CADENCE_MIN_GAPS:
+            return None
+        gaps = sorted(self.gaps)
+        return gaps[int(0.9 * (len(gaps) - 1))]
+
+    def next_upload(self, after: datetime) -> datetime | None:
+        """ Return the first expected upload after a given time. """
+
+        if not self.regular or self.last_seen is None:
+            return None
+        periods = max((after.timestamp() - self.last_seen) // self.period + 1, 1)
+        return dt_util.utc_from_timestamp(self.last_seen + periods * self.period)
+
+    def as_dict(self) -> dict[str, Any]:
+        """ Return cadence state for storage. """
+
+        return {'last_seen': self.last_seen, 'gaps': list(self.gaps)}
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> UploadCadence:
+        """ Restore cadence state from storage. """
+
+        cadence = cls()
+        cadence.last_seen = data['last_seen']
+        cadence.gaps.extend(float(gap) for gap in data['gaps'])
+        cadence._learn()
+        return cadence
+
+
+class ConnectivityHealth:
+    """ Track whether a device is reporting to the cloud, from its last_seen.
+
+    A device is offline once last_seen has not advanced for several expected
+    gaps. Time spent online and offline and the number of outages are kept
+    in daily buckets, so the uptime ratio covers a rolling week.
+    """
+
+    def __init__(self) -> None:
+        self.online: bool | None = None
+        self.checked: float | None = None
+        self.expected_gap: float = CONNECTIVITY_DEFAULT_GAP
+        # [day ordinal, seconds online, seconds offline, outages]
+        self.days: deque[list[float]] = deque(maxlen=CONNECTIVITY_WINDOW_DAYS)
+        self.outages: int = 0
+        self.outage_start: float | None = None
+        self.last_outage: float | None = None
+
+    def update(
+        self, last_seen: datetime, expected_gap: float | None, now: datetime, today: date
+    ) -> None:
+        """ Check whether a device is online and account for the time since the last check. """
+
+        last_seen_ts = last_seen.timestamp()
+        now_ts = now.timestamp()
+        self.expected_gap = expected_gap or CONNECTIVITY_DEFAULT_GAP
+        threshold = max(self.expected_gap * CONNECTIVITY_GAP_FACTOR, CONNECTIVITY_MIN_SILENCE)
+        online = now_ts - last_seen_ts <= threshold
+
+        if not self.days or self.days[-1][0] != today.toordinal():
+            self.days.append([today.toordinal(), 0.0, 0.0, 0])
+        bucket = self.days[-1]
+        if self.online is not None and self.checked is not None:
+            bucket[1 if self.online else 2] += max(now_ts - self.checked, 0.0)
+        if self.online and not online:
+            self.outages += 1
+            bucket[3] += 1
+            self.outage_start = last_seen_ts
+        elif self.online is False and online:
+            if self.outage_start is not None:
+                self.last_outage = last_seen_ts - self.outage_start
+            self.outage_start = None
+        self.online = online
+        self.checked = now_ts
+
+    @property
+    def uptime_ratio(self) -> float | None:
+        """ Return the share of the last week the device was online. """
+
+        online = sum(bucket[1] for bucket in self.days)
+        total = online + sum(bucket[2] for bucket in self.days)
+        if not total:
+            return None
+        return online / total
+
+    @property
+    def recent_outages(self) -> int:
+        """ Return the number of outages in the last week. """
+
+        return int(sum(bucket[3] for bucket in self.days))
+
+    def as_dict(self) -> dict[str, Any]:
+        """ Return connectivity state for storage. """
+
+        return {
+            'online': self.online,
+            'checked': self.checked,
+            'expected_gap': self.expected_gap,
+            'days': list(self.days),
+            'outages': self.outages,
+            'outage_start': self.outage_start,
+            'last_outage': self.last_outage,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> ConnectivityHealth:
+        """ Restore connectivity state from storage. """
+
+        health = cls()
+        health.online = data['online']
+        health.checked = data['checked']
+        health.expected_gap = data['expected_gap']
+        health.days.extend(list(bucket) for bucket in data['days'])
+        health.outages = data['outages']
+        health.outage_start = data['outage_start']
+        health.last_outage = data['last_outage']
+        return health
+
+
+class FleetAggregates:
+    """ Account-wide totals, kept up to date from the devices refreshed in each cycle.
+
+    The contribution of every device is remembered, and saved with the other
+    statistics, so a refresh only subtracts the old and adds the new
+    contribution of the devices it touched instead of summing over the whole
+    fleet, and totals are known right after a restart.
+    """
+
+    METRICS = ('visits_today', 'waste_full', 'refill_needed', 'firmware_pending', 'offline')
+
+    def __init__(self) -> None:
+        self.totals: dict[str, int] = dict.fromkeys(self.METRICS, 0)
+        self.contributions: dict[str, dict[int, dict[str, int]]] = {}
+
+    def set(self, resource: str, device_id: int, contribution: dict[str, int]) -> None:
+        """ Replace the contribution of a device. """
+
+        devices = self.contributions.setdefault(resource, {})
+        old = devices.get(device_id, {})
+        for metric in self.METRICS:
+            self.totals[metric] += contribution.get(metric, 0) - old.get(metric, 0)
+        devices[device_id] = contribution
+
+    def prune(self, resource: str, device_ids: Collection[int]) -> None:
+        """ Drop the contributions of devices that left the account. """
+
+        devices = self.contributions.get(resource, {})
+        # Refreshed devices are set first, so a device can only have left if more are tracked
+        if len(devices) <= len(device_ids):
+            return
+        for device_id in devices.keys() - device_ids:
+            for metric, value in devices.pop(device_id).items():
+                self.totals[metric] -= value
+
+    def total(self, metric: str) -> int | None:
+        """ Return an account-wide total, or None before any device has been seen. """
+
+        if not self.contributions:
+            return None
+        return self.totals[metric]
+
+    def as_dict(self) -> dict[str, Any]:
+        """ Return device contributions for storage. """
+
+        return self.contributions
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> FleetAggregates:
+        """ Restore device contributions from storage and total them once. """
+
+        fleet = cls()
+        for resource, devices in data.items():
+            for device_id, contribution in devices.items():
+                fleet.set(resource, int(device_id), {
+                    metric: int(contribution[metric])
+                    for metric in cls.METRICS
+                    if metric in contribution
+                })
+        return fleet
+
+
+# Tracker classes saved to disk, keyed by their storage name
+TRACKERS: dict[str, type] = {
+    'cat_weight': WeightFilter,
+    'cat_usage': UsageBaseline,
+    'cat_activity': ActivityRollup,
+    'cat_lifetime': LifetimeCounter,
+    'box_visits': VisitCounter,
+    'box_lifetime': LifetimeCounter,
+    'box_cleaning': CleaningCycle,
+    'waste_drawer': DrawerForecast,
+    'litter': LitterConsumption,
+    'beacon_battery': BatteryModel,
+    'tag_battery': BatteryModel,
+    'litterbox_uploads': UploadCadence,
+    'scanner_uploads': UploadCadence,
+    'tag_uploads': UploadCadence,
+    'litterbox_connectivity': ConnectivityHealth,
+    'scanner_connectivity': ConnectivityHealth,
+    'tag_connectivity': ConnectivityHealth,
+}
+
+# Prefixes of the upload cadence and connectivity trackers, keyed by the
+# LavviebotData attribute they follow
+DEVICE_TRACKERS: dict[str, str] = {
+    'litterboxes': 'litterbox',
+    'lavvie_scanners': 'scanner',
+    'lavvie_tags': 'tag',
+}
+
+
+class LavviebotAnalytics:
+    """ Hold derived statistics for every device and cat on a PurrSong account. """
+
+    def __init__(self, hass: HomeAssistant, entry: ConfigEntry, history: EventHistory) -> None:
+        self.hass = hass
+        self.history = history
+        self.store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, f"{ANALYTICS_STORAGE_KEY}.{entry.entry_id}", private=True
+        )
+        self.trackers: dict[str, dict[int, Any]] = {kind: {} for kind in TRACKERS}
+        self.fleet = FleetAggregates()
+
+    def tracker(self, kind: str, item_id: int) -> Any:
+        """ Return the tracker of a kind for a device or cat, creating it if needed. """
+
+        if (tracker := self.trackers[kind].get(item_id)) is None:
+            tracker = self.trackers[kind][item_id] = TRACKERS[kind]()
+        return tracker
+
+    async def async_load(self) -> None:
+        """ Restore saved statistics. Unusable data is discarded. """
+
+        if (stored := await self.store.async_load()) is None:
+            return
+        for kind, tracker_class in TRACKERS.items():
+            for item_id, data in stored.get(kind, {}).items():
+                try:
+                    self.trackers[kind][int(item_id)] = tracker_class.from_dict(data)
+                except (KeyError, TypeError, ValueError):
+                    continue
+        try:
+            self.fleet = FleetAggregates.from_dict(stored.get('fleet', {}))
+        except (AttributeError, TypeError, ValueError):
+            self.fleet = FleetAggregates()
+
+    def _as_dict(self) -> dict[str, Any]:
+        """ Return all statistics for storage. """
+
+        return {
+            **{
+                kind: {item_id: tracker.as_dict() for item_id, tracker in trackers.items()}
+                for kind, trackers in self.trackers.items()
+            },
+            'fleet': self.fleet.as_dict(),
+        }
+
+    def next_uploads(self, data: LavviebotData, after: datetime) -> list[datetime]:
+        """ Return the next expected upload of every device with a regular cadence. """
+
+        uploads = (
+            self.tracker(f'{prefix}_uploads', device_id).next_upload(after)
+            for resource, prefix in DEVICE_TRACKERS.items()
+            for device_id in getattr(data, resource)
+        )
+        return [upload for upload in uploads if upload is not None]
+
+    def process(self, data: LavviebotData, updated: dict[str, set[int]], now: datetime) -> None:
+        """ Update statistics from the devices and cats refreshed in this cycle. """
+
+        local_now = dt_util.as_local(now)
+        today = local_now.date()
+        for cat_id in updated['cats']:
+            cat = data.cats[cat_id]
+            self.tracker('cat_weight', cat_id).update(cat.cat_weight_pnds, today)
+            self.tracker('cat_usage', cat_id).update(cat.poop_count, cat.duration, now)
+            if cat.has_lavvietag:
+                self.tracker('cat_activity', cat_id).update(cat, local_now)
+            self.tracker('cat_lifetime', cat_id).add_daily(cat.poop_count, cat.duration or 0)
+
+        for device_id in updated['litterboxes']:
+            box: LitterBox = data.litterboxes[device_id]
+            new_visits = self.tracker('box_visits', device_id).update(
+                box.times_used_today, box.last_used
+            )
+            self.tracker('waste_drawer', device_id).update(box.waste_drawer_status, new_visits, now)
+            if new_visits:
+                self.history.add_visit(box, data, new_visits)
+                # Only the latest visit's duration is reported, so it stands in
+                # for any other visits since the previous refresh
+                lifetime = self.tracker('box_lifetime', device_id)
+                lifetime.add('visits', new_visits)
+                lifetime.add('duration', new_visits * (box.last_used_duration or 0))
+            delay = self.tracker('box_cleaning', device_id).update(box, new_visits, now)
+            if delay is not None:
+                self.tracker('box_lifetime', device_id).add('cleanings', 1)
+                self.history.add_cleaning(box, delay, now)
+                self.hass.bus.async_fire(EVENT_CLEANING_CYCLE, {
+                    'device_id': device_id,
+                    'device_name': box.device_name,
+                    'delay': round(delay),
+                    'wait_time': box.wait_time,
+                })
+            self.tracker('litter', device_id).update(box, new_visits, now)
+            # A beacon battery of 0 means no LavvieBeacon is attached
+            if box.beacon_battery:
+                self.tracker('beacon_battery', device_id).update(box.beacon_battery, box.last_seen)
+
+        for device_id in updated['lavvie_tags']:
+            tag = data.lavvie_tags[device_id]
+            self.tracker('tag_battery', device_id).update(tag.battery, tag.last_seen)
+
+        for resource, prefix in DEVICE_TRACKERS.items():
+            for device_id in updated[resource]:
+                device = getattr(data, resource)[device_id]
+                cadence = self.tracker(f'{prefix}_uploads', device_id)
+                cadence.update(device.last_seen)
+                connectivity = self.tracker(f'{prefix}_connectivity', device_id)
+                connectivity.update(device.last_seen, cadence.expected_gap, now, today)
+                contribution = {
+                    'firmware_pending': int(device.latest_firmware != device.current_firmware),
+                    'offline': int(connectivity.online is False),
+                }
+                if resource == 'litterboxes':
+                    contribution.update({
+                        'visits_today': device.times_used_today,
+                        'waste_full': int(device.waste_drawer_status == 0),
+                        'refill_needed': int(device.top_litter_status == 0),
+                    })
+                self.fleet.set(resource, device_id, contribution)
+            self.fleet.prune(resource, getattr(data, resource).keys())
+
+        self.store.async_delay_save(self._as_dict, ANALYTICS_SAVE_DELAY)
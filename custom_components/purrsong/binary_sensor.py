@@ -1,16 +1,23 @@
 """ Binary Sensor platform for PurrSong integration."""
 from __future__ import annotations
 
-from lavviebot.model import Cat, LavvieScanner, LitterBox
+from typing import Any
+
+from lavviebot.model import Cat, LavvieScanner, LavvieTag, LitterBox
 
 from homeassistant.components.binary_sensor import BinarySensorEntity, BinarySensorDeviceClass
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.const import Platform
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
+import homeassistant.util.dt as dt_util
 
-from .const import DOMAIN
+from .analytics import ConnectivityHealth, UsageBaseline
+from .const import ANOMALY_SCORE_THRESHOLD, DOMAIN
 from .coordinator import LavviebotDataUpdateCoordinator
+from .util import Debouncer
 
 async def async_setup_entry(
     hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback
@@ -20,17 +27,28 @@ async def async_setup_entry(
     coordinator: LavviebotDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
 
     binary_sensors = []
+    for cat_id, cat_data in coordinator.data.cats.items():
+        binary_sensors.append(UsageAnomaly(coordinator, cat_id))
+
     for device_id, device_data in coordinator.data.litterboxes.items():
         binary_sensors.extend((
             StorageRefill(coordinator, device_id),
-            WasteFull(coordinator, device_id)
+            WasteFull(coordinator, device_id),
+            Connectivity(coordinator, device_id),
         ))
 
     # LavvieScanner
     for device_id, device_data in coordinator.data.lavvie_scanners.items():
-        binary_sensors.append(ScannerWiFiStatus(coordinator, device_id))
+        binary_sensors.extend((
+            ScannerWiFiStatus(coordinator, device_id),
+            ScannerConnectivity(coordinator, device_id),
+        ))
+
+    # LavvieTag
+    for device_id, device_data in coordinator.data.lavvie_tags.items():
+        binary_sensors.append(TagConnectivity(coordinator, device_id))
 
-    async_add_entities(binary_sensors)
+    async_add_entities(coordinator.async_filter_entities(Platform.BINARY_SENSOR, binary_sensors))
 
 
 class StorageRefill(CoordinatorEntity, BinarySensorEntity):
@@ -39,7 +57,7 @@ class StorageRefill(CoordinatorEntity, BinarySensorEntity):
     def __init__(self, coordinator, device_id):
         super().__init__(coordinator)
         self.device_id = device_id
-
+        self.debouncer = Debouncer(self.device_data.top_litter_status == 0)
 
     @property
     def device_data(self) -> LitterBox:
@@ -47,6 +65,12 @@ class StorageRefill(CoordinatorEntity, BinarySensorEntity):
 
         return self.coordinator.data.litterboxes[self.device_id]
 
+    @property
+    def available(self) -> bool:
+        """ Return True if litter box data is fresh """
+
+        return super().available and self.coordinator.is_fresh('litterboxes', self.device_id)
+
     @property
     def device_info(self) -> dict[str, Any]:
         """ Return device registry information for this entity. """
@@ -78,19 +102,43 @@ class StorageRefill(CoordinatorEntity, BinarySensorEntity):
         return True
 
     @property
-    def is_on(self) -> bool:
-        """ Return True if litter storage is empty """
+    def raw_state(self) -> bool | None:
+        """ Return True at refill needed and False once full, None in between """
 
         if self.device_data.top_litter_status == 0:
             return True
-        else:
+        if self.device_data.top_litter_status == 2:
             return False
+        return None
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """ Debounce the raw state before it is written. """
+
+        if self.device_id in self.coordinator.updated_ids['litterboxes']:
+            hold_time, confirmations = self.coordinator.debounce_settings('storage_refill')
+            self.debouncer.update(self.raw_state, dt_util.utcnow(), hold_time, confirmations)
+        super()._handle_coordinator_update()
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """ Return number of suppressed flaps """
+
+        return {
+            "suppressed_flaps": self.debouncer.suppressed,
+        }
+
+    @property
+    def is_on(self) -> bool:
+        """ Return True if litter storage is empty """
+
+        return self.debouncer.state
 
     @property
     def icon(self) -> str:
         """Set icon based on storage level"""
 
-        if self.device_data.top_litter_status == 0:
+        if self.is_on:
             return 'mdi:alert-octagram'
         else:
             return 'mdi:octagram-outline'
@@ -101,7 +149,7 @@ class WasteFull(CoordinatorEntity, BinarySensorEntity):
     def __init__(self, coordinator, device_id):
         super().__init__(coordinator)
         self.device_id = device_id
-
+        self.debouncer = Debouncer(self.device_data.waste_drawer_status == 0)
 
     @property
     def device_data(self) -> LitterBox:
@@ -109,6 +157,12 @@ class WasteFull(CoordinatorEntity, BinarySensorEntity):
 
         return self.coordinator.data.litterboxes[self.device_id]
 
+    @property
+    def available(self) -> bool:
+        """ Return True if litter box data is fresh """
+
+        return super().available and self.coordinator.is_fresh('litterboxes', self.device_id)
+
     @property
     def device_info(self) -> dict[str, Any]:
         """ Return device registry information for this entity. """
@@ -140,19 +194,43 @@ class WasteFull(CoordinatorEntity, BinarySensorEntity):
         return True
 
     @property
-    def is_on(self) -> bool:
-        """ Return True if waste bin is full """
+    def raw_state(self) -> bool | None:
+        """ Return True when full and False once emptied, None in between """
 
         if self.device_data.waste_drawer_status == 0:
             return True
-        else:
+        if self.device_data.waste_drawer_status == 2:
             return False
+        return None
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """ Debounce the raw state before it is written. """
+
+        if self.device_id in self.coordinator.updated_ids['litterboxes']:
+            hold_time, confirmations = self.coordinator.debounce_settings('waste_full')
+            self.debouncer.update(self.raw_state, dt_util.utcnow(), hold_time, confirmations)
+        super()._handle_coordinator_update()
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """ Return number of suppressed flaps """
+
+        return {
+            "suppressed_flaps": self.debouncer.suppressed,
+        }
+
+    @property
+    def is_on(self) -> bool:
+        """ Return True if waste bin is full """
+
+        return self.debouncer.state
 
     @property
     def icon(self) -> str:
         """Set icon based on waste level"""
 
-        if self.device_data.waste_drawer_status == 0:
+        if self.is_on:
             return 'mdi:alert-octagram'
         else:
             return 'mdi:octagram-outline'
@@ -164,7 +242,7 @@ class ScannerWiFiStatus(CoordinatorEntity, BinarySensorEntity):
     def __init__(self, coordinator, device_id):
         super().__init__(coordinator)
         self.device_id = device_id
-
+        self.debouncer = Debouncer(self.device_data.wifi_status == False)
 
     @property
     def device_data(self) -> LavvieScanner:
@@ -172,6 +250,12 @@ class ScannerWiFiStatus(CoordinatorEntity, BinarySensorEntity):
 
         return self.coordinator.data.lavvie_scanners[self.device_id]
 
+    @property
+    def available(self) -> bool:
+        """ Return True if LavvieScanner data is fresh """
+
+        return super().available and self.coordinator.is_fresh('lavvie_scanners', self.device_id)
+
     @property
     def device_info(self) -> dict[str, Any]:
         """ Return device registry information for this entity. """
@@ -209,17 +293,395 @@ class ScannerWiFiStatus(CoordinatorEntity, BinarySensorEntity):
         return BinarySensorDeviceClass.PROBLEM
 
     @property
-    def is_on(self) -> bool:
-        """Return True if wifi problem."""
+    def raw_state(self) -> bool | None:
+        """ Return True if the cloud reports a wifi problem """
 
         if self.device_data.wifi_status == False:
             return True
         else:
             return False
 
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """ Debounce the raw state before it is written. """
+
+        if self.device_id in self.coordinator.updated_ids['lavvie_scanners']:
+            hold_time, confirmations = self.coordinator.debounce_settings('wifi_status')
+            self.debouncer.update(self.raw_state, dt_util.utcnow(), hold_time, confirmations)
+        super()._handle_coordinator_update()
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """ Return number of suppressed flaps """
+
+        return {
+            "suppressed_flaps": self.debouncer.suppressed,
+        }
+
+    @property
+    def is_on(self) -> bool:
+        """Return True if wifi problem."""
+
+        return self.debouncer.state
+
 
     @property
     def icon(self) -> str:
         """Set icon based on storage level"""
 
         return 'mdi:wifi'
+
+
+class UsageAnomaly(CoordinatorEntity, BinarySensorEntity):
+    """ Representation of Cat's litter box usage anomaly """
+
+    def __init__(self, coordinator, cat_id):
+        super().__init__(coordinator)
+        self.cat_id = cat_id
+
+
+    @property
+    def cat_data(self) -> Cat:
+        """ Handle coordinator cat data """
+
+        return self.coordinator.data.cats[self.cat_id]
+
+    @property
+    def available(self) -> bool:
+        """ Return True if cat data is fresh """
+
+        return super().available and self.coordinator.is_fresh('cats', self.cat_id)
+
+    @property
+    def device_info(self) -> dict[str, Any]:
+        """ Return device registry information for this entity. """
+
+        return {
+            "identifiers": {(DOMAIN, self.cat_data.cat_id)},
+            "name": self.cat_data.cat_name,
+            "manufacturer": "PurrSong",
+            "model": "Cat",
+        }
+
+    @property
+    def unique_id(self) -> str:
+        """ Sets unique ID for this entity. """
+
+        return str(self.cat_data.cat_id) + '_usage_anomaly'
+
+    @property
+    def name(self) -> str:
+        """ Return name of the entity """
+
+        return "Litter box usage anomaly"
+
+    @property
+    def has_entity_name(self) -> bool:
+        """ Indicate that entity has name defined """
+
+        return True
+
+    @property
+    def usage_baseline(self) -> UsageBaseline:
+        """ Handle cat usage baseline """
+
+        return self.coordinator.analytics.tracker('cat_usage', self.cat_id)
+
+    @property
+    def is_on(self) -> bool:
+        """ Return True if today's usage deviates from the cat's baseline """
+
+        if self.usage_baseline.score >= ANOMALY_SCORE_THRESHOLD:
+            return True
+        else:
+            return False
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """ Return anomaly scores and expected visits so far today """
+
+        baseline = self.usage_baseline
+        return {
+            "score": round(baseline.score, 2),
+            "visits_score": round(baseline.scores['visits'], 2),
+            "duration_score": round(baseline.scores['duration'], 2),
+            "visits_today": baseline.today['visits'],
+            "expected_visits_so_far": None if baseline.expected_visits is None else round(baseline.expected_visits, 1),
+            "baseline_days": baseline.overall['visits'].count,
+        }
+
+    @property
+    def device_class(self) -> BinarySensorDeviceClass:
+        """ Return entity device class. """
+
+        return BinarySensorDeviceClass.PROBLEM
+
+    @property
+    def icon(self) -> str:
+        """Set icon"""
+
+        return 'mdi:chart-bell-curve'
+
+
+class Connectivity(CoordinatorEntity, BinarySensorEntity):
+    """ Representation of litter box cloud connectivity """
+
+    def __init__(self, coordinator, device_id):
+        super().__init__(coordinator)
+        self.device_id = device_id
+
+
+    @property
+    def device_data(self) -> LitterBox:
+        """ Handle coordinator litter box data """
+
+        return self.coordinator.data.litterboxes[self.device_id]
+
+    @property
+    def available(self) -> bool:
+        """ Return True if litter box data is fresh """
+
+        return super().available and self.coordinator.is_fresh('litterboxes', self.device_id)
+
+    @property
+    def device_info(self) -> dict[str, Any]:
+        """ Return device registry information for this entity. """
+
+        return {
+            "identifiers": {(DOMAIN, self.device_data.device_id), (DOMAIN, self.device_data.iot_code_tail)},
+            "name": self.device_data.device_name,
+            "manufacturer": "PurrSong",
+            "model": "Lavviebot S",
+            "sw_version": self.device_data.current_firmware
+        }
+
+    @property
+    def unique_id(self) -> str:
+        """ Sets unique ID for this entity. """
+
+        return str(self.device_data.device_id) + '_cloud_connectivity'
+
+    @property
+    def name(self) -> str:
+        """ Return name of the entity """
+
+        return "Cloud connectivity"
+
+    @property
+    def has_entity_name(self) -> bool:
+        """ Indicate that entity has name defined """
+
+        return True
+
+    @property
+    def connectivity(self) -> ConnectivityHealth:
+        """ Handle litter box connectivity health """
+
+        return self.coordinator.analytics.tracker('litterbox_connectivity', self.device_id)
+
+    @property
+    def is_on(self) -> bool | None:
+        """ Return True if the litter box is reporting to PurrSong servers """
+
+        return self.connectivity.online
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """ Return expected reporting gap, uptime and outages """
+
+        uptime = self.connectivity.uptime_ratio
+        return {
+            "expected_gap": round(self.connectivity.expected_gap),
+            "uptime_ratio": None if uptime is None else round(uptime, 4),
+            "outages_last_week": self.connectivity.recent_outages,
+            "outages": self.connectivity.outages,
+            "last_outage_duration": None if self.connectivity.last_outage is None else round(self.connectivity.last_outage),
+        }
+
+    @property
+    def device_class(self) -> BinarySensorDeviceClass:
+        """ Return entity device class """
+
+        return BinarySensorDeviceClass.CONNECTIVITY
+
+    @property
+    def entity_category(self) -> EntityCategory:
+        """ Set category to diagnostic. """
+
+        return EntityCategory.DIAGNOSTIC
+
+
+class ScannerConnectivity(CoordinatorEntity, BinarySensorEntity):
+    """ Representation of LavvieScanner cloud connectivity """
+
+    def __init__(self, coordinator, device_id):
+        super().__init__(coordinator)
+        self.device_id = device_id
+
+
+    @property
+    def device_data(self) -> LavvieScanner:
+        """ Handle coordinator LavvieScanner data """
+
+        return self.coordinator.data.lavvie_scanners[self.device_id]
+
+    @property
+    def available(self) -> bool:
+        """ Return True if LavvieScanner data is fresh """
+
+        return super().available and self.coordinator.is_fresh('lavvie_scanners', self.device_id)
+
+    @property
+    def device_info(self) -> dict[str, Any]:
+        """ Return device registry information for this entity. """
+
+        return {
+            "identifiers": {(DOMAIN, self.device_data.device_id), (DOMAIN, self.device_data.iot_code_tail)},
+            "name": self.device_data.device_name,
+            "manufacturer": "PurrSong",
+            "model": "LavvieScanner",
+            "sw_version": self.device_data.current_firmware
+        }
+
+    @property
+    def unique_id(self) -> str:
+        """ Sets unique ID for this entity. """
+
+        return str(self.device_data.device_id) + '_cloud_connectivity'
+
+    @property
+    def name(self) -> str:
+        """ Return name of the entity """
+
+        return "Cloud connectivity"
+
+    @property
+    def has_entity_name(self) -> bool:
+        """ Indicate that entity has name defined """
+
+        return True
+
+    @property
+    def connectivity(self) -> ConnectivityHealth:
+        """ Handle LavvieScanner connectivity health """
+
+        return self.coordinator.analytics.tracker('scanner_connectivity', self.device_id)
+
+    @property
+    def is_on(self) -> bool | None:
+        """ Return True if the LavvieScanner is reporting to PurrSong servers """
+
+        return self.connectivity.online
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """ Return expected reporting gap, uptime and outages """
+
+        uptime = self.connectivity.uptime_ratio
+        return {
+            "expected_gap": round(self.connectivity.expected_gap),
+            "uptime_ratio": None if uptime is None else round(uptime, 4),
+            "outages_last_week": self.connectivity.recent_outages,
+            "outages": self.connectivity.outages,
+            "last_outage_duration": None if self.connectivity.last_outage is None else round(self.connectivity.last_outage),
+        }
+
+    @property
+    def device_class(self) -> BinarySensorDeviceClass:
+        """ Return entity device class """
+
+        return BinarySensorDeviceClass.CONNECTIVITY
+
+    @property
+    def entity_category(self) -> EntityCategory:
+        """ Set category to diagnostic. """
+
+        return EntityCategory.DIAGNOSTIC
+
+
+class TagConnectivity(CoordinatorEntity, BinarySensorEntity):
+    """ Representation of LavvieTag cloud connectivity """
+
+    def __init__(self, coordinator, device_id):
+        super().__init__(coordinator)
+        self.device_id = device_id
+
+
+    @property
+    def device_data(self) -> LavvieTag:
+        """ Handle coordinator LavvieTag data """
+
+        return self.coordinator.data.lavvie_tags[self.device_id]
+
+    @property
+    def available(self) -> bool:
+        """ Return True if LavvieTag data is fresh """
+
+        return super().available and self.coordinator.is_fresh('lavvie_tags', self.device_id)
+
+    @property
+    def device_info(self) -> dict[str, Any]:
+        """ Return device registry information for this entity. """
+
+        return {
+            "identifiers": {(DOMAIN, self.device_data.device_id), (DOMAIN, self.device_data.iot_code_tail)},
+            "name": self.device_data.device_name,
+            "manufacturer": "PurrSong",
+            "model": "LavvieTag",
+            "sw_version": self.device_data.current_firmware
+        }
+
+    @property
+    def unique_id(self) -> str:
+        """ Sets unique ID for this entity. """
+
+        return str(self.device_data.device_id) + '_cloud_connectivity'
+
+    @property
+    def name(self) -> str:
+        """ Return name of the entity """
+
+        return "Cloud connectivity"
+
+    @property
+    def has_entity_name(self) -> bool:
+        """ Indicate that entity has name defined """
+
+        return True
+
+    @property
+    def connectivity(self) -> ConnectivityHealth:
+        """ Handle LavvieTag connectivity health """
+
+        return self.coordinator.analytics.tracker('tag_connectivity', self.device_id)
+
+    @property
+    def is_on(self) -> bool | None:
+        """ Return True if the LavvieTag is reporting to PurrSong servers """
+
+        return self.connectivity.online
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """ Return expected reporting gap, uptime and outages """
+
+        uptime = self.connectivity.uptime_ratio
+        return {
+            "expected_gap": round(self.connectivity.expected_gap),
+            "uptime_ratio": None if uptime is None else round(uptime, 4),
+            "outages_last_week": self.connectivity.recent_outages,
+            "outages": self.connectivity.outages,
+            "last_outage_duration": None if self.connectivity.last_outage is None else round(self.connectivity.last_outage),
+        }
+
+    @property
+    def device_class(self) -> BinarySensorDeviceClass:
+        """ Return entity device class """
+
+        return BinarySensorDeviceClass.CONNECTIVITY
+
+    @property
+    def entity_category(self) -> EntityCategory:
+        """ Set category to diagnostic. """
+
+        return EntityCategory.DIAGNOSTIC
@@ -0,0 +1,116 @@
+""" Calendar platform for PurrSong integration."""
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any
+
+from lavviebot.model import LitterBox
+
+from homeassistant.components.calendar import CalendarEntity, CalendarEvent
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import Platform
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+import homeassistant.util.dt as dt_util
+
+from .const import DOMAIN
+from .coordinator import LavviebotDataUpdateCoordinator
+from .history import HistoryEvent
+
+async def async_setup_entry(
+    hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback
+) -> None:
+    """ Set Up PurrSong Calendar Entities. """
+
+    coordinator: LavviebotDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+
+    calendars = []
+    # Litter Boxes
+    for device_id, device_data in coordinator.data.litterboxes.items():
+        calendars.append(LitterBoxCalendar(coordinator, device_id))
+
+    async_add_entities(coordinator.async_filter_entities(Platform.CALENDAR, calendars))
+
+
+def as_calendar_event(event: HistoryEvent) -> CalendarEvent:
+    """ Convert a history event to a calendar event. """
+
+    return CalendarEvent(
+        start=dt_util.utc_from_timestamp(event.start),
+        end=dt_util.utc_from_timestamp(event.end),
+        summary=event.summary,
+        description=event.description,
+    )
+
+
+class LitterBoxCalendar(CoordinatorEntity, CalendarEntity):
+    """ Representation of Lavviebot visits, cleaning cycles and errors """
+
+    def __init__(self, coordinator, device_id):
+        super().__init__(coordinator)
+        self.device_id = device_id
+
+
+    @property
+    def device_data(self) -> LitterBox:
+        """ Handle coordinator litter box data """
+
+        return self.coordinator.data.litterboxes[self.device_id]
+
+    @property
+    def available(self) -> bool:
+        """ Return True if litter box data is fresh """
+
+        return super().available and self.coordinator.is_fresh('litterboxes', self.device_id)
+
+    @property
+    def device_info(self) -> dict[str, Any]:
+        """ Return device registry information for this entity. """
+
+        return {
+            "identifiers": {(DOMAIN, self.device_data.device_id), (DOMAIN, self.device_data.iot_code_tail)},
+            "name": self.device_data.device_name,
+            "manufacturer": "PurrSong",
+            "model": "Lavviebot S",
+            "sw_version": self.device_data.current_firmware
+        }
+
+    @property
+    def unique_id(self) -> str:
+        """ Sets unique ID for this entity. """
+
+        return str(self.device_data.device_id) + '_activity_calendar'
+
+    @property
+    def name(self) -> str:
+        """ Return name of the entity """
+
+        return "Activity"
+
+    @property
+    def has_entity_name(self) -> bool:
+        """ Indicate that entity has name defined """
+
+        return True
+
+    @property
+    def event(self) -> CalendarEvent | None:
+        """ Return the visit, cleaning cycle or error in progress """
+
+        current = self.coordinator.history.index(self.device_id).current(
+            dt_util.utcnow().timestamp()
+        )
+        if current is None:
+            return None
+        return as_calendar_event(current)
+
+    async def async_get_events(
+        self, hass: HomeAssistant, start_date: datetime, end_date: datetime
+    ) -> list[CalendarEvent]:
+        """ Return events in a time range from the integration's event history """
+
+        return [
+            as_calendar_event(event)
+            for event in self.coordinator.history.query(self.device_id, start_date, end_date)
+        ]
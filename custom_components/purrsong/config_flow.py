@@ -8,11 +8,52 @@ from lavviebot.exceptions import LavviebotAuthError
 import voluptuous as vol
 
 from homeassistant import config_entries
-from homeassistant.const import CONF_EMAIL, CONF_PASSWORD
+from homeassistant.const import CONF_EMAIL, CONF_PASSWORD, CONF_SCAN_INTERVAL, CONF_TIMEOUT
+from homeassistant.core import callback
 from homeassistant.data_entry_flow import FlowResult
 import homeassistant.helpers.config_validation as cv
+from homeassistant.helpers.selector import TextSelector, TextSelectorConfig
 
-from .const import DEFAULT_NAME, DOMAIN
+from .const import (
+    CADENCE_MIN_INTERVAL,
+    CIRCUIT_MAX_OPEN_INTERVAL,
+    CIRCUIT_OPEN_INTERVAL,
+    CONF_CIRCUIT_MAX_OPEN_INTERVAL,
+    CONF_CIRCUIT_OPEN_INTERVAL,
+    CONF_CONFIRMATIONS,
+    CONF_DEADBAND,
+    CONF_HISTORY_RETENTION,
+    CONF_HOLD_TIME,
+    CONF_LATENCY_WINDOW,
+    CONF_MAX_POLL_INTERVAL,
+    CONF_MAX_SILENCE,
+    CONF_MIN_INTERVAL,
+    CONF_MIN_POLL_INTERVAL,
+    CONF_REFRESH_DEADLINE,
+    CONF_RETRY_BACKOFF_MAX,
+    CONF_RETRY_BACKOFF_MIN,
+    CONF_STALE_AFTER,
+    CONF_SUMMARY_ENTITIES,
+    CONF_SUMMARY_MODE,
+    CONF_TIMEOUT_MAX,
+    CONF_TIMEOUT_MIN,
+    DEADBAND_DEFAULTS,
+    DEBOUNCE_DEFAULTS,
+    DEFAULT_HISTORY_RETENTION,
+    DEFAULT_NAME,
+    DEFAULT_SCAN_INTERVAL,
+    DEFAULT_STALE_AFTER,
+    DOMAIN,
+    LATENCY_WINDOW,
+    MAX_POLL_INTERVAL,
+    REFRESH_DEADLINE,
+    RETRY_BACKOFF_MAX,
+    RETRY_BACKOFF_MIN,
+    SUMMARY_DEVICE_CLASSES,
+    TIMEOUT,
+    TIMEOUT_MAX,
+    TIMEOUT_MIN,
+)
 from .util import NoDevicesError, async_validate_api
 
 DATA_SCHEMA = vol.Schema(
@@ -22,6 +63,36 @@ DATA_SCHEMA = vol.Schema(
     }
 )
 
+# Options flow settings in seconds (days for history retention): the default
+# and the allowed range of each
+OPTIONS_SECONDS: dict[str, tuple[int, int, int]] = {
+    CONF_SCAN_INTERVAL: (DEFAULT_SCAN_INTERVAL, 30, 3600),
+    CONF_MIN_POLL_INTERVAL: (CADENCE_MIN_INTERVAL, 15, 3600),
+    CONF_MAX_POLL_INTERVAL: (MAX_POLL_INTERVAL, 30, 7200),
+    CONF_TIMEOUT: (TIMEOUT, 1, 120),
+    CONF_TIMEOUT_MIN: (TIMEOUT_MIN, 1, 120),
+    CONF_TIMEOUT_MAX: (TIMEOUT_MAX, 1, 120),
+    CONF_REFRESH_DEADLINE: (REFRESH_DEADLINE, 10, 600),
+    CONF_RETRY_BACKOFF_MIN: (RETRY_BACKOFF_MIN, 1, 3600),
+    CONF_RETRY_BACKOFF_MAX: (RETRY_BACKOFF_MAX, 1, 86400),
+    CONF_CIRCUIT_OPEN_INTERVAL: (CIRCUIT_OPEN_INTERVAL, 10, 3600),
+    CONF_CIRCUIT_MAX_OPEN_INTERVAL: (CIRCUIT_MAX_OPEN_INTERVAL, 10, 86400),
+    CONF_STALE_AFTER: (DEFAULT_STALE_AFTER, 0, 86400),
+    CONF_LATENCY_WINDOW: (LATENCY_WINDOW, 10, 1000),
+    CONF_HISTORY_RETENTION: (DEFAULT_HISTORY_RETENTION, 1, 3650),
+}
+
+# Settings that must not exceed another setting, with the field the error is shown on
+OPTIONS_ORDER: tuple[tuple[str, str, str], ...] = (
+    (CONF_MIN_POLL_INTERVAL, CONF_SCAN_INTERVAL, CONF_SCAN_INTERVAL),
+    (CONF_SCAN_INTERVAL, CONF_MAX_POLL_INTERVAL, CONF_MAX_POLL_INTERVAL),
+    (CONF_TIMEOUT_MIN, CONF_TIMEOUT, CONF_TIMEOUT),
+    (CONF_TIMEOUT, CONF_TIMEOUT_MAX, CONF_TIMEOUT_MAX),
+    (CONF_TIMEOUT_MAX, CONF_REFRESH_DEADLINE, CONF_REFRESH_DEADLINE),
+    (CONF_RETRY_BACKOFF_MIN, CONF_RETRY_BACKOFF_MAX, CONF_RETRY_BACKOFF_MAX),
+    (CONF_CIRCUIT_OPEN_INTERVAL, CONF_CIRCUIT_MAX_OPEN_INTERVAL, CONF_CIRCUIT_MAX_OPEN_INTERVAL),
+)
+
 class LavviebotConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """ Handle a config flow for Purrsong integration """
 
@@ -29,6 +100,15 @@ class LavviebotConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
     entry: config_entries.ConfigEntry | None
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(
+        config_entry: config_entries.ConfigEntry,
+    ) -> LavviebotOptionsFlow:
+        """ Get the options flow for this handler. """
+
+        return LavviebotOptionsFlow()
+
     async def async_step_reauth(self, entry_data: Mapping[str, Any]) -> FlowResult:
         """ Handle re-authentication with Purrsong. """
 
@@ -108,3 +188,74 @@ class LavviebotConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             data_schema=DATA_SCHEMA,
             errors=errors,
         )
+
+
+class LavviebotOptionsFlow(config_entries.OptionsFlow):
+    """ Handle PurrSong options for polling, timeouts, caching and filtering """
+
+    def _options_schema(self, values: Mapping[str, Any]) -> vol.Schema:
+        """ Return the options form, filled in with the given values. """
+
+        fields: dict[Any, Any] = {}
+        for key, (default, minimum, maximum) in OPTIONS_SECONDS.items():
+            fields[vol.Optional(key, default=values.get(key, default))] = vol.All(
+                vol.Coerce(int), vol.Range(min=minimum, max=maximum)
+            )
+        for sensor, (hold_time, confirmations) in DEBOUNCE_DEFAULTS.items():
+            key = f'{sensor}_{CONF_HOLD_TIME}'
+            fields[vol.Optional(key, default=values.get(key, hold_time))] = vol.All(
+                vol.Coerce(int), vol.Range(min=0, max=86400)
+            )
+            key = f'{sensor}_{CONF_CONFIRMATIONS}'
+            fields[vol.Optional(key, default=values.get(key, confirmations))] = vol.All(
+                vol.Coerce(int), vol.Range(min=1, max=20)
+            )
+        for sensor, (deadband, min_interval, max_silence) in DEADBAND_DEFAULTS.items():
+            key = f'{sensor}_{CONF_DEADBAND}'
+            fields[vol.Optional(key, default=values.get(key, deadband))] = vol.All(
+                vol.Coerce(float), vol.Range(min=0)
+            )
+            key = f'{sensor}_{CONF_MIN_INTERVAL}'
+            fields[vol.Optional(key, default=values.get(key, min_interval))] = vol.All(
+                vol.Coerce(int), vol.Range(min=0, max=86400)
+            )
+            key = f'{sensor}_{CONF_MAX_SILENCE}'
+            fields[vol.Optional(key, default=values.get(key, max_silence))] = vol.All(
+                vol.Coerce(int), vol.Range(min=60, max=86400)
+            )
+        fields[vol.Optional(CONF_SUMMARY_MODE, default=values.get(CONF_SUMMARY_MODE, False))] = bool
+        for device_class in SUMMARY_DEVICE_CLASSES:
+            key = f'{device_class}_{CONF_SUMMARY_ENTITIES}'
+            fields[vol.Optional(key, default=values.get(key, []))] = TextSelector(
+                TextSelectorConfig(multiple=True)
+            )
+        return vol.Schema(fields)
+
+    async def async_step_init(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """ Manage the PurrSong options. """
+
+        errors: dict[str, str] = {}
+        values: Mapping[str, Any] = self.config_entry.options
+
+        if user_input is not None:
+            for lower, upper, field in OPTIONS_ORDER:
+                if user_input[lower] > user_input[upper]:
+                    errors[field] = f'{lower}_above_{upper}'
+            for sensor in DEADBAND_DEFAULTS:
+                max_silence = f'{sensor}_{CONF_MAX_SILENCE}'
+                if user_input[f'{sensor}_{CONF_MIN_INTERVAL}'] > user_input[max_silence]:
+                    errors[max_silence] = 'min_interval_above_max_silence'
+            if not errors:
+                # Keep options that aren't on the form
+                return self.async_create_entry(
+                    title="", data={**self.config_entry.options, **user_input}
+                )
+            values = user_input
+
+        return self.async_show_form(
+            step_id="init",
+            data_schema=self._options_schema(values),
+            errors=errors,
+        )
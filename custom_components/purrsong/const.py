@@ -4,6 +4,7 @@ import asyncio
 import logging
 
 from aiohttp.client_exceptions import ClientConnectionError
+from lavviebot.constants import TIME_ZONE
 from lavviebot.exceptions import LavviebotAuthError, LavviebotError
 
 from homeassistant.const import Platform
@@ -14,12 +15,213 @@ DEFAULT_SCAN_INTERVAL = 90
 DOMAIN = "purrsong"
 PLATFORMS = [
     Platform.BINARY_SENSOR,
+    Platform.CALENDAR,
     Platform.SENSOR,
     Platform.UPDATE,
 ]
 
 DEFAULT_NAME = "PurrSong"
+# Initial per-request timeout in seconds, adapted to observed latency once
+# enough requests have been made
 TIMEOUT = 8
+TIMEOUT_MIN = 3
+TIMEOUT_MAX = 20
+# Per-request timeout is this multiple of the observed latency percentile
+TIMEOUT_LATENCY_MULTIPLIER = 3
+LATENCY_PERCENTILE = 0.95
+LATENCY_WINDOW = 100
+LATENCY_MIN_SAMPLES = 10
+
+# Seconds a whole refresh, including retries, may take before it is cancelled
+REFRESH_DEADLINE = 60
+# Seconds between checks for refreshes running past the deadline
+WATCHDOG_INTERVAL = 15
+
+# purrsong.refresh service. Calls made while a refresh is running, or within
+# this many seconds of the last one, share its result instead of polling again
+SERVICE_REFRESH = "refresh"
+ATTR_CONFIG_ENTRY_ID = "config_entry_id"
+MANUAL_REFRESH_SPACING = 30
+# Requests sent to the PurrSong API at the same time during a refresh
+MAX_CONCURRENT_REQUESTS = 4
+# New sessions to start per refresh when the API rate limits the current one
+RATE_LIMIT_RETRIES = 1
+
+STORAGE_VERSION = 1
+SNAPSHOT_STORAGE_KEY = f"{DOMAIN}.snapshot"
+# Seconds to wait before writing the latest snapshot to disk
+SNAPSHOT_SAVE_DELAY = 10
+ANALYTICS_STORAGE_KEY = f"{DOMAIN}.analytics"
+# Seconds to wait before writing derived statistics to disk
+ANALYTICS_SAVE_DELAY = 60
+HISTORY_STORAGE_KEY = f"{DOMAIN}.history"
+# Seconds to wait before writing the event history to disk
+HISTORY_SAVE_DELAY = 60
+# Days that visits, cleanings and errors are kept in the event history
+CONF_HISTORY_RETENTION = "history_retention"
+DEFAULT_HISTORY_RETENTION = 365
+# Seconds shown for events without a known duration
+EVENT_MIN_DURATION = 60
+# Seconds between samples of each metric kept in the history
+METRIC_SAMPLE_INTERVAL = 3600
+# Litter box and cat attributes sampled into the metric history
+HISTORY_METRICS = {
+    'litterboxes': {
+        'humidity': 'humidity',
+        'temperature': 'temperature_c',
+        'litter_bottom_amount': 'litter_bottom_amount_pnds',
+    },
+    'cats': {
+        'weight': 'cat_weight_pnds',
+        'visits': 'poop_count',
+        'duration': 'duration',
+    },
+}
+# Rows returned per history page (default and maximum), rows per streamed
+# message and the shortest aggregation bucket in seconds
+HISTORY_PAGE_SIZE = 500
+HISTORY_MAX_PAGE_SIZE = 5000
+HISTORY_CHUNK_SIZE = 100
+HISTORY_MIN_BUCKET = 60
+
+# Seconds the last good data may be served while the cloud is failing
+CONF_STALE_AFTER = "stale_after"
+DEFAULT_STALE_AFTER = 900
+# Retry intervals, in seconds, used after a failed refresh
+RETRY_BACKOFF_MIN = 15
+RETRY_BACKOFF_MAX = 600
+
+# Binary sensor debounce: a change is accepted once it is seen in this many
+# refreshes in a row and the previous state has been held for the hold time
+# (seconds). Options are stored as "<sensor>_hold_time" and
+# "<sensor>_confirmations"
+CONF_HOLD_TIME = "hold_time"
+CONF_CONFIRMATIONS = "confirmations"
+DEBOUNCE_DEFAULTS: dict[str, tuple[int, int]] = {
+    'wifi_status': (300, 2),
+    'storage_refill': (600, 2),
+    'waste_full': (600, 2),
+}
+
+# Sensor deadband reporting: a new value is reported once it moves by the
+# deadband and the minimum interval (seconds) has passed since the last
+# report, or once the maximum silence (seconds) has passed. Options are
+# stored as "<sensor>_deadband", "<sensor>_min_interval" and
+# "<sensor>_max_silence"
+CONF_DEADBAND = "deadband"
+CONF_MIN_INTERVAL = "min_interval"
+CONF_MAX_SILENCE = "max_silence"
+DEADBAND_DEFAULTS: dict[str, tuple[float, int, int]] = {
+    'humidity': (2, 300, 3600),
+    'temperature': (1, 300, 3600),
+    'litter_bottom_amount': (0.2, 0, 3600),
+    'cat_weight': (0.2, 0, 3600),
+}
+
+# Summary mode: each litter box, scanner, tag and cat gets one summary sensor
+# in place of its full entity set. Entities to keep anyway are listed per
+# device class in "<device class>_summary_entities" by their unique ID
+# without the device or cat ID, e.g. "humidity" or "waste_status"
+CONF_SUMMARY_MODE = "summary_mode"
+CONF_SUMMARY_ENTITIES = "summary_entities"
+SUMMARY_DEVICE_CLASSES = ('litterbox', 'scanner', 'tag', 'cat')
+
+# Options flow settings for polling, timeouts, backoff and caching, applied
+# to the running coordinator when changed. The scan interval and initial
+# timeout use the Home Assistant CONF_SCAN_INTERVAL and CONF_TIMEOUT keys.
+# The minimum poll interval defaults to CADENCE_MIN_INTERVAL and the others
+# to the constant of the same name
+CONF_MIN_POLL_INTERVAL = "min_poll_interval"
+CONF_MAX_POLL_INTERVAL = "max_poll_interval"
+MAX_POLL_INTERVAL = 2 * DEFAULT_SCAN_INTERVAL
+CONF_TIMEOUT_MIN = "timeout_min"
+CONF_TIMEOUT_MAX = "timeout_max"
+CONF_REFRESH_DEADLINE = "refresh_deadline"
+CONF_RETRY_BACKOFF_MIN = "retry_backoff_min"
+CONF_RETRY_BACKOFF_MAX = "retry_backoff_max"
+CONF_CIRCUIT_OPEN_INTERVAL = "circuit_open_interval"
+CONF_CIRCUIT_MAX_OPEN_INTERVAL = "circuit_max_open_interval"
+CONF_LATENCY_WINDOW = "latency_window"
+
+# Consecutive failed refreshes before the circuit breaker opens
+CIRCUIT_FAILURE_THRESHOLD = 3
+# Seconds between probes while the circuit breaker is open
+CIRCUIT_OPEN_INTERVAL = 60
+CIRCUIT_MAX_OPEN_INTERVAL = 1800
+ISSUE_CLOUD_UNREACHABLE = "cloud_unreachable"
+
+# Cat weight filter
+WEIGHT_MEDIAN_WINDOW = 5
+WEIGHT_EWMA_ALPHA = 0.3
+# Readings further than this many standard deviations, and at least
+# WEIGHT_OUTLIER_MIN pounds, from the filtered weight are rejected
+WEIGHT_OUTLIER_SIGMA = 3
+WEIGHT_OUTLIER_MIN = 1.0
+# Consecutive rejected readings that are accepted as a real weight change
+WEIGHT_RELEARN_COUNT = 3
+# Days of filtered weight kept for weight change sensors
+WEIGHT_HISTORY_DAYS = 31
+
+# The PurrSong cloud resets cats' "today" totals at midnight in the timezone
+# the library logs in with. Totals that have not dropped by this many seconds
+# after that midnight are taken to have reset anyway
+CLOUD_TIME_ZONE = TIME_ZONE
+CLOUD_RESET_GRACE = 900
+
+# Litter box usage anomaly detection
+ANOMALY_SCORE_THRESHOLD = 3.0
+# Completed days needed before a baseline is used
+ANOMALY_MIN_DAYS = 7
+ANOMALY_MIN_WEEKDAY_DAYS = 3
+# Smallest standard deviations used when scoring visits and durations (seconds)
+ANOMALY_MIN_STD_VISITS = 1.0
+ANOMALY_MIN_STD_DURATION = 10.0
+
+# Weight given to the newest cycle when learning fill and consumption rates
+FORECAST_EWMA_ALPHA = 0.3
+
+# Litter consumption samples: one per hour for a week, ignoring changes in
+# tray weight below the noise level (pounds) and rates over spans under 12 hours
+LITTER_BUFFER_SIZE = 168
+LITTER_SAMPLE_INTERVAL = 3600
+LITTER_NOISE_PNDS = 0.05
+LITTER_MIN_SPAN = 43200
+
+# A cleaning cycle is expected within the litter box wait time plus this
+# many seconds after a visit. Detected cycles fire this event
+CLEANING_TIMEOUT = 1800
+EVENT_CLEANING_CYCLE = f"{DOMAIN}_cleaning_cycle"
+
+# Battery samples are taken at most hourly. A rise of this many percent is
+# taken as a battery replacement, and a drain rate needs two days of samples
+BATTERY_SAMPLE_INTERVAL = 3600
+BATTERY_REPLACEMENT_JUMP = 20
+BATTERY_MIN_SPAN = 2
+BATTERY_MIN_SAMPLES = 6
+
+# Cat activity rollups keep hourly buckets for a day and daily buckets for
+# the 7 days before today. A baseline needs at least 3 of those days
+ACTIVITY_HOURS = 24
+ACTIVITY_DAYS = 7
+ACTIVITY_MIN_DAYS = 3
+
+# Upload cadence is learned from the last gaps between last_seen values and
+# trusted once they are regular. Polls are scheduled this many seconds after
+# an expected upload, no sooner than the minimum interval after the last poll
+# and no later than twice the scan interval
+CADENCE_WINDOW = 20
+CADENCE_MIN_GAPS = 5
+CADENCE_MAX_SPREAD = 0.25
+CADENCE_POLL_DELAY = 10
+CADENCE_MIN_INTERVAL = 30
+
+# A device is offline once last_seen stops advancing for this many expected
+# gaps, and never sooner than the minimum silence in seconds. Devices without
+# enough history get the default gap. Uptime is kept for the last week
+CONNECTIVITY_GAP_FACTOR = 3
+CONNECTIVITY_MIN_SILENCE = 1800
+CONNECTIVITY_DEFAULT_GAP = 3600
+CONNECTIVITY_WINDOW_DAYS = 7
 
 LAVVIEBOT_ERRORS = (
     ClientConnectionError,
@@ -27,3 +229,11 @@ LAVVIEBOT_ERRORS = (
     LavviebotAuthError,
     LavviebotError,
 )
+
+ERROR_LOG_CODES = {
+    101: "Auto-cleaning stopped. Please check if anything is blocking inside the litter tray.",
+    105: "Main motor overload occurred",
+    106: "Main motor or adapter error",
+    108: "Main motor overload occurred",
+    109: "Litter auto-refill stopped",
+}
@@ -1,21 +1,104 @@
 """ DataUpdateCoordinator for the PurrSong integration. """
 from __future__ import annotations
 
-from datetime import timedelta
+import asyncio
+from collections import deque
+from collections.abc import Callable
+from datetime import datetime, timedelta, timezone
+from time import monotonic
+from types import SimpleNamespace
+from typing import Any
 
-from aiohttp import ClientSession
+from aiohttp import ClientSession, TraceConfig, TraceRequestEndParams, TraceRequestExceptionParams
+import async_timeout
 from lavviebot import LavviebotClient
 from lavviebot.exceptions import LavviebotAuthError, LavviebotError, LavviebotRateLimit
-from lavviebot.model import LavviebotData
+from lavviebot.model import Cat, LavvieScanner, LavvieTag, LavviebotData, LitterBox
 
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_EMAIL, CONF_PASSWORD
-from homeassistant.core import HomeAssistant
+from homeassistant.const import CONF_EMAIL, CONF_PASSWORD, CONF_SCAN_INTERVAL, CONF_TIMEOUT, Platform
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.exceptions import ConfigEntryAuthFailed
+from homeassistant.helpers import entity_registry as er, issue_registry as ir
+from homeassistant.helpers.entity import Entity
+from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+import homeassistant.util.dt as dt_util
 
-from .const import DEFAULT_SCAN_INTERVAL, DOMAIN, LOGGER, TIMEOUT
+from .const import (
+    CADENCE_MIN_INTERVAL,
+    CADENCE_POLL_DELAY,
+    CIRCUIT_FAILURE_THRESHOLD,
+    CIRCUIT_MAX_OPEN_INTERVAL,
+    CIRCUIT_OPEN_INTERVAL,
+    CONF_CIRCUIT_MAX_OPEN_INTERVAL,
+    CONF_CIRCUIT_OPEN_INTERVAL,
+    CONF_CONFIRMATIONS,
+    CONF_DEADBAND,
+    CONF_HOLD_TIME,
+    CONF_LATENCY_WINDOW,
+    CONF_MAX_POLL_INTERVAL,
+    CONF_MAX_SILENCE,
+    CONF_MIN_INTERVAL,
+    CONF_MIN_POLL_INTERVAL,
+    CONF_REFRESH_DEADLINE,
+    CONF_RETRY_BACKOFF_MAX,
+    CONF_RETRY_BACKOFF_MIN,
+    CONF_STALE_AFTER,
+    CONF_SUMMARY_ENTITIES,
+    CONF_SUMMARY_MODE,
+    CONF_TIMEOUT_MAX,
+    CONF_TIMEOUT_MIN,
+    DEADBAND_DEFAULTS,
+    DEBOUNCE_DEFAULTS,
+    DEFAULT_SCAN_INTERVAL,
+    DEFAULT_STALE_AFTER,
+    DOMAIN,
+    ISSUE_CLOUD_UNREACHABLE,
+    LATENCY_MIN_SAMPLES,
+    LATENCY_PERCENTILE,
+    LATENCY_WINDOW,
+    LAVVIEBOT_ERRORS,
+    LOGGER,
+    MANUAL_REFRESH_SPACING,
+    MAX_CONCURRENT_REQUESTS,
+    MAX_POLL_INTERVAL,
+    RATE_LIMIT_RETRIES,
+    REFRESH_DEADLINE,
+    RETRY_BACKOFF_MAX,
+    RETRY_BACKOFF_MIN,
+    SNAPSHOT_SAVE_DELAY,
+    SNAPSHOT_STORAGE_KEY,
+    STORAGE_VERSION,
+    SUMMARY_DEVICE_CLASSES,
+    TIMEOUT,
+    TIMEOUT_LATENCY_MULTIPLIER,
+    TIMEOUT_MAX,
+    TIMEOUT_MIN,
+    WATCHDOG_INTERVAL,
+)
+from .analytics import LavviebotAnalytics
+from .fetch import ResourceResult, async_fetch_all
+from .history import EventHistory
+from .util import (
+    SNAPSHOT_RESOURCES,
+    CircuitBreaker,
+    CircuitState,
+    LatencyTracker,
+    snapshot_diff,
+    snapshot_from_dict,
+    snapshot_to_dict,
+)
+
+# Device class of each model, as used by summary mode options
+SUMMARY_MODELS = {
+    LitterBox: 'litterbox',
+    LavvieScanner: 'scanner',
+    LavvieTag: 'tag',
+    Cat: 'cat',
+}
 
 class LavviebotDataUpdateCoordinator(DataUpdateCoordinator):
     """ PurrSong Data Update Coordinator. """
@@ -25,33 +108,512 @@ class LavviebotDataUpdateCoordinator(DataUpdateCoordinator):
     def __init__(self, hass: HomeAssistant, entry: ConfigEntry) -> None:
         """Initialize the PurrSong coordinator."""
 
+        self.entry = entry
+        self.latency = LatencyTracker(
+            LATENCY_WINDOW,
+            LATENCY_PERCENTILE,
+            TIMEOUT_LATENCY_MULTIPLIER,
+            TIMEOUT_MIN,
+            TIMEOUT_MAX,
+            TIMEOUT,
+            LATENCY_MIN_SAMPLES,
+        )
         self.client = LavviebotClient(
             entry.data[CONF_EMAIL],
             entry.data[CONF_PASSWORD],
-            session=ClientSession(),
+            session=self._new_session(),
             timeout=TIMEOUT,
         )
+        self.refresh_started: float | None = None
+        self.last_refresh_duration: float | None = None
+        self.stalled_refreshes: int = 0
+        self.last_stall_duration: float | None = None
+        self._stall_reported = False
+        # Refresh requested through the refresh service, and the last one's result
+        self.manual_refresh: asyncio.Task[dict[str, Any]] | None = None
+        self.manual_result: dict[str, Any] | None = None
+        self.manual_finished: float | None = None
+        self.snapshot_store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, f"{SNAPSHOT_STORAGE_KEY}.{entry.entry_id}", private=True
+        )
+        # When each litter box, scanner, tag and cat last had good data
+        self.refreshed_at: dict[str, dict[int, datetime]] = {
+            resource: {} for resource in SNAPSHOT_RESOURCES
+        }
+        # Devices and cats that had new data in the latest refresh
+        self.updated_ids: dict[str, set[int]] = {resource: set() for resource in SNAPSHOT_RESOURCES}
+        self.history = EventHistory(hass, entry)
+        # Websocket subscribers to changed fields, and the snapshot they were last sent
+        self.change_listeners: set[Callable[[dict[str, Any]], None]] = set()
+        self.published: dict[str, Any] | None = None
+        self.analytics = LavviebotAnalytics(hass, entry, self.history)
+        self.failed_attempts: int = 0
+        self.breaker = CircuitBreaker(
+            CIRCUIT_FAILURE_THRESHOLD, CIRCUIT_OPEN_INTERVAL, CIRCUIT_MAX_OPEN_INTERVAL
+        )
+        # Summary options the entities were set up with, as changing them needs a reload
+        self.entity_options = self.summary_options()
+        self.async_apply_options()
         super().__init__(
             hass,
             LOGGER,
             name=DOMAIN,
-            update_interval=timedelta(seconds=DEFAULT_SCAN_INTERVAL),
+            update_interval=self.scan_interval,
+        )
+
+    @callback
+    def async_apply_options(self) -> None:
+        """ Apply the polling, timeout, backoff and cache options to the running coordinator.
+
+        A new scan interval is used from the next scheduled refresh.
+        """
+
+        options = self.entry.options
+        self.scan_interval = timedelta(
+            seconds=options.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)
+        )
+        self.min_poll_interval: float = options.get(CONF_MIN_POLL_INTERVAL, CADENCE_MIN_INTERVAL)
+        self.max_poll_interval = timedelta(
+            seconds=options.get(CONF_MAX_POLL_INTERVAL, MAX_POLL_INTERVAL)
+        )
+        self.refresh_deadline: float = options.get(CONF_REFRESH_DEADLINE, REFRESH_DEADLINE)
+        self.retry_backoff_min: float = options.get(CONF_RETRY_BACKOFF_MIN, RETRY_BACKOFF_MIN)
+        self.retry_backoff_max: float = options.get(CONF_RETRY_BACKOFF_MAX, RETRY_BACKOFF_MAX)
+        self.latency.default = options.get(CONF_TIMEOUT, TIMEOUT)
+        self.latency.minimum = options.get(CONF_TIMEOUT_MIN, TIMEOUT_MIN)
+        self.latency.maximum = options.get(CONF_TIMEOUT_MAX, TIMEOUT_MAX)
+        # Keep the most recent latencies when the window is resized
+        window = options.get(CONF_LATENCY_WINDOW, LATENCY_WINDOW)
+        if window != self.latency.samples.maxlen:
+            self.latency.samples = deque(self.latency.samples, maxlen=window)
+        self.breaker.open_interval = options.get(CONF_CIRCUIT_OPEN_INTERVAL, CIRCUIT_OPEN_INTERVAL)
+        self.breaker.max_open_interval = options.get(
+            CONF_CIRCUIT_MAX_OPEN_INTERVAL, CIRCUIT_MAX_OPEN_INTERVAL
+        )
+        if self.failed_attempts == 0:
+            self.update_interval = self.scan_interval
+
+    @property
+    def stale_after(self) -> timedelta:
+        """ Return how long the last good data may be served while refreshes fail. """
+
+        return timedelta(seconds=self.entry.options.get(CONF_STALE_AFTER, DEFAULT_STALE_AFTER))
+
+    def debounce_settings(self, sensor: str) -> tuple[float, int]:
+        """ Return the hold time and confirmations required for a binary sensor change. """
+
+        hold_time, confirmations = DEBOUNCE_DEFAULTS[sensor]
+        return (
+            self.entry.options.get(f'{sensor}_{CONF_HOLD_TIME}', hold_time),
+            self.entry.options.get(f'{sensor}_{CONF_CONFIRMATIONS}', confirmations),
+        )
+
+    def deadband_settings(self, sensor: str) -> tuple[float, float, float]:
+        """ Return the deadband, minimum interval and maximum silence for a sensor. """
+
+        deadband, min_interval, max_silence = DEADBAND_DEFAULTS[sensor]
+        return (
+            self.entry.options.get(f'{sensor}_{CONF_DEADBAND}', deadband),
+            self.entry.options.get(f'{sensor}_{CONF_MIN_INTERVAL}', min_interval),
+            self.entry.options.get(f'{sensor}_{CONF_MAX_SILENCE}', max_silence),
+        )
+
+    @property
+    def summary_mode(self) -> bool:
+        """ Return True if devices and cats get a summary sensor in place of their entities. """
+
+        return self.entry.options.get(CONF_SUMMARY_MODE, False)
+
+    def summary_options(self) -> dict[str, Any]:
+        """ Return the options that decide which entities are set up. """
+
+        options: dict[str, Any] = {CONF_SUMMARY_MODE: self.summary_mode}
+        for device_class in SUMMARY_DEVICE_CLASSES:
+            key = f'{device_class}_{CONF_SUMMARY_ENTITIES}'
+            options[key] = self.entry.options.get(key, [])
+        return options
+
+    @callback
+    def async_filter_entities(self, platform: Platform, entities: list[Entity]) -> list[Entity]:
+        """ Return the entities to add, removing left out ones from the entity registry.
+
+        Outside summary mode every entity is kept. In summary mode, account
+        entities and summary sensors are kept, along with any entity whose key
+        (unique ID without the device or cat ID) is listed for its device class.
+        """
+
+        if not self.summary_mode:
+            return entities
+        registry = er.async_get(self.hass)
+        kept = []
+        for entity in entities:
+            item = getattr(entity, 'device_data', None) or getattr(entity, 'cat_data', None)
+            if item is None:
+                kept.append(entity)
+                continue
+            item_id = item.cat_id if isinstance(item, Cat) else item.device_id
+            key = entity.unique_id.removeprefix(f'{item_id}_')
+            keep = self.entry.options.get(f'{SUMMARY_MODELS[type(item)]}_{CONF_SUMMARY_ENTITIES}', [])
+            if key == 'summary' or key in keep:
+                kept.append(entity)
+            elif entity_id := registry.async_get_entity_id(platform, DOMAIN, entity.unique_id):
+                registry.async_remove(entity_id)
+        return kept
+
+    def data_age(self, resource: str, item_id: int) -> timedelta | None:
+        """ Return the age of the data held for a device or cat. """
+
+        if (refreshed := self.refreshed_at[resource].get(item_id)) is None:
+            return None
+        return dt_util.utcnow() - refreshed
+
+    def is_fresh(self, resource: str, item_id: int) -> bool:
+        """ Return True if the data held for a device or cat is within the staleness budget. """
+
+        age = self.data_age(resource, item_id)
+        return age is not None and age <= self.stale_after
+
+    def _new_session(self) -> ClientSession:
+        """ Create a ClientSession that records the latency of every request. """
+
+        trace_config = TraceConfig()
+        trace_config.on_request_start.append(self._async_on_request_start)
+        trace_config.on_request_end.append(self._async_on_request_end)
+        trace_config.on_request_exception.append(self._async_on_request_exception)
+        return ClientSession(trace_configs=[trace_config])
+
+    async def _async_on_request_start(
+        self, session: ClientSession, context: SimpleNamespace, params: Any
+    ) -> None:
+        """ Remember when a request was sent. """
+
+        context.started = monotonic()
+
+    async def _async_on_request_end(
+        self, session: ClientSession, context: SimpleNamespace, params: TraceRequestEndParams
+    ) -> None:
+        """ Record the latency of a completed request. """
+
+        self.latency.add(monotonic() - context.started)
+
+    async def _async_on_request_exception(
+        self, session: ClientSession, context: SimpleNamespace, params: TraceRequestExceptionParams
+    ) -> None:
+        """ Count a timed out request as taking at least the full timeout. """
+
+        if isinstance(params.exception, asyncio.TimeoutError):
+            self.latency.add(self.client.timeout)
+
+    @callback
+    def async_start_watchdog(self) -> CALLBACK_TYPE:
+        """ Periodically check for refreshes running past their deadline. """
+
+        return async_track_time_interval(
+            self.hass, self._async_watchdog, timedelta(seconds=WATCHDOG_INTERVAL)
         )
 
+    @callback
+    def _async_watchdog(self, _now: datetime) -> None:
+        """ Log a refresh that is still running past its deadline. """
+
+        if self.refresh_started is None or self._stall_reported:
+            return
+        if (elapsed := monotonic() - self.refresh_started) > self.refresh_deadline:
+            self._stall_reported = True
+            LOGGER.warning(
+                f'PurrSong refresh has been running for {elapsed:.0f} seconds, '
+                f'past its {self.refresh_deadline} second deadline'
+            )
+
+    async def async_restore_snapshot(self) -> bool:
+        """ Load the last good data saved to disk, if there is any. """
+
+        if (snapshot := await self.snapshot_store.async_load()) is None:
+            return False
+        try:
+            self.data = snapshot_from_dict(snapshot)
+            self.refreshed_at = {
+                resource: {
+                    int(item_id): datetime.fromtimestamp(timestamp, tz=timezone.utc)
+                    for item_id, timestamp in snapshot['refreshed_at'][resource].items()
+                }
+                for resource in SNAPSHOT_RESOURCES
+            }
+        except (KeyError, TypeError, ValueError) as error:
+            LOGGER.debug(f'Discarding unusable PurrSong snapshot: {error}')
+            self.data = None
+            return False
+        LOGGER.debug('Restored PurrSong data from disk snapshot')
+        return True
+
+    def _snapshot(self) -> dict[str, Any]:
+        """ Return the current data and freshness in a form that can be saved to disk. """
+
+        snapshot = snapshot_to_dict(self.data)
+        snapshot['refreshed_at'] = {
+            resource: {item_id: refreshed.timestamp() for item_id, refreshed in items.items()}
+            for resource, items in self.refreshed_at.items()
+        }
+        return snapshot
+
     async def _async_update_data(self) -> LavviebotData:
-        """ Fetch data from PurrSong. """
+        """ Fetch data from PurrSong, serving the last good data on failure. """
+
+        if not self.breaker.allow_request():
+            return self._serve_stale(
+                UpdateFailed(f'PurrSong cloud circuit is open until {self.breaker.probe_at}')
+            )
+        try:
+            data = await self._async_fetch_with_deadline()
+        except UpdateFailed as error:
+            self._record_failure()
+            return self._serve_stale(error)
+        except ConfigEntryAuthFailed:
+            # The cloud answered, so only the credentials are at fault
+            self._clear_updated_ids()
+            self._record_success()
+            raise
+
+        self._record_success()
+        if self.failed_attempts:
+            LOGGER.debug(f'PurrSong refresh recovered after {self.failed_attempts} failed attempts')
+        self.failed_attempts = 0
+        self.snapshot_store.async_delay_save(self._snapshot, SNAPSHOT_SAVE_DELAY)
+        now = dt_util.utcnow()
+        self.analytics.process(data, self.updated_ids, now)
+        self.history.process(data, self.updated_ids, now)
+        self._publish_changes(data)
+        self.update_interval = self._next_interval(data, now)
+        return data
+
+    async def async_manual_refresh(self) -> tuple[dict[str, Any], bool]:
+        """ Refresh on request, coalescing concurrent and closely spaced requests.
+
+        Returns the refresh result, and whether it was shared with an earlier request.
+        """
+
+        if self.manual_refresh is not None:
+            return await asyncio.shield(self.manual_refresh), True
+        if (
+            self.manual_finished is not None
+            and monotonic() - self.manual_finished < MANUAL_REFRESH_SPACING
+        ):
+            return self.manual_result, True
+        self.manual_refresh = self.hass.async_create_task(
+            self._async_manual_refresh(), f'{DOMAIN}_{self.entry.entry_id}_manual_refresh'
+        )
+        return await asyncio.shield(self.manual_refresh), False
+
+    async def _async_manual_refresh(self) -> dict[str, Any]:
+        """ Refresh now and return the latency and the devices and cats that changed. """
+
+        started = monotonic()
+        before = snapshot_to_dict(self.data)
+        try:
+            await self.async_refresh()
+            changes = snapshot_diff(before, snapshot_to_dict(self.data))
+            self.manual_result = {
+                'success': self.last_update_success,
+                'latency': round(monotonic() - started, 3),
+                'changed': {resource: sorted(items) for resource, items in changes.items()},
+            }
+        finally:
+            self.manual_finished = monotonic()
+            self.manual_refresh = None
+        return self.manual_result
+
+    @callback
+    def async_subscribe_changes(
+        self, listener: Callable[[dict[str, Any]], None]
+    ) -> CALLBACK_TYPE:
+        """ Call a listener with the fields that changed after each refresh.
+
+        Changes are computed against the published snapshot, which starts
+        from the current data when the first listener subscribes.
+        """
+
+        if not self.change_listeners:
+            self.published = snapshot_to_dict(self.data)
+        self.change_listeners.add(listener)
+
+        @callback
+        def remove_listener() -> None:
+            self.change_listeners.discard(listener)
+
+        return remove_listener
+
+    def _publish_changes(self, data: LavviebotData) -> None:
+        """ Send the fields that changed since the published snapshot to listeners. """
+
+        if not self.change_listeners:
+            return
+        snapshot = snapshot_to_dict(data)
+        changes = snapshot_diff(self.published, snapshot)
+        self.published = snapshot
+        if changes:
+            for listener in list(self.change_listeners):
+                listener(changes)
+
+    def _next_interval(self, data: LavviebotData, now: datetime) -> timedelta:
+        """ Time the next poll to land just after expected device uploads.
+
+        Of the uploads expected within the scan interval, the poll follows the
+        latest, so a single poll collects them all. If none are expected, the
+        poll waits for the next upload, up to the maximum poll interval. The
+        fixed scan interval is used until some device has a regular cadence.
+        """
 
+        earliest = now + timedelta(seconds=self.min_poll_interval - CADENCE_POLL_DELAY)
+        if not (uploads := self.analytics.next_uploads(data, earliest)):
+            return self.scan_interval
+        within = [upload for upload in uploads if upload <= now + self.scan_interval]
+        target = max(within) if within else min(uploads)
+        interval = target - now + timedelta(seconds=CADENCE_POLL_DELAY)
+        return min(interval, self.max_poll_interval)
+
+    async def _async_fetch_with_deadline(self) -> LavviebotData:
+        """ Fetch all data, cancelling the refresh if it runs past the deadline.
+
+        Refresh durations are recorded, and the per-request timeout is adapted
+        to the latency observed during the refresh.
+        """
+
+        started = self.refresh_started = monotonic()
         try:
-            data = await self.client.async_get_data()
-        except LavviebotAuthError as error:
-            raise ConfigEntryAuthFailed(error) from error
-        except LavviebotError as error:
-            raise UpdateFailed(error) from error
-        except LavviebotRateLimit:
-            LOGGER.debug("Purrsong API has rate limited current session. Starting new ClientSession.")
-            await self.client._session.close()
-            self.client._session = ClientSession()
-            self.client.token = None
-            return await self._async_update_data()
-        else:
-            return data
+            async with async_timeout.timeout(self.refresh_deadline):
+                return await self._async_fetch_data()
+        except asyncio.TimeoutError as error:
+            raise UpdateFailed(
+                f'PurrSong refresh cancelled after {self.refresh_deadline} second deadline'
+            ) from error
+        finally:
+            self.refresh_started = None
+            self._stall_reported = False
+            self.last_refresh_duration = monotonic() - started
+            if self.last_refresh_duration >= self.refresh_deadline:
+                self.stalled_refreshes += 1
+                self.last_stall_duration = self.last_refresh_duration
+            self.client.timeout = self.latency.timeout
+
+    async def _async_fetch_data(self) -> LavviebotData:
+        """ Fetch all data from the PurrSong API. """
+
+        for attempt in range(RATE_LIMIT_RETRIES + 1):
+            try:
+                results = await async_fetch_all(self.client, MAX_CONCURRENT_REQUESTS)
+                return self._merge_results(results)
+            except LavviebotAuthError as error:
+                raise ConfigEntryAuthFailed(error) from error
+            except LAVVIEBOT_ERRORS as error:
+                raise UpdateFailed(error) from error
+            except LavviebotRateLimit as error:
+                if attempt == RATE_LIMIT_RETRIES:
+                    raise UpdateFailed(error) from error
+                LOGGER.debug("Purrsong API has rate limited current session. Starting new ClientSession.")
+                await self.client._session.close()
+                self.client._session = self._new_session()
+                self.client.token = None
+            except (LookupError, TypeError, ValueError) as error:
+                # Discovery and response parsing expect the cloud's response layout
+                raise UpdateFailed(f'Unexpected PurrSong response: {error!r}') from error
+
+    def _merge_results(self, results: dict[str, ResourceResult]) -> LavviebotData:
+        """ Merge fetched devices and cats with the last good data.
+
+        Devices and cats whose request failed keep their previous data and
+        freshness. Auth and rate-limit errors are raised so the whole refresh
+        is handled accordingly, as is a refresh where every request failed.
+        """
+
+        errors = [error for result in results.values() for error in result.errors]
+        for error in errors:
+            if isinstance(error, (LavviebotAuthError, LavviebotRateLimit)):
+                raise error
+        if errors and not any(result.items for result in results.values()):
+            raise UpdateFailed(errors[0]) from errors[0]
+
+        now = dt_util.utcnow()
+        merged: dict[str, dict[int, Any]] = {}
+        for resource, result in results.items():
+            previous = getattr(self.data, resource) if self.data else {}
+            if result.error:
+                items = dict(previous)
+            else:
+                items = {
+                    **{item_id: previous[item_id] for item_id in result.failed if item_id in previous},
+                    **result.items,
+                }
+            refreshed = self.refreshed_at[resource]
+            self.refreshed_at[resource] = {
+                item_id: now if item_id in result.items else refreshed[item_id]
+                for item_id in items
+                if item_id in result.items or item_id in refreshed
+            }
+            merged[resource] = items
+            self.updated_ids[resource] = set(result.items)
+        if errors:
+            LOGGER.debug(f'PurrSong refresh kept last good data for {len(errors)} failed requests')
+        return LavviebotData(**merged)
+
+    def _record_failure(self) -> None:
+        """ Count a failed refresh and raise a repair issue if the circuit opens. """
+
+        self.breaker.record_failure()
+        if self.breaker.state != CircuitState.OPEN:
+            return
+        LOGGER.debug(f'PurrSong cloud circuit opened. Next probe at {self.breaker.probe_at}')
+        ir.async_create_issue(
+            self.hass,
+            DOMAIN,
+            f'{ISSUE_CLOUD_UNREACHABLE}_{self.entry.entry_id}',
+            is_fixable=False,
+            severity=ir.IssueSeverity.WARNING,
+            translation_key=ISSUE_CLOUD_UNREACHABLE,
+            translation_placeholders={
+                "account": self.entry.data[CONF_EMAIL],
+                "failures": str(self.breaker.failures),
+            },
+        )
+
+    def _record_success(self) -> None:
+        """ Close the circuit and clear the repair issue if it was raised. """
+
+        if self.breaker.state != CircuitState.CLOSED:
+            LOGGER.debug('PurrSong cloud circuit closed')
+            ir.async_delete_issue(self.hass, DOMAIN, f'{ISSUE_CLOUD_UNREACHABLE}_{self.entry.entry_id}')
+        self.breaker.record_success()
+
+    def _clear_updated_ids(self) -> None:
+        """ Mark every device and cat as having no new data in the latest refresh. """
+
+        self.updated_ids = {resource: set() for resource in SNAPSHOT_RESOURCES}
+
+    def _serve_stale(self, error: UpdateFailed) -> LavviebotData:
+        """ Keep serving the last good data while it is within the staleness budget.
+
+        Retries are scheduled with an exponential backoff. Once none of the held
+        data is fresh enough, the original error is raised so entities become
+        unavailable.
+        """
+
+        # Nothing new was fetched, so debouncers must not count the held values again
+        self._clear_updated_ids()
+        self.failed_attempts += 1
+        backoff = min(
+            self.retry_backoff_min * 2 ** (self.failed_attempts - 1), self.retry_backoff_max
+        )
+        self.update_interval = timedelta(seconds=backoff)
+
+        fresh = [
+            item_id
+            for resource in SNAPSHOT_RESOURCES
+            for item_id in self.refreshed_at[resource]
+            if self.is_fresh(resource, item_id)
+        ]
+        if self.data is None or not fresh:
+            raise error
+        LOGGER.debug(
+            f'Serving last good PurrSong data after failed refresh ({error}). '
+            f'Retrying in {backoff} seconds.'
+        )
+        return self.data
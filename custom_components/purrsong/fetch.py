@@ -0,0 +1,290 @@
+""" Concurrent fetch pipeline for the PurrSong integration.
+
+Litter boxes, LavvieScanners, LavvieTags and cats are requested as separate
+concurrent tasks, each device or cat with its own request, so that one
+failing request does not discard the rest of the refresh. Parsing mirrors
+LavviebotClient.async_get_data.
+"""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any
+
+from lavviebot import LavviebotClient
+from lavviebot.model import Cat, LavvieScanner, LavvieTag, LitterBox
+
+import homeassistant.util.dt as dt_util
+
+from .const import LOGGER
+
+# Weights are reported by the API in units of 1/455.1 lb
+WEIGHT_DIVISOR = 455.1
+
+
+@dataclass
+class ResourceResult:
+    """ Outcome of fetching one resource (litter boxes, scanners, tags or cats). """
+
+    items: dict[int, Any] = field(default_factory=dict)
+    # Requests that failed, keyed by device or cat id
+    failed: dict[int, BaseException] = field(default_factory=dict)
+    # Set when the resource could not be listed at all, so its ids are unknown
+    error: BaseException | None = None
+
+    @property
+    def errors(self) -> list[BaseException]:
+        """ Return every error raised while fetching this resource. """
+
+        return [*self.failed.values(), *([self.error] if self.error else [])]
+
+
+def _as_local(epoch_ms: Any) -> datetime:
+    """ Convert a PurrSong epoch in milliseconds to a local datetime. """
+
+    return dt_util.as_local(datetime.fromtimestamp(int(epoch_ms) / 1000, tz=timezone.utc))
+
+
+def parse_litter_box(device_id: int, device_name: str, state: list[dict[str, Any]]) -> LitterBox:
+    """ Build a LitterBox from a litter box status response. """
+
+    detail = state[0]['data']['getIotDetail']
+    lavviebot = detail['lavviebot']
+    recent_log = lavviebot['recentLavviebotLog']
+    usage_history = state[1]['data']['getIotPoopRecord']['catUsageHistory']
+
+    nickname = usage_history[0].get('nickname')
+    today = dt_util.now().date()
+    times_used_today = 0
+    for usage_record in usage_history:
+        if _as_local(usage_record['creationTime']).date() != today:
+            break
+        times_used_today += 1
+
+    return LitterBox(
+        device_id=device_id,
+        device_name=device_name,
+        iot_code_tail=detail.get('iotCodeTail'),
+        latest_firmware=detail.get('latestFirmwareVersion'),
+        router_ssid=lavviebot.get('routerSSID'),
+        min_bottom_weight_pnds=lavviebot.get('minBottomWeight') / WEIGHT_DIVISOR,
+        beacon_battery=lavviebot.get('beaconBattery'),
+        current_firmware=recent_log.get('currentFirmwareVersion'),
+        motor_state=recent_log.get('motorState'),
+        top_litter_status=recent_log.get('topLitterStatus'),
+        waste_drawer_status=recent_log.get('wasteDrawerStatus'),
+        wait_time=recent_log.get('waitTime'),
+        litter_type=recent_log.get('litterType'),
+        litter_bottom_amount_pnds=recent_log.get('litterBottomAmount') / WEIGHT_DIVISOR,
+        humidity=recent_log.get('humidity'),
+        temperature_c=recent_log.get('temperature'),
+        last_seen=_as_local(recent_log.get('creationTime')),
+        last_cat_used_name='Unknown' if nickname is None else nickname,
+        last_used_duration=usage_history[0].get('duration'),
+        last_used=_as_local(usage_history[0].get('creationTime')),
+        times_used_today=times_used_today,
+        error_log=state[2]['data']['getIotErrorLog']['errorLogs'],
+    )
+
+
+def parse_scanner(device_id: int, device_name: str, state: dict[str, Any]) -> LavvieScanner:
+    """ Build a LavvieScanner from a scanner status response. """
+
+    detail = state['data']['getIotDetail']
+    scanner = detail['lavvieScanner']
+    return LavvieScanner(
+        device_id=device_id,
+        device_name=device_name,
+        iot_code_tail=detail.get('iotCodeTail'),
+        latest_firmware=detail.get('latestFirmwareVersion'),
+        router_ssid=scanner.get('routerSSID'),
+        wifi_status=scanner.get('wifiStatus'),
+        current_firmware=scanner['recentLavvieScannerLog'].get('currentFirmwareVersion'),
+        last_seen=_as_local(scanner['recentLavvieScannerLog'].get('creationTime')),
+    )
+
+
+def parse_tag(device_id: int, device_name: str, state: dict[str, Any]) -> LavvieTag:
+    """ Build a LavvieTag from a tag status response. """
+
+    detail = state['data']['getIotDetail']
+    tag = detail['lavvieTag']
+    return LavvieTag(
+        device_id=device_id,
+        device_name=device_name,
+        iot_code_tail=detail.get('iotCodeTail'),
+        latest_firmware=detail.get('latestFirmwareVersion'),
+        current_firmware=tag.get('currentFirmwareVersion'),
+        battery=tag.get('battery'),
+        last_seen=_as_local(tag.get('recentConnectionTime')),
+    )
+
+
+def _today(data: dict[str, Any] | None, default: float | int) -> float | int:
+    """ Return today's value from a cat statistic, or default if there is none. """
+
+    if not data or data['today'] is None:
+        return default
+    return data['today']
+
+
+def parse_cat(cat: dict[str, Any], status: dict[str, Any]) -> Cat:
+    """ Build a Cat from a discovered cat and its status response. """
+
+    activity = {'zoomies': 0, 'running': 0, 'walking': 0, 'resting': 0, 'sleeping': 0}
+    if cat['is_unknown']:
+        cat_name = "Unknown"
+    else:
+        cat_name = cat['cat'].get('nickname')
+        # Today's activity is only reported for cats with a LavvieTag
+        if cat['has_lavvietag']:
+            for data in status['data']['todayActivity']:
+                activity['zoomies'] += data['woodadaCount'] or 0
+                activity['running'] += data['run'] or 0
+                activity['walking'] += data['walk'] or 0
+                activity['sleeping'] += data['rest'] or 0
+                activity['resting'] += data['grooming'] or 0
+
+    return Cat(
+        cat_id=cat['id'],
+        location_id=cat['location_id'],
+        cat_name=cat_name,
+        has_lavvietag=cat['has_lavvietag'],
+        cat_weight_pnds=_today(status['data']['weightData'], 0.0) / WEIGHT_DIVISOR,
+        duration=_today(status['data']['poopDuration'], 0.0),
+        poop_count=_today(status['data']['poopCount'], 0),
+        **activity,
+    )
+
+
+async def _async_gather_items(
+    jobs: dict[int, Callable[[], Awaitable[Any]]], semaphore: asyncio.Semaphore
+) -> ResourceResult:
+    """ Run one request per device or cat concurrently, isolating failures. """
+
+    async def _async_limited(job: Callable[[], Awaitable[Any]]) -> Any:
+        async with semaphore:
+            return await job()
+
+    result = ResourceResult()
+    outcomes = await asyncio.gather(
+        *(_async_limited(job) for job in jobs.values()), return_exceptions=True
+    )
+    for item_id, outcome in zip(jobs, outcomes):
+        if isinstance(outcome, asyncio.CancelledError):
+            raise outcome
+        if isinstance(outcome, BaseException):
+            LOGGER.debug(f'PurrSong request for {item_id} failed: {outcome!r}')
+            result.failed[item_id] = outcome
+        else:
+            result.items[item_id] = outcome
+    return result
+
+
+async def _async_fetch_cats(
+    client: LavviebotClient, locations: list[dict[str, Any]], semaphore: asyncio.Semaphore
+) -> ResourceResult:
+    """ Discover cats for every location, then fetch each cat's status. """
+
+    if not client.has_cat:
+        return ResourceResult()
+
+    async def _async_discover(location: dict[str, Any]) -> dict[str, Any]:
+        async with semaphore:
+            return await client.async_discover_cats(location['id'])
+
+    try:
+        responses = await asyncio.gather(*(_async_discover(location) for location in locations))
+    except asyncio.CancelledError:
+        raise
+    except Exception as error:  # pylint: disable=broad-except
+        return ResourceResult(error=error)
+
+    cats: list[dict[str, Any]] = []
+    for location, response in zip(locations, responses):
+        if location['hasUnknownCat']:
+            cats.append({
+                'id': location['id'],
+                'location_id': location['id'],
+                'is_unknown': True,
+                'has_lavvietag': False,
+            })
+        for cat in response['data']['getPets']:
+            cats.append({
+                **cat,
+                'is_unknown': False,
+                'location_id': location['id'],
+                'has_lavvietag': bool(cat['lavvieTag']),
+            })
+
+    def _job(cat: dict[str, Any]) -> Callable[[], Awaitable[Cat]]:
+        async def _async_fetch() -> Cat:
+            if cat['is_unknown']:
+                status = await client.async_get_unknown_status(cat['id'])
+            else:
+                status = await client.async_get_cat_status(cat['id'], cat['location_id'])
+            return parse_cat(cat, status)
+        return _async_fetch
+
+    return await _async_gather_items({cat['id']: _job(cat) for cat in cats}, semaphore)
+
+
+async def async_fetch_all(
+    client: LavviebotClient, max_concurrent: int
+) -> dict[str, ResourceResult]:
+    """ Fetch every resource concurrently.
+
+    Device discovery is a single request and any error it raises is
+    propagated. Errors from the requests that follow are captured in the
+    returned results, keyed by the LavviebotData attribute they belong to.
+    """
+
+    if client.cookie is None or client.token is None:
+        await client.login()
+    semaphore = asyncio.Semaphore(max_concurrent)
+
+    response = await client.async_discover_devices()
+    locations = response['data']['getLocations']
+    devices = [device for location in locations for device in location['getIots']]
+
+    def _litter_box_job(device: dict[str, Any]) -> Callable[[], Awaitable[LitterBox]]:
+        async def _async_fetch() -> LitterBox:
+            state = await client.async_get_litter_box_status(device['id'])
+            return parse_litter_box(device['id'], device['lavviebot'].get('nickname'), state)
+        return _async_fetch
+
+    def _scanner_job(device: dict[str, Any]) -> Callable[[], Awaitable[LavvieScanner]]:
+        async def _async_fetch() -> LavvieScanner:
+            state = await client.async_get_iot_device_status(device['id'], "lavvie_scanner")
+            return parse_scanner(device['id'], device['lavvieScanner'].get('nickname'), state)
+        return _async_fetch
+
+    def _tag_job(device: dict[str, Any]) -> Callable[[], Awaitable[LavvieTag]]:
+        async def _async_fetch() -> LavvieTag:
+            state = await client.async_get_iot_device_status(device['id'], "lavvie_tag")
+            return parse_tag(device['id'], device['lavvieTag'].get('nickname'), state)
+        return _async_fetch
+
+    litterboxes, lavvie_scanners, lavvie_tags, cats = await asyncio.gather(
+        _async_gather_items(
+            {device['id']: _litter_box_job(device) for device in devices if device['lavviebot']},
+            semaphore,
+        ),
+        _async_gather_items(
+            {device['id']: _scanner_job(device) for device in devices if device['lavvieScanner']},
+            semaphore,
+        ),
+        _async_gather_items(
+            {device['id']: _tag_job(device) for device in devices if device['lavvieTag']},
+            semaphore,
+        ),
+        _async_fetch_cats(client, locations, semaphore),
+    )
+    return {
+        'litterboxes': litterboxes,
+        'lavvie_scanners': lavvie_scanners,
+        'lavvie_tags': lavvie_tags,
+        'cats': cats,
+    }
@@ -0,0 +1,438 @@
+""" Event history for the PurrSong integration.
+
+Visits, cleaning cycles and error-log entries for each litter box, and hourly
+samples of litter box and cat metrics, are kept in the integration's own store
+and indexed by time, so range queries do not depend on the recorder. The store
+also keeps a record of the firmware versions each device has run.
+"""
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+import heapq
+from itertools import repeat
+from typing import Any
+
+from lavviebot.model import LavviebotData, LitterBox
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+
+from .const import (
+    CONF_HISTORY_RETENTION,
+    DEFAULT_HISTORY_RETENTION,
+    ERROR_LOG_CODES,
+    EVENT_MIN_DURATION,
+    HISTORY_METRICS,
+    HISTORY_SAVE_DELAY,
+    HISTORY_STORAGE_KEY,
+    METRIC_SAMPLE_INTERVAL,
+    STORAGE_VERSION,
+)
+
+# Kinds of events kept in the history
+KIND_VISIT = 'visit'
+KIND_CLEANING = 'cleaning'
+KIND_ERROR = 'error'
+KINDS = (KIND_VISIT, KIND_CLEANING, KIND_ERROR)
+
+# Device resources whose firmware versions are recorded
+FIRMWARE_RESOURCES = ('litterboxes', 'lavvie_scanners', 'lavvie_tags')
+
+
+@dataclass(slots=True)
+class HistoryEvent:
+    """ A visit, cleaning cycle or error on a litter box, timed in epoch seconds. """
+
+    start: float
+    end: float
+    kind: str
+    summary: str
+    description: str | None = None
+    cat_id: int | None = None
+
+    def as_list(self) -> list[Any]:
+        """ Return the event in a compact form for storage. """
+
+        return [self.start, self.end, self.kind, self.summary, self.description, self.cat_id]
+
+    @classmethod
+    def from_list(cls, data: list[Any]) -> HistoryEvent:
+        """ Restore an event from storage. """
+
+        start, end, kind, summary, description, cat_id = data
+        return cls(float(start), float(end), kind, summary, description, cat_id)
+
+
+class IntervalIndex:
+    """ Events sorted by start time, for overlap queries in logarithmic time.
+
+    The longest event duration bounds how long before a range an overlapping
+    event can start, so a query bisects to the first candidate and only scans
+    events that can overlap the range.
+    """
+
+    def __init__(self) -> None:
+        self.starts: list[float] = []
+        self.events: list[HistoryEvent] = []
+        self.max_duration: float = 0.0
+
+    def __len__(self) -> int:
+        return len(self.events)
+
+    def add(self, event: HistoryEvent) -> None:
+        """ Insert an event. Events arrive mostly in order, so this is usually an append. """
+
+        index = bisect_right(self.starts, event.start)
+        self.starts.insert(index, event.start)
+        self.events.insert(index, event)
+        self.max_duration = max(self.max_duration, event.end - event.start)
+
+    def overlapping(self, start: float, end: float) -> list[HistoryEvent]:
+        """ Return events that overlap the range from start to end. """
+
+        low = bisect_left(self.starts, start - self.max_duration)
+        high = bisect_left(self.starts, end)
+        return [event for event in self.events[low:high] if event.end > start]
+
+    def starting(self, start: float, end: float) -> list[HistoryEvent]:
+        """ Return events that start from start up to end, oldest first. """
+
+        return self.events[bisect_left(self.starts, start):bisect_left(self.starts, end)]
+
+    def current(self, now: float) -> HistoryEvent | None:
+        """ Return the latest started event still in progress at a given time. """
+
+        in_progress = self.overlapping(now, now)
+        return in_progress[-1] if in_progress else None
+
+    def prune(self, before: float) -> None:
+        """ Drop events that started before a given time. """
+
+        index = bisect_left(self.starts, before)
+        del self.starts[:index]
+        del self.events[:index]
+
+
+class MetricSeries:
+    """ Samples of a litter box or cat metric, sorted by time. """
+
+    def __init__(self) -> None:
+        self.times: list[float] = []
+        self.values: list[float] = []
+
+    def add(self, timestamp: float, value: float) -> None:
+        """ Record a sample unless the last one is more recent than the sample interval. """
+
+        if self.times and timestamp - self.times[-1] < METRIC_SAMPLE_INTERVAL:
+            return
+        self.times.append(timestamp)
+        self.values.append(value)
+
+    def between(self, start: float, end: float) -> list[tuple[float, float]]:
+        """ Return samples taken from start up to end. """
+
+        low = bisect_left(self.times, start)
+        high = bisect_left(self.times, end)
+        return list(zip(self.times[low:high], self.values[low:high]))
+
+    def prune(self, before: float) -> None:
+        """ Drop samples taken before a given time. """
+
+        index = bisect_left(self.times, before)
+        del self.times[:index]
+        del self.values[:index]
+
+
+def bucket_events(
+    events: Iterable[tuple[int, HistoryEvent]], start: float, bucket: float
+) -> list[dict[str, Any]]:
+    """ Count events of each kind, and total visit time, per bucket of seconds from start. """
+
+    buckets: dict[int, dict[str, Any]] = {}
+    for _, event in events:
+        key = int((event.start - start) // bucket)
+        if (row := buckets.get(key)) is None:
+            row = buckets[key] = {'start': start + key * bucket, 'visit_duration': 0.0}
+            row.update(dict.fromkeys(KINDS, 0))
+        row[event.kind] += 1
+        if event.kind == KIND_VISIT:
+            row['visit_duration'] += event.end - event.start
+    return list(buckets.values())
+
+
+def bucket_samples(
+    samples: Iterable[tuple[float, float]], start: float, bucket: float
+) -> list[dict[str, Any]]:
+    """ Summarise metric samples per bucket of seconds from start. """
+
+    buckets: dict[int, dict[str, Any]] = {}
+    for timestamp, value in samples:
+        key = int((timestamp - start) // bucket)
+        if (row := buckets.get(key)) is None:
+            buckets[key] = {
+                'start': start + key * bucket, 'mean': value, 'min': value, 'max': value, 'count': 1
+            }
+            continue
+        row['count'] += 1
+        row['mean'] += (value - row['mean']) / row['count']
+        row['min'] = min(row['min'], value)
+        row['max'] = max(row['max'], value)
+    return list(buckets.values())
+
+
+class EventHistory:
+    """ Hold the event history of every litter box on a PurrSong account. """
+
+    def __init__(self, hass: HomeAssistant, entry: ConfigEntry) -> None:
+        self.entry = entry
+        self.store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, f"{HISTORY_STORAGE_KEY}.{entry.entry_id}", private=True
+        )
+        self.indexes: dict[int, IntervalIndex] = {}
+        # Creation time of the newest error-log entry recorded for each litter box
+        self.last_error: dict[int, float] = {}
+        self.metrics: dict[str, dict[int, dict[str, MetricSeries]]] = {
+            resource: {} for resource in HISTORY_METRICS
+        }
+        # [version, first seen] of every firmware each device has run, oldest first
+        self.firmware: dict[str, dict[int, list[list[Any]]]] = {
+            resource: {} for resource in FIRMWARE_RESOURCES
+        }
+        # When each firmware version was first offered as the latest version
+        self.releases: dict[str, dict[str, float]] = {
+            resource: {} for resource in FIRMWARE_RESOURCES
+        }
+
+    @property
+    def retention(self) -> timedelta:
+        """ Return how long events are kept. """
+
+        return timedelta(days=self.entry.options.get(CONF_HISTORY_RETENTION, DEFAULT_HISTORY_RETENTION))
+
+    def index(self, device_id: int) -> IntervalIndex:
+        """ Return the index for a litter box, creating it if needed. """
+
+        if (index := self.indexes.get(device_id)) is None:
+            index = self.indexes[device_id] = IntervalIndex()
+        return index
+
+    def series(self, resource: str, subject_id: int, metric: str) -> MetricSeries:
+        """ Return the samples of a litter box or cat metric, creating them if needed. """
+
+        subject = self.metrics[resource].setdefault(subject_id, {})
+        if (series := subject.get(metric)) is None:
+            series = subject[metric] = MetricSeries()
+        return series
+
+    async def async_load(self) -> None:
+        """ Restore saved events. Unusable data is discarded. """
+
+        if (stored := await self.store.async_load()) is None:
+            return
+        try:
+            for device_id, events in stored['events'].items():
+                index = self.index(int(device_id))
+                for event in events:
+                    index.add(HistoryEvent.from_list(event))
+            self.last_error = {
+                int(device_id): timestamp for device_id, timestamp in stored['last_error'].items()
+            }
+            for resource, subjects in stored.get('metrics', {}).items():
+                for subject_id, metrics in subjects.items():
+                    for metric, (times, values) in metrics.items():
+                        series = self.series(resource, int(subject_id), metric)
+                        series.times = [float(timestamp) for timestamp in times]
+                        series.values = [float(value) for value in values]
+            for resource, devices in stored.get('firmware', {}).items():
+                self.firmware[resource] = {
+                    int(device_id): [list(entry) for entry in versions]
+                    for device_id, versions in devices.items()
+                }
+            for resource, releases in stored.get('releases', {}).items():
+                self.releases[resource] = dict(releases)
+        except (KeyError, TypeError, ValueError):
+            self.indexes = {}
+            self.last_error = {}
+            self.metrics = {resource: {} for resource in HISTORY_METRICS}
+            self.firmware = {resource: {} for resource in FIRMWARE_RESOURCES}
+            self.releases = {resource: {} for resource in FIRMWARE_RESOURCES}
+
+    def _as_dict(self) -> dict[str, Any]:
+        """ Return all events for storage. """
+
+        return {
+            'events': {
+                device_id: [event.as_list() for event in index.events]
+                for device_id, index in self.indexes.items()
+            },
+            'last_error': self.last_error,
+            'metrics': {
+                resource: {
+                    subject_id: {
+                        metric: [series.times, series.values] for metric, series in metrics.items()
+                    }
+                    for subject_id, metrics in subjects.items()
+                }
+                for resource, subjects in self.metrics.items()
+            },
+            'firmware': self.firmware,
+            'releases': self.releases,
+        }
+
+    def add(self, device_id: int, event: HistoryEvent) -> None:
+        """ Record an event for a litter box. """
+
+        self.index(device_id).add(event)
+
+    def query(self, device_id: int, start: datetime, end: datetime) -> list[HistoryEvent]:
+        """ Return a litter box's events that overlap a time range. """
+
+        if (index := self.indexes.get(device_id)) is None:
+            return []
+        return index.overlapping(start.timestamp(), end.timestamp())
+
+    def events(
+        self,
+        start: float,
+        end: float,
+        device_id: int | None = None,
+        cat_id: int | None = None,
+        kinds: Iterable[str] | None = None,
+    ) -> Iterator[tuple[int, HistoryEvent]]:
+        """ Iterate over events that start in a time range, oldest first, with their litter box.
+
+        Litter boxes are merged lazily so a page only reads the events it returns.
+        """
+
+        device_ids = list(self.indexes) if device_id is None else [device_id]
+        streams = [
+            zip(repeat(device), self.indexes[device].starting(start, end))
+            for device in device_ids
+            if device in self.indexes
+        ]
+        kinds = set(kinds) if kinds else None
+        for device, event in heapq.merge(*streams, key=lambda item: item[1].start):
+            if cat_id is not None and event.cat_id != cat_id:
+                continue
+            if kinds is not None and event.kind not in kinds:
+                continue
+            yield device, event
+
+    def samples(
+        self, resource: str, subject_id: int, metric: str, start: float, end: float
+    ) -> list[tuple[float, float]]:
+        """ Return samples of a litter box or cat metric taken in a time range. """
+
+        if (series := self.metrics[resource].get(subject_id, {}).get(metric)) is None:
+            return []
+        return series.between(start, end)
+
+    def add_visit(self, box: LitterBox, data: LavviebotData, new_visits: int) -> None:
+        """ Record the latest visit to a litter box.
+
+        Only the latest visit's time, cat and duration are reported, so when
+        several visits happened since the previous refresh the others can't
+        be placed. They are noted in the latest visit's description instead.
+        """
+
+        start = box.last_used.timestamp()
+        cat_id = next(
+            (cat.cat_id for cat in data.cats.values() if cat.cat_name == box.last_cat_used_name),
+            None,
+        )
+        description = f"Visit lasted {box.last_used_duration} seconds"
+        if new_visits > 1:
+            description += (
+                f". {new_visits - 1} earlier visits since the previous refresh"
+                " were not reported individually"
+            )
+        self.add(box.device_id, HistoryEvent(
+            start,
+            start + max(box.last_used_duration or 0, EVENT_MIN_DURATION),
+            KIND_VISIT,
+            f"{box.last_cat_used_name} visit",
+            description,
+            cat_id,
+        ))
+
+    def add_cleaning(self, box: LitterBox, delay: float, now: datetime) -> None:
+        """ Record a cleaning cycle detected on a litter box. """
+
+        start = now.timestamp()
+        self.add(box.device_id, HistoryEvent(
+            start,
+            start + EVENT_MIN_DURATION,
+            KIND_CLEANING,
+            "Cleaning cycle",
+            f"Detected {round(delay)} seconds after the last visit "
+            f"(wait time {box.wait_time} minutes)",
+        ))
+
+    def add_errors(self, box: LitterBox) -> None:
+        """ Record error-log entries not seen before. """
+
+        last_error = self.last_error.get(box.device_id, 0.0)
+        for error in box.error_log:
+            start = int(error['creationTime']) / 1000
+            if start <= last_error:
+                continue
+            self.add(box.device_id, HistoryEvent(
+                start,
+                start + EVENT_MIN_DURATION,
+                KIND_ERROR,
+                ERROR_LOG_CODES.get(error['status'], 'Unknown error code'),
+                f"Error code {error['status']}",
+            ))
+            self.last_error[box.device_id] = max(self.last_error.get(box.device_id, 0.0), start)
+
+    def add_firmware(self, resource: str, device: Any, now: datetime) -> None:
+        """ Record a device moving to a new firmware version, and newly offered versions. """
+
+        timestamp = now.timestamp()
+        versions = self.firmware[resource].setdefault(device.device_id, [])
+        if device.current_firmware and (not versions or versions[-1][0] != device.current_firmware):
+            versions.append([device.current_firmware, timestamp])
+        if device.latest_firmware and device.latest_firmware not in self.releases[resource]:
+            self.releases[resource][device.latest_firmware] = timestamp
+
+    def fleet_versions(self, resource: str) -> dict[str, int]:
+        """ Return the number of devices of a resource running each firmware version. """
+
+        counts: dict[str, int] = {}
+        for versions in self.firmware[resource].values():
+            if versions:
+                counts[versions[-1][0]] = counts.get(versions[-1][0], 0) + 1
+        return counts
+
+    def add_samples(self, data: LavviebotData, updated: dict[str, set[int]], now: datetime) -> None:
+        """ Sample the metrics of litter boxes and cats that had new data. """
+
+        timestamp = now.timestamp()
+        for resource, metrics in HISTORY_METRICS.items():
+            for subject_id in updated[resource]:
+                subject = getattr(data, resource)[subject_id]
+                for metric, attribute in metrics.items():
+                    if (value := getattr(subject, attribute)) is not None:
+                        self.series(resource, subject_id, metric).add(timestamp, float(value))
+
+    def process(self, data: LavviebotData, updated: dict[str, set[int]], now: datetime) -> None:
+        """ Record new errors, metric samples and firmware, drop expired data and schedule a save. """
+
+        for device_id in updated['litterboxes']:
+            self.add_errors(data.litterboxes[device_id])
+        self.add_samples(data, updated, now)
+        for resource in FIRMWARE_RESOURCES:
+            for device_id in updated[resource]:
+                self.add_firmware(resource, getattr(data, resource)[device_id], now)
+        cutoff = (now - self.retention).timestamp()
+        for index in self.indexes.values():
+            index.prune(cutoff)
+        for subjects in self.metrics.values():
+            for metrics in subjects.values():
+                for series in metrics.values():
+                    series.prune(cutoff)
+        self.store.async_delay_save(self._as_dict, HISTORY_SAVE_DELAY)
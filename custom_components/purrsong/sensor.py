@@ -14,18 +14,34 @@ from homeassistant.components.sensor import (
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import(
     PERCENTAGE,
+    Platform,
     UnitOfMass,
     UnitOfTemperature,
     UnitOfTime,
 )
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.device_registry import DeviceEntryType
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
-
-from .const import DOMAIN
+import homeassistant.util.dt as dt_util
+
+from .analytics import (
+    ACTIVE,
+    ACTIVITIES,
+    ActivityRollup,
+    BatteryModel,
+    CleaningCycle,
+    ConnectivityHealth,
+    DrawerForecast,
+    LifetimeCounter,
+    LitterConsumption,
+    WeightFilter,
+)
+from .const import DOMAIN, ERROR_LOG_CODES
 from .coordinator import LavviebotDataUpdateCoordinator
+from .util import CircuitState, Deadband
 
 
 LITTER_TYPE = {
@@ -45,14 +61,6 @@ WASTE_STATUS = {
     2: 'Empty or Piled',
 }
 
-ERROR_LOG_CODES = {
-    101: "Auto-cleaning stopped. Please check if anything is blocking inside the litter tray.",
-    105: "Main motor overload occurred",
-    106: "Main motor or adapter error",
-    108: "Main motor overload occurred",
-    109: "Litter auto-refill stopped",
-}
-
 
 async def async_setup_entry(
     hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback
@@ -71,12 +79,21 @@ async def async_setup_entry(
                 CatRun(coordinator, cat_id),
                 CatSleep(coordinator, cat_id),
                 CatWalk(coordinator, cat_id),
-                CatZoomies(coordinator, cat_id)
+                CatZoomies(coordinator, cat_id),
+                CatActiveLastHour(coordinator, cat_id),
+                CatActiveWeek(coordinator, cat_id),
+                CatActivityMix(coordinator, cat_id),
+                CatActivityBaseline(coordinator, cat_id),
             ))
         sensors.extend((
             CatWeight(coordinator, cat_id),
+            CatWeightTrend(coordinator, cat_id),
+            CatWeightChangeWeek(coordinator, cat_id),
+            CatWeightChangeMonth(coordinator, cat_id),
             Duration(coordinator, cat_id),
             UseCount(coordinator, cat_id),
+            CatLifetimeVisits(coordinator, cat_id),
+            CatLifetimeDuration(coordinator, cat_id),
         ))
 
     for device_id, device_data in coordinator.data.litterboxes.items():
@@ -84,33 +101,74 @@ async def async_setup_entry(
             Humidity(coordinator, device_id),
             Temperature(coordinator, device_id),
             BeaconBattery(coordinator, device_id),
+            BeaconBatteryDrainRate(coordinator, device_id),
+            BeaconBatteryEmptyIn(coordinator, device_id),
             LastCatUsed(coordinator, device_id),
             LastSeen(coordinator, device_id),
+            DataRefreshed(coordinator, device_id),
             LastUsed(coordinator, device_id),
             LastUsedDuration(coordinator, device_id),
             LitterBottomAmnt(coordinator, device_id),
             LitterType(coordinator, device_id),
             MinBottomWeight(coordinator, device_id),
             TopLitterStatus(coordinator, device_id),
+            LitterStorageEmpty(coordinator, device_id),
+            LitterConsumptionRate(coordinator, device_id),
             WaitTime(coordinator, device_id),
             WasteStatus(coordinator, device_id),
+            WasteFullForecast(coordinator, device_id),
+            WasteHoursRemaining(coordinator, device_id),
             LitterBoxUseCount(coordinator, device_id),
+            LitterBoxLifetimeVisits(coordinator, device_id),
+            LitterBoxLifetimeDuration(coordinator, device_id),
+            LitterBoxCleaningCycles(coordinator, device_id),
             LatestError(coordinator, device_id),
             ErrorTime(coordinator, device_id),
+            CloudUptime(coordinator, device_id),
         ))
     
     # LavvieScanner
     for device_id, device_data in coordinator.data.lavvie_scanners.items():
-        sensors.append(ScannerLastSeen(coordinator, device_id))
+        sensors.extend((
+            ScannerLastSeen(coordinator, device_id),
+            ScannerDataRefreshed(coordinator, device_id),
+            ScannerCloudUptime(coordinator, device_id),
+        ))
 
     # LavvieTag
     for device_id, device_data in coordinator.data.lavvie_tags.items():
         sensors.extend((
             TagLastSeen(coordinator, device_id),
-            TagBattery(coordinator, device_id)
+            TagDataRefreshed(coordinator, device_id),
+            TagBattery(coordinator, device_id),
+            TagBatteryDrainRate(coordinator, device_id),
+            TagBatteryEmptyIn(coordinator, device_id),
+            TagCloudUptime(coordinator, device_id),
         ))
 
-    async_add_entities(sensors)
+    # PurrSong account
+    sensors.extend((
+        CloudCircuit(coordinator),
+        RefreshDuration(coordinator),
+        FleetVisitsToday(coordinator),
+        FleetWasteFull(coordinator),
+        FleetRefillNeeded(coordinator),
+        FleetFirmwarePending(coordinator),
+        FleetOffline(coordinator),
+    ))
+
+    # Summary mode
+    if coordinator.summary_mode:
+        for device_id in coordinator.data.litterboxes:
+            sensors.append(LitterBoxSummary(coordinator, device_id))
+        for device_id in coordinator.data.lavvie_scanners:
+            sensors.append(ScannerSummary(coordinator, device_id))
+        for device_id in coordinator.data.lavvie_tags:
+            sensors.append(TagSummary(coordinator, device_id))
+        for cat_id in coordinator.data.cats:
+            sensors.append(CatSummary(coordinator, cat_id))
+
+    async_add_entities(coordinator.async_filter_entities(Platform.SENSOR, sensors))
 
 
 class CatWeight(CoordinatorEntity, SensorEntity):
@@ -119,6 +177,7 @@ class CatWeight(CoordinatorEntity, SensorEntity):
     def __init__(self, coordinator, cat_id):
         super().__init__(coordinator)
         self.cat_id = cat_id
+        self.deadband = Deadband(self.cat_data.cat_weight_pnds, dt_util.utcnow())
 
 
     @property
@@ -127,6 +186,12 @@ class CatWeight(CoordinatorEntity, SensorEntity):
         
         return self.coordinator.data.cats[self.cat_id]
 
+    @property
+    def available(self) -> bool:
+        """ Return True if cat data is fresh """
+
+        return super().available and self.coordinator.is_fresh('cats', self.cat_id)
+
     @property
     def device_info(self) -> dict[str, Any]:
         """ Return device registry information for this entity. """
@@ -156,11 +221,20 @@ class CatWeight(CoordinatorEntity, SensorEntity):
 
         return True
 
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """ Only report values that moved past the deadband. """
+
+        if self.cat_id in self.coordinator.updated_ids['cats']:
+            settings = self.coordinator.deadband_settings('cat_weight')
+            self.deadband.update(self.cat_data.cat_weight_pnds, dt_util.utcnow(), *settings)
+        super()._handle_coordinator_update()
+
     @property
     def native_value(self) -> float:
         """ Return weight of cat in pounds """
 
-        return round(self.cat_data.cat_weight_pnds, 1)
+        return round(self.deadband.value, 1)
 
     @property
     def native_unit_of_measurement(self) -> UnitOfMass:
@@ -178,8 +252,8 @@ class CatWeight(CoordinatorEntity, SensorEntity):
     def icon(self) -> str:
         return 'mdi:scale'
 
-class Duration(CoordinatorEntity, SensorEntity):
-    """ Representation of Cat's Daily Litter Box use Duration """
+class CatWeightTrend(CoordinatorEntity, SensorEntity):
+    """ Representation of Cat's filtered weight trend """
 
     def __init__(self, coordinator, cat_id):
         super().__init__(coordinator)
@@ -192,6 +266,12 @@ class Duration(CoordinatorEntity, SensorEntity):
 
         return self.coordinator.data.cats[self.cat_id]
 
+    @property
+    def available(self) -> bool:
+        """ Return True if cat data is fresh """
+
+        return super().available and self.coordinator.is_fresh('cats', self.cat_id)
+
     @property
     def device_info(self) -> dict[str, Any]:
         """ Return device registry information for this entity. """
@@ -207,13 +287,13 @@ class Duration(CoordinatorEntity, SensorEntity):
     def unique_id(self) -> str:
         """ Sets unique ID for this entity. """
 
-        return str(self.cat_data.cat_id) + '_litter_box_duration'
+        return str(self.cat_data.cat_id) + '_weight_trend'
 
     @property
     def name(self) -> str:
         """ Return name of the entity """
 
-        return "Today's average use duration"
+        return "Weight trend"
 
     @property
     def has_entity_name(self) -> bool:
@@ -222,24 +302,53 @@ class Duration(CoordinatorEntity, SensorEntity):
         return True
 
     @property
-    def native_value(self) -> float | int:
-        """ Return today's total duration in seconds """
+    def weight_filter(self) -> WeightFilter:
+        """ Handle cat weight filter """
 
-        return round(self.cat_data.duration, 1)
+        return self.coordinator.analytics.tracker('cat_weight', self.cat_id)
 
     @property
-    def native_unit_of_measurement(self) -> UnitOfTime:
-        """ Return seconds as the native unit """
+    def native_value(self) -> float | None:
+        """ Return filtered weight of cat in pounds """
 
-        return UnitOfTime.SECONDS
+        if self.weight_filter.ewma is None:
+            return None
+        return round(self.weight_filter.ewma, 2)
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """ Return latest raw reading and number of rejected readings """
+
+        return {
+            "last_reading": self.weight_filter.last_raw,
+            "rejected_readings": self.weight_filter.rejected,
+        }
+
+    @property
+    def native_unit_of_measurement(self) -> UnitOfMass:
+        """ Return pounds as the native unit """
+
+        return UnitOfMass.POUNDS
+
+    @property
+    def device_class(self) -> SensorDeviceClass:
+        """ Return entity device class """
+
+        return SensorDeviceClass.WEIGHT
+
+    @property
+    def state_class(self) -> SensorStateClass:
+        """ Return the type of state_class """
+
+        return SensorStateClass.MEASUREMENT
 
     @property
     def icon(self) -> str:
-        return 'mdi:clock-outline'
+        return 'mdi:scale'
 
 
-class UseCount(CoordinatorEntity, SensorEntity):
-    """ Representation of Cat's Daily Litter Box use Count """
+class CatWeightChangeWeek(CoordinatorEntity, SensorEntity):
+    """ Representation of Cat's weight change over the last 7 days """
 
     def __init__(self, coordinator, cat_id):
         super().__init__(coordinator)
@@ -252,6 +361,12 @@ class UseCount(CoordinatorEntity, SensorEntity):
 
         return self.coordinator.data.cats[self.cat_id]
 
+    @property
+    def available(self) -> bool:
+        """ Return True if cat data is fresh """
+
+        return super().available and self.coordinator.is_fresh('cats', self.cat_id)
+
     @property
     def device_info(self) -> dict[str, Any]:
         """ Return device registry information for this entity. """
@@ -267,13 +382,13 @@ class UseCount(CoordinatorEntity, SensorEntity):
     def unique_id(self) -> str:
         """ Sets unique ID for this entity. """
 
-        return str(self.cat_data.cat_id) + '_litter_box_use_count'
+        return str(self.cat_data.cat_id) + '_weight_change_7d'
 
     @property
     def name(self) -> str:
         """ Return name of the entity """
 
-        return "Litter box use count"
+        return "Weight change (7 days)"
 
     @property
     def has_entity_name(self) -> bool:
@@ -282,24 +397,34 @@ class UseCount(CoordinatorEntity, SensorEntity):
         return True
 
     @property
-    def native_value(self) -> int:
-        """ Return today's total count """
+    def native_value(self) -> float | None:
+        """ Return change in filtered weight over the last 7 days in pounds """
 
-        return self.cat_data.poop_count
+        weight_filter = self.coordinator.analytics.tracker('cat_weight', self.cat_id)
+        change = weight_filter.change(7, dt_util.now().date())
+        if change is None:
+            return None
+        return round(change, 2)
+
+    @property
+    def native_unit_of_measurement(self) -> UnitOfMass:
+        """ Return pounds as the native unit """
+
+        return UnitOfMass.POUNDS
 
     @property
     def state_class(self) -> SensorStateClass:
         """ Return the type of state_class """
 
-        return SensorStateClass.TOTAL_INCREASING
+        return SensorStateClass.MEASUREMENT
 
     @property
     def icon(self) -> str:
-        return 'mdi:numeric'
+        return 'mdi:scale-unbalanced'
 
 
-class CatRest(CoordinatorEntity, SensorEntity):
-    """ Representation of Cat's Daily Resting activity """
+class CatWeightChangeMonth(CoordinatorEntity, SensorEntity):
+    """ Representation of Cat's weight change over the last 30 days """
 
     def __init__(self, coordinator, cat_id):
         super().__init__(coordinator)
@@ -312,6 +437,12 @@ class CatRest(CoordinatorEntity, SensorEntity):
 
         return self.coordinator.data.cats[self.cat_id]
 
+    @property
+    def available(self) -> bool:
+        """ Return True if cat data is fresh """
+
+        return super().available and self.coordinator.is_fresh('cats', self.cat_id)
+
     @property
     def device_info(self) -> dict[str, Any]:
         """ Return device registry information for this entity. """
@@ -327,13 +458,13 @@ class CatRest(CoordinatorEntity, SensorEntity):
     def unique_id(self) -> str:
         """ Sets unique ID for this entity. """
 
-        return str(self.cat_data.cat_id) + '_resting'
+        return str(self.cat_data.cat_id) + '_weight_change_30d'
 
     @property
     def name(self) -> str:
         """ Return name of the entity """
 
-        return "Resting"
+        return "Weight change (30 days)"
 
     @property
     def has_entity_name(self) -> bool:
@@ -342,30 +473,34 @@ class CatRest(CoordinatorEntity, SensorEntity):
         return True
 
     @property
-    def native_value(self) -> float | int:
-        """ Return today's total resting in seconds """
+    def native_value(self) -> float | None:
+        """ Return change in filtered weight over the last 30 days in pounds """
 
-        return self.cat_data.resting
+        weight_filter = self.coordinator.analytics.tracker('cat_weight', self.cat_id)
+        change = weight_filter.change(30, dt_util.now().date())
+        if change is None:
+            return None
+        return round(change, 2)
 
     @property
-    def native_unit_of_measurement(self) -> UnitOfTime:
-        """ Return seconds as the native unit """
+    def native_unit_of_measurement(self) -> UnitOfMass:
+        """ Return pounds as the native unit """
 
-        return UnitOfTime.SECONDS
+        return UnitOfMass.POUNDS
 
     @property
-    def device_class(self) -> SensorDeviceClass:
-        """ Return entity device class. """
+    def state_class(self) -> SensorStateClass:
+        """ Return the type of state_class """
 
-        return SensorDeviceClass.DURATION
+        return SensorStateClass.MEASUREMENT
 
     @property
     def icon(self) -> str:
-        return 'mdi:cat'
+        return 'mdi:scale-unbalanced'
 
 
-class CatRun(CoordinatorEntity, SensorEntity):
-    """ Representation of Cat's Daily Running activity """
+class Duration(CoordinatorEntity, SensorEntity):
+    """ Representation of Cat's Daily Litter Box use Duration """
 
     def __init__(self, coordinator, cat_id):
         super().__init__(coordinator)
@@ -378,6 +513,12 @@ class CatRun(CoordinatorEntity, SensorEntity):
 
         return self.coordinator.data.cats[self.cat_id]
 
+    @property
+    def available(self) -> bool:
+        """ Return True if cat data is fresh """
+
+        return super().available and self.coordinator.is_fresh('cats', self.cat_id)
+
     @property
     def device_info(self) -> dict[str, Any]:
         """ Return device registry information for this entity. """
@@ -393,13 +534,13 @@ class CatRun(CoordinatorEntity, SensorEntity):
     def unique_id(self) -> str:
         """ Sets unique ID for this entity. """
 
-        return str(self.cat_data.cat_id) + '_running'
+        return str(self.cat_data.cat_id) + '_litter_box_duration'
 
     @property
     def name(self) -> str:
         """ Return name of the entity """
 
-        return "Running"
+        return "Today's average use duration"
 
     @property
     def has_entity_name(self) -> bool:
@@ -409,9 +550,9 @@ class CatRun(CoordinatorEntity, SensorEntity):
 
     @property
     def native_value(self) -> float | int:
-        """ Return today's total running in seconds """
+        """ Return today's total duration in seconds """
 
-        return self.cat_data.running
+        return round(self.cat_data.duration, 1)
 
     @property
     def native_unit_of_measurement(self) -> UnitOfTime:
@@ -419,19 +560,13 @@ class CatRun(CoordinatorEntity, SensorEntity):
 
         return UnitOfTime.SECONDS
 
-    @property
-    def device_class(self) -> SensorDeviceClass:
-        """ Return entity device class. """
-
-        return SensorDeviceClass.DURATION
-
     @property
     def icon(self) -> str:
-        return 'mdi:run'
+        return 'mdi:clock-outline'
 
 
-class CatSleep(CoordinatorEntity, SensorEntity):
-    """ Representation of Cat's Daily Sleeping activity """
+class UseCount(CoordinatorEntity, SensorEntity):
+    """ Representation of Cat's Daily Litter Box use Count """
 
     def __init__(self, coordinator, cat_id):
         super().__init__(coordinator)
@@ -444,6 +579,12 @@ class CatSleep(CoordinatorEntity, SensorEntity):
 
         return self.coordinator.data.cats[self.cat_id]
 
+    @property
+    def available(self) -> bool:
+        """ Return True if cat data is fresh """
+
+        return super().available and self.coordinator.is_fresh('cats', self.cat_id)
+
     @property
     def device_info(self) -> dict[str, Any]:
         """ Return device registry information for this entity. """
@@ -459,13 +600,13 @@ class CatSleep(CoordinatorEntity, SensorEntity):
     def unique_id(self) -> str:
         """ Sets unique ID for this entity. """
 
-        return str(self.cat_data.cat_id) + '_sleeping'
+        return str(self.cat_data.cat_id) + '_litter_box_use_count'
 
     @property
     def name(self) -> str:
         """ Return name of the entity """
 
-        return "Sleeping"
+        return "Litter box use count"
 
     @property
     def has_entity_name(self) -> bool:
@@ -474,30 +615,24 @@ class CatSleep(CoordinatorEntity, SensorEntity):
         return True
 
     @property
-    def native_value(self) -> float | int:
-        """ Return today's total sleep in seconds """
-
-        return self.cat_data.sleeping
-
-    @property
-    def native_unit_of_measurement(self) -> UnitOfTime:
-        """ Return seconds as the native unit """
+    def native_value(self) -> int:
+        """ Return today's total count """
 
-        return UnitOfTime.SECONDS
+        return self.cat_data.poop_count
 
     @property
-    def device_class(self) -> SensorDeviceClass:
-        """ Return entity device class. """
+    def state_class(self) -> SensorStateClass:
+        """ Return the type of state_class """
 
-        return SensorDeviceClass.DURATION
+        return SensorStateClass.TOTAL_INCREASING
 
     @property
     def icon(self) -> str:
-        return 'mdi:sleep'
+        return 'mdi:numeric'
 
 
-class CatWalk(CoordinatorEntity, SensorEntity):
-    """ Representation of Cat's Daily Walking activity """
+class CatLifetimeVisits(CoordinatorEntity, SensorEntity):
+    """ Representation of Cat's lifetime visit count """
 
     def __init__(self, coordinator, cat_id):
         super().__init__(coordinator)
@@ -510,6 +645,12 @@ class CatWalk(CoordinatorEntity, SensorEntity):
 
         return self.coordinator.data.cats[self.cat_id]
 
+    @property
+    def available(self) -> bool:
+        """ Return True if cat data is fresh """
+
+        return super().available and self.coordinator.is_fresh('cats', self.cat_id)
+
     @property
     def device_info(self) -> dict[str, Any]:
         """ Return device registry information for this entity. """
@@ -525,13 +666,13 @@ class CatWalk(CoordinatorEntity, SensorEntity):
     def unique_id(self) -> str:
         """ Sets unique ID for this entity. """
 
-        return str(self.cat_data.cat_id) + '_walking'
+        return str(self.cat_data.cat_id) + '_lifetime_visits'
 
     @property
     def name(self) -> str:
         """ Return name of the entity """
 
-        return "Walking"
+        return "Lifetime litter box visits"
 
     @property
     def has_entity_name(self) -> bool:
@@ -540,30 +681,30 @@ class CatWalk(CoordinatorEntity, SensorEntity):
         return True
 
     @property
-    def native_value(self) -> float | int:
-        """ Return today's total walking in seconds """
+    def lifetime(self) -> LifetimeCounter:
+        """ Handle Cat's lifetime counters """
 
-        return self.cat_data.walking
+        return self.coordinator.analytics.tracker('cat_lifetime', self.cat_id)
 
     @property
-    def native_unit_of_measurement(self) -> UnitOfTime:
-        """ Return seconds as the native unit """
+    def native_value(self) -> int:
+        """ Return total litter box visits counted for the cat """
 
-        return UnitOfTime.SECONDS
+        return int(self.lifetime.totals['visits'])
 
     @property
-    def device_class(self) -> SensorDeviceClass:
-        """ Return entity device class. """
+    def state_class(self) -> SensorStateClass:
+        """ Return the type of state_class """
 
-        return SensorDeviceClass.DURATION
+        return SensorStateClass.TOTAL_INCREASING
 
     @property
     def icon(self) -> str:
-        return 'mdi:walk'
+        return 'mdi:counter'
 
 
-class CatZoomies(CoordinatorEntity, SensorEntity):
-    """ Representation of Cat's Daily Zoomies """
+class CatLifetimeDuration(CoordinatorEntity, SensorEntity):
+    """ Representation of Cat's lifetime time in the litter box """
 
     def __init__(self, coordinator, cat_id):
         super().__init__(coordinator)
@@ -576,6 +717,12 @@ class CatZoomies(CoordinatorEntity, SensorEntity):
 
         return self.coordinator.data.cats[self.cat_id]
 
+    @property
+    def available(self) -> bool:
+        """ Return True if cat data is fresh """
+
+        return super().available and self.coordinator.is_fresh('cats', self.cat_id)
+
     @property
     def device_info(self) -> dict[str, Any]:
         """ Return device registry information for this entity. """
@@ -591,13 +738,13 @@ class CatZoomies(CoordinatorEntity, SensorEntity):
     def unique_id(self) -> str:
         """ Sets unique ID for this entity. """
 
-        return str(self.cat_data.cat_id) + '_zoomies'
+        return str(self.cat_data.cat_id) + '_lifetime_duration'
 
     @property
     def name(self) -> str:
         """ Return name of the entity """
 
-        return "Zoomies"
+        return "Lifetime litter box time"
 
     @property
     def has_entity_name(self) -> bool:
@@ -606,53 +753,82 @@ class CatZoomies(CoordinatorEntity, SensorEntity):
         return True
 
     @property
-    def native_value(self) -> float | int:
-        """ Return today's total zoomies """
+    def lifetime(self) -> LifetimeCounter:
+        """ Handle Cat's lifetime counters """
 
-        return self.cat_data.zoomies
+        return self.coordinator.analytics.tracker('cat_lifetime', self.cat_id)
+
+    @property
+    def native_value(self) -> int:
+        """ Return total seconds the cat has spent in the litter box """
+
+        return round(self.lifetime.totals['duration'])
+
+    @property
+    def native_unit_of_measurement(self) -> UnitOfTime:
+        """ Return seconds as the native unit """
+
+        return UnitOfTime.SECONDS
+
+    @property
+    def device_class(self) -> SensorDeviceClass:
+        """ Return entity device class """
+
+        return SensorDeviceClass.DURATION
+
+    @property
+    def state_class(self) -> SensorStateClass:
+        """ Return the type of state_class """
+
+        return SensorStateClass.TOTAL_INCREASING
 
     @property
     def icon(self) -> str:
-        return 'mdi:run-fast'
+        return 'mdi:timer-outline'
 
 
-class Humidity(CoordinatorEntity, SensorEntity):
-    """ Representation of Litter Box Humidity """
+class CatRest(CoordinatorEntity, SensorEntity):
+    """ Representation of Cat's Daily Resting activity """
 
-    def __init__(self, coordinator, device_id):
+    def __init__(self, coordinator, cat_id):
         super().__init__(coordinator)
-        self.device_id = device_id
+        self.cat_id = cat_id
 
 
     @property
-    def device_data(self) -> LitterBox:
-        """ Handle coordinator litter box data """
+    def cat_data(self) -> Cat:
+        """ Handle coordinator cat data """
 
-        return self.coordinator.data.litterboxes[self.device_id]
+        return self.coordinator.data.cats[self.cat_id]
+
+    @property
+    def available(self) -> bool:
+        """ Return True if cat data is fresh """
+
+        return super().available and self.coordinator.is_fresh('cats', self.cat_id)
 
     @property
     def device_info(self) -> dict[str, Any]:
         """ Return device registry information for this entity. """
 
         return {
-            "identifiers": {(DOMAIN, self.device_data.device_id), (DOMAIN, self.device_data.iot_code_tail)},
-            "name": self.device_data.device_name,
+            "identifiers": {(DOMAIN, self.cat_data.cat_id)},
+            "name": self.cat_data.cat_name,
             "manufacturer": "PurrSong",
-            "model": "Lavviebot S",
-            "sw_version": self.device_data.current_firmware
+            "model": "Cat",
         }
 
     @property
     def unique_id(self) -> str:
         """ Sets unique ID for this entity. """
 
-        return str(self.device_data.device_id) + '_humidity'
+        return str(self.cat_data.cat_id) + '_resting'
 
     @property
     def name(self) -> str:
         """ Return name of the entity """
 
-        return "Humidity"
+        return "Resting"
 
     @property
     def has_entity_name(self) -> bool:
@@ -661,32 +837,2872 @@ class Humidity(CoordinatorEntity, SensorEntity):
         return True
 
     @property
-    def native_value(self) -> int:
-        """ Return current humidity """
+    def native_value(self) -> float | int:
+        """ Return today's total resting in seconds """
 
-        return self.device_data.humidity
+        return self.cat_data.resting
 
     @property
-    def native_unit_of_measurement(self) -> str:
-        """ Return percent as the native unit """
+    def native_unit_of_measurement(self) -> UnitOfTime:
+        """ Return seconds as the native unit """
 
-        return PERCENTAGE
+        return UnitOfTime.SECONDS
 
     @property
     def device_class(self) -> SensorDeviceClass:
-        """ Return entity device class """
+        """ Return entity device class. """
 
-        return SensorDeviceClass.HUMIDITY
+        return SensorDeviceClass.DURATION
 
     @property
-    def state_class(self) -> SensorStateClass:
-        """ Return the type of state class """
+    def icon(self) -> str:
+        return 'mdi:cat'
 
-        return SensorStateClass.MEASUREMENT
 
+class CatRun(CoordinatorEntity, SensorEntity):
+    """ Representation of Cat's Daily Running activity """
+
+    def __init__(self, coordinator, cat_id):
+        super().__init__(coordinator)
+        self.cat_id = cat_id
+
+
+    @property
+    def cat_data(self) -> Cat:
+        """ Handle coordinator cat data """
+
+        return self.coordinator.data.cats[self.cat_id]
+
+    @property
+    def available(self) -> bool:
+        """ Return True if cat data is fresh """
+
+        return super().available and self.coordinator.is_fresh('cats', self.cat_id)
+
+    @property
+    def device_info(self) -> dict[str, Any]:
+        """ Return device registry information for this entity. """
+
+        return {
+            "identifiers": {(DOMAIN, self.cat_data.cat_id)},
+            "name": self.cat_data.cat_name,
+            "manufacturer": "PurrSong",
+            "model": "Cat",
+        }
+
+    @property
+    def unique_id(self) -> str:
+        """ Sets unique ID for this entity. """
+
+        return str(self.cat_data.cat_id) + '_running'
+
+    @property
+    def name(self) -> str:
+        """ Return name of the entity """
+
+        return "Running"
+
+    @property
+    def has_entity_name(self) -> bool:
+        """ Indicate that entity has name defined """
+
+        return True
+
+    @property
+    def native_value(self) -> float | int:
+        """ Return today's total running in seconds """
+
+        return self.cat_data.running
+
+    @property
+    def native_unit_of_measurement(self) -> UnitOfTime:
+        """ Return seconds as the native unit """
+
+        return UnitOfTime.SECONDS
+
+    @property
+    def device_class(self) -> SensorDeviceClass:
+        """ Return entity device class. """
+
+        return SensorDeviceClass.DURATION
+
+    @property
+    def icon(self) -> str:
+        return 'mdi:run'
+
+
+class CatSleep(CoordinatorEntity, SensorEntity):
+    """ Representation of Cat's Daily Sleeping activity """
+
+    def __init__(self, coordinator, cat_id):
+        super().__init__(coordinator)
+        self.cat_id = cat_id
+
+
+    @property
+    def cat_data(self) -> Cat:
+        """ Handle coordinator cat data """
+
+        return self.coordinator.data.cats[self.cat_id]
+
+    @property
+    def available(self) -> bool:
+        """ Return True if cat data is fresh """
+
+        return super().available and self.coordinator.is_fresh('cats', self.cat_id)
+
+    @property
+    def device_info(self) -> dict[str, Any]:
+        """ Return device registry information for this entity. """
+
+        return {
+            "identifiers": {(DOMAIN, self.cat_data.cat_id)},
+            "name": self.cat_data.cat_name,
+            "manufacturer": "PurrSong",
+            "model": "Cat",
+        }
+
+    @property
+    def unique_id(self) -> str:
+        """ Sets unique ID for this entity. """
+
+        return str(self.cat_data.cat_id) + '_sleeping'
+
+    @property
+    def name(self) -> str:
+        """ Return name of the entity """
+
+        return "Sleeping"
+
+    @property
+    def has_entity_name(self) -> bool:
+        """ Indicate that entity has name defined """
+
+        return True
+
+    @property
+    def native_value(self) -> float | int:
+        """ Return today's total sleep in seconds """
+
+        return self.cat_data.sleeping
+
+    @property
+    def native_unit_of_measurement(self) -> UnitOfTime:
+        """ Return seconds as the native unit """
+
+        return UnitOfTime.SECONDS
+
+    @property
+    def device_class(self) -> SensorDeviceClass:
+        """ Return entity device class. """
+
+        return SensorDeviceClass.DURATION
+
+    @property
+    def icon(self) -> str:
+        return 'mdi:sleep'
+
+
+class CatWalk(CoordinatorEntity, SensorEntity):
+    """ Representation of Cat's Daily Walking activity """
+
+    def __init__(self, coordinator, cat_id):
+        super().__init__(coordinator)
+        self.cat_id = cat_id
+
+
+    @property
+    def cat_data(self) -> Cat:
+        """ Handle coordinator cat data """
+
+        return self.coordinator.data.cats[self.cat_id]
+
+    @property
+    def available(self) -> bool:
+        """ Return True if cat data is fresh """
+
+        return super().available and self.coordinator.is_fresh('cats', self.cat_id)
+
+    @property
+    def device_info(self) -> dict[str, Any]:
+        """ Return device registry information for this entity. """
+
+        return {
+            "identifiers": {(DOMAIN, self.cat_data.cat_id)},
+            "name": self.cat_data.cat_name,
+            "manufacturer": "PurrSong",
+            "model": "Cat",
+        }
+
+    @property
+    def unique_id(self) -> str:
+        """ Sets unique ID for this entity. """
+
+        return str(self.cat_data.cat_id) + '_walking'
+
+    @property
+    def name(self) -> str:
+        """ Return name of the entity """
+
+        return "Walking"
+
+    @property
+    def has_entity_name(self) -> bool:
+        """ Indicate that entity has name defined """
+
+        return True
+
+    @property
+    def native_value(self) -> float | int:
+        """ Return today's total walking in seconds """
+
+        return self.cat_data.walking
+
+    @property
+    def native_unit_of_measurement(self) -> UnitOfTime:
+        """ Return seconds as the native unit """
+
+        return UnitOfTime.SECONDS
+
+    @property
+    def device_class(self) -> SensorDeviceClass:
+        """ Return entity device class. """
+
+        return SensorDeviceClass.DURATION
+
+    @property
+    def icon(self) -> str:
+        return 'mdi:walk'
+
+
+class CatZoomies(CoordinatorEntity, SensorEntity):
+    """ Representation of Cat's Daily Zoomies """
+
+    def __init__(self, coordinator, cat_id):
+        super().__init__(coordinator)
+        self.cat_id = cat_id
+
+
+    @property
+    def cat_data(self) -> Cat:
+        """ Handle coordinator cat data """
+
+        return self.coordinator.data.cats[self.cat_id]
+
+    @property
+    def available(self) -> bool:
+        """ Return True if cat data is fresh """
+
+        return super().available and self.coordinator.is_fresh('cats', self.cat_id)
+
+    @property
+    def device_info(self) -> dict[str, Any]:
+        """ Return device registry information for this entity. """
+
+        return {
+            "identifiers": {(DOMAIN, self.cat_data.cat_id)},
+            "name": self.cat_data.cat_name,
+            "manufacturer": "PurrSong",
+            "model": "Cat",
+        }
+
+    @property
+    def unique_id(self) -> str:
+        """ Sets unique ID for this entity. """
+
+        return str(self.cat_data.cat_id) + '_zoomies'
+
+    @property
+    def name(self) -> str:
+        """ Return name of the entity """
+
+        return "Zoomies"
+
+    @property
+    def has_entity_name(self) -> bool:
+        """ Indicate that entity has name defined """
+
+        return True
+
+    @property
+    def native_value(self) -> float | int:
+        """ Return today's total zoomies """
+
+        return self.cat_data.zoomies
+
+    @property
+    def icon(self) -> str:
+        return 'mdi:run-fast'
+
+
+class CatActiveLastHour(CoordinatorEntity, SensorEntity):
+    """ Representation of Cat's active time in the last full hour """
+
+    def __init__(self, coordinator, cat_id):
+        super().__init__(coordinator)
+        self.cat_id = cat_id
+
+
+    @property
+    def cat_data(self) -> Cat:
+        """ Handle coordinator cat data """
+
+        return self.coordinator.data.cats[self.cat_id]
+
+    @property
+    def available(self) -> bool:
+        """ Return True if cat data is fresh """
+
+        return super().available and self.coordinator.is_fresh('cats', self.cat_id)
+
+    @property
+    def device_info(self) -> dict[str, Any]:
+        """ Return device registry information for this entity. """
+
+        return {
+            "identifiers": {(DOMAIN, self.cat_data.cat_id)},
+            "name": self.cat_data.cat_name,
+            "manufacturer": "PurrSong",
+            "model": "Cat",
+        }
+
+    @property
+    def unique_id(self) -> str:
+        """ Sets unique ID for this entity. """
+
+        return str(self.cat_data.cat_id) + '_active_last_hour'
+
+    @property
+    def name(self) -> str:
+        """ Return name of the entity """
+
+        return "Active time (last hour)"
+
+    @property
+    def has_entity_name(self) -> bool:
+        """ Indicate that entity has name defined """
+
+        return True
+
+    @property
+    def activity_rollup(self) -> ActivityRollup:
+        """ Handle cat activity rollup """
+
+        return self.coordinator.analytics.tracker('cat_activity', self.cat_id)
+
+    @property
+    def hour_totals(self) -> dict[str, float]:
+        """ Return activity totals for the last full hour """
+
+        return self.activity_rollup.hour_totals(dt_util.now(), hours_ago=1)
+
+    @property
+    def native_value(self) -> float:
+        """ Return running and walking seconds in the last full hour """
+
+        return ActivityRollup.active(self.hour_totals)
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """ Return each activity in the last full hour """
+
+        return {activity: round(total) for activity, total in self.hour_totals.items()}
+
+    @property
+    def native_unit_of_measurement(self) -> UnitOfTime:
+        """ Return seconds as the native unit """
+
+        return UnitOfTime.SECONDS
+
+    @property
+    def device_class(self) -> SensorDeviceClass:
+        """ Return entity device class """
+
+        return SensorDeviceClass.DURATION
+
+    @property
+    def icon(self) -> str:
+        return 'mdi:timer-outline'
+
+
+class CatActiveWeek(CoordinatorEntity, SensorEntity):
+    """ Representation of Cat's active time over the last 7 days """
+
+    def __init__(self, coordinator, cat_id):
+        super().__init__(coordinator)
+        self.cat_id = cat_id
+
+
+    @property
+    def cat_data(self) -> Cat:
+        """ Handle coordinator cat data """
+
+        return self.coordinator.data.cats[self.cat_id]
+
+    @property
+    def available(self) -> bool:
+        """ Return True if cat data is fresh """
+
+        return super().available and self.coordinator.is_fresh('cats', self.cat_id)
+
+    @property
+    def device_info(self) -> dict[str, Any]:
+        """ Return device registry information for this entity. """
+
+        return {
+            "identifiers": {(DOMAIN, self.cat_data.cat_id)},
+            "name": self.cat_data.cat_name,
+            "manufacturer": "PurrSong",
+            "model": "Cat",
+        }
+
+    @property
+    def unique_id(self) -> str:
+        """ Sets unique ID for this entity. """
+
+        return str(self.cat_data.cat_id) + '_active_week'
+
+    @property
+    def name(self) -> str:
+        """ Return name of the entity """
+
+        return "Active time (7 days)"
+
+    @property
+    def has_entity_name(self) -> bool:
+        """ Indicate that entity has name defined """
+
+        return True
+
+    @property
+    def activity_rollup(self) -> ActivityRollup:
+        """ Handle cat activity rollup """
+
+        return self.coordinator.analytics.tracker('cat_activity', self.cat_id)
+
+    @property
+    def week_totals(self) -> dict[str, float]:
+        """ Return activity totals for today and the 6 days before """
+
+        return self.activity_rollup.week_totals(dt_util.now().date())
+
+    @property
+    def native_value(self) -> float:
+        """ Return running and walking seconds over the last 7 days """
+
+        return ActivityRollup.active(self.week_totals)
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """ Return each activity over the last 7 days """
+
+        return {activity: round(total) for activity, total in self.week_totals.items()}
+
+    @property
+    def native_unit_of_measurement(self) -> UnitOfTime:
+        """ Return seconds as the native unit """
+
+        return UnitOfTime.SECONDS
+
+    @property
+    def device_class(self) -> SensorDeviceClass:
+        """ Return entity device class """
+
+        return SensorDeviceClass.DURATION
+
+    @property
+    def icon(self) -> str:
+        return 'mdi:calendar-week'
+
+
+class CatActivityMix(CoordinatorEntity, SensorEntity):
+    """ Representation of Cat's share of active time today """
+
+    def __init__(self, coordinator, cat_id):
+        super().__init__(coordinator)
+        self.cat_id = cat_id
+
+
+    @property
+    def cat_data(self) -> Cat:
+        """ Handle coordinator cat data """
+
+        return self.coordinator.data.cats[self.cat_id]
+
+    @property
+    def available(self) -> bool:
+        """ Return True if cat data is fresh """
+
+        return super().available and self.coordinator.is_fresh('cats', self.cat_id)
+
+    @property
+    def device_info(self) -> dict[str, Any]:
+        """ Return device registry information for this entity. """
+
+        return {
+            "identifiers": {(DOMAIN, self.cat_data.cat_id)},
+            "name": self.cat_data.cat_name,
+            "manufacturer": "PurrSong",
+            "model": "Cat",
+        }
+
+    @property
+    def unique_id(self) -> str:
+        """ Sets unique ID for this entity. """
+
+        return str(self.cat_data.cat_id) + '_activity_mix'
+
+    @property
+    def name(self) -> str:
+        """ Return name of the entity """
+
+        return "Active share today"
+
+    @property
+    def has_entity_name(self) -> bool:
+        """ Indicate that entity has name defined """
+
+        return True
+
+    @property
+    def activity_rollup(self) -> ActivityRollup:
+        """ Handle cat activity rollup """
+
+        return self.coordinator.analytics.tracker('cat_activity', self.cat_id)
+
+    @property
+    def mix(self) -> dict[str, float] | None:
+        """ Return today's activity mix in percent """
+
+        return ActivityRollup.mix(self.activity_rollup.today_totals(dt_util.now().date()))
+
+    @property
+    def native_value(self) -> float | None:
+        """ Return running and walking as a percentage of today's tracked time """
+
+        if self.mix is None:
+            return None
+        return round(sum(self.mix[activity] for activity in ACTIVE), 1)
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """ Return each activity as a percentage of today's tracked time """
+
+        if self.mix is None:
+            return {}
+        return {activity: round(share, 1) for activity, share in self.mix.items()}
+
+    @property
+    def native_unit_of_measurement(self) -> str:
+        """ Return percent as the native unit """
+
+        return PERCENTAGE
+
+    @property
+    def state_class(self) -> SensorStateClass:
+        """ Return the type of state_class """
+
+        return SensorStateClass.MEASUREMENT
+
+    @property
+    def icon(self) -> str:
+        return 'mdi:chart-pie'
+
+
+class CatActivityBaseline(CoordinatorEntity, SensorEntity):
+    """ Representation of Cat's activity compared with its 7-day average """
+
+    def __init__(self, coordinator, cat_id):
+        super().__init__(coordinator)
+        self.cat_id = cat_id
+
+
+    @property
+    def cat_data(self) -> Cat:
+        """ Handle coordinator cat data """
+
+        return self.coordinator.data.cats[self.cat_id]
+
+    @property
+    def available(self) -> bool:
+        """ Return True if cat data is fresh """
+
+        return super().available and self.coordinator.is_fresh('cats', self.cat_id)
+
+    @property
+    def device_info(self) -> dict[str, Any]:
+        """ Return device registry information for this entity. """
+
+        return {
+            "identifiers": {(DOMAIN, self.cat_data.cat_id)},
+            "name": self.cat_data.cat_name,
+            "manufacturer": "PurrSong",
+            "model": "Cat",
+        }
+
+    @property
+    def unique_id(self) -> str:
+        """ Sets unique ID for this entity. """
+
+        return str(self.cat_data.cat_id) + '_activity_vs_baseline'
+
+    @property
+    def name(self) -> str:
+        """ Return name of the entity """
+
+        return "Activity vs 7-day average"
+
+    @property
+    def has_entity_name(self) -> bool:
+        """ Indicate that entity has name defined """
+
+        return True
+
+    @property
+    def activity_rollup(self) -> ActivityRollup:
+        """ Handle cat activity rollup """
+
+        return self.coordinator.analytics.tracker('cat_activity', self.cat_id)
+
+    @property
+    def native_value(self) -> float | None:
+        """ Return active time over the last 24 hours as a percentage of the 7-day daily average """
+
+        baseline = self.activity_rollup.baseline(dt_util.now().date())
+        if baseline is None or not ActivityRollup.active(baseline):
+            return None
+        last_day = self.activity_rollup.last_day_totals(dt_util.now())
+        return round(ActivityRollup.active(last_day) / ActivityRollup.active(baseline) * 100, 1)
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """ Return active time over the last 24 hours and the daily average """
+
+        baseline = self.activity_rollup.baseline(dt_util.now().date())
+        last_day = self.activity_rollup.last_day_totals(dt_util.now())
+        return {
+            "last_24_hours": round(ActivityRollup.active(last_day)),
+            "daily_average": None if baseline is None else round(ActivityRollup.active(baseline)),
+        }
+
+    @property
+    def native_unit_of_measurement(self) -> str:
+        """ Return percent as the native unit """
+
+        return PERCENTAGE
+
+    @property
+    def state_class(self) -> SensorStateClass:
+        """ Return the type of state_class """
+
+        return SensorStateClass.MEASUREMENT
+
+    @property
+    def icon(self) -> str:
+        return 'mdi:chart-timeline-variant'
+
+
+class Humidity(CoordinatorEntity, SensorEntity):
+    """ Representation of Litter Box Humidity """
+
+    def __init__(self, coordinator, device_id):
+        super().__init__(coordinator)
+        self.device_id = device_id
+        self.deadband = Deadband(self.device_data.humidity, dt_util.utcnow())
+
+
+    @property
+    def device_data(self) -> LitterBox:
+        """ Handle coordinator litter box data """
+
+        return self.coordinator.data.litterboxes[self.device_id]
+
+    @property
+    def available(self) -> bool:
+        """ Return True if litter box data is fresh """
+
+        return super().available and self.coordinator.is_fresh('litterboxes', self.device_id)
+
+    @property
+    def device_info(self) -> dict[str, Any]:
+        """ Return device registry information for this entity. """
+
+        return {
+            "identifiers": {(DOMAIN, self.device_data.device_id), (DOMAIN, self.device_data.iot_code_tail)},
+            "name": self.device_data.device_name,
+            "manufacturer": "PurrSong",
+            "model": "Lavviebot S",
+            "sw_version": self.device_data.current_firmware
+        }
+
+    @property
+    def unique_id(self) -> str:
+        """ Sets unique ID for this entity. """
+
+        return str(self.device_data.device_id) + '_humidity'
+
+    @property
+    def name(self) -> str:
+        """ Return name of the entity """
+
+        return "Humidity"
+
+    @property
+    def has_entity_name(self) -> bool:
+        """ Indicate that entity has name defined """
+
+        return True
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """ Only report values that moved past the deadband. """
+
+        if self.device_id in self.coordinator.updated_ids['litterboxes']:
+            settings = self.coordinator.deadband_settings('humidity')
+            self.deadband.update(self.device_data.humidity, dt_util.utcnow(), *settings)
+        super()._handle_coordinator_update()
+
+    @property
+    def native_value(self) -> int:
+        """ Return current humidity """
+
+        return self.deadband.value
+
+    @property
+    def native_unit_of_measurement(self) -> str:
+        """ Return percent as the native unit """
+
+        return PERCENTAGE
+
+    @property
+    def device_class(self) -> SensorDeviceClass:
+        """ Return entity device class """
+
+        return SensorDeviceClass.HUMIDITY
+
+    @property
+    def state_class(self) -> SensorStateClass:
+        """ Return the type of state class """
+
+        return SensorStateClass.MEASUREMENT
+
+
+class Temperature(CoordinatorEntity, SensorEntity):
+    """ Representation of Litter Box Temperature """
+
+    def __init__(self, coordinator, device_id):
+        super().__init__(coordinator)
+        self.device_id = device_id
+        self.deadband = Deadband(self.device_data.temperature_c, dt_util.utcnow())
+
+
+    @property
+    def device_data(self) -> LitterBox:
+        """ Handle coordinator litter box data """
+
+        return self.coordinator.data.litterboxes[self.device_id]
+
+    @property
+    def available(self) -> bool:
+        """ Return True if litter box data is fresh """
+
+        return super().available and self.coordinator.is_fresh('litterboxes', self.device_id)
+
+    @property
+    def device_info(self) -> dict[str, Any]:
+        """ Return device registry information for this entity. """
+
+        return {
+            "identifiers": {(DOMAIN, self.device_data.device_id), (DOMAIN, self.device_data.iot_code_tail)},
+            "name": self.device_data.device_name,
+            "manufacturer": "PurrSong",
+            "model": "Lavviebot S",
+            "sw_version": self.device_data.current_firmware
+        }
+
+    @property
+    def unique_id(self) -> str:
+        """ Sets unique ID for this entity. """
+
+        return str(self.device_data.device_id) + '_temperature'
+
+    @property
+    def name(self) -> str:
+        """ Return name of the entity """
+
+        return "Temperature"
+
+    @property
+    def has_entity_name(self) -> bool:
+        """ Indicate that entity has name defined """
+
+        return True
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """ Only report values that moved past the deadband. """
+
+        if self.device_id in self.coordinator.updated_ids['litterboxes']:
+            settings = self.coordinator.deadband_settings('temperature')
+            self.deadband.update(self.device_data.temperature_c, dt_util.utcnow(), *settings)
+        super()._handle_coordinator_update()
+
+    @property
+    def native_value(self) -> int:
+        """ Return current temperature in Celsius """
+
+        return self.deadband.value
+
+    @property
+    def native_unit_of_measurement(self) -> UnitOfTemperature:
+        """ Return Celsius as the native unit """
+
+        return UnitOfTemperature.CELSIUS
+
+    @property
+    def device_class(self) -> SensorDeviceClass:
+        """ Return entity device class """
+
+        return SensorDeviceClass.TEMPERATURE
+
+    @property
+    def state_class(self) -> SensorStateClass:
+        """ Return the type of state class """
+
+        return SensorStateClass.MEASUREMENT
+
+
+class BeaconBattery(CoordinatorEntity, SensorEntity):
+    """ Representation of Beacon Battery Level """
+
+    def __init__(self, coordinator, device_id):
+        super().__init__(coordinator)
+        self.device_id = device_id
+
+
+    @property
+    def device_data(self) -> LitterBox:
+        """ Handle coordinator litter box data """
+
+        return self.coordinator.data.litterboxes[self.device_id]
+
+    @property
+    def available(self) -> bool:
+        """ Return True if litter box data is fresh """
+
+        return super().available and self.coordinator.is_fresh('litterboxes', self.device_id)
+
+    @property
+    def device_info(self) -> dict[str, Any]:
+        """ Return device registry information for this entity. """
+
+        return {
+            "identifiers": {(DOMAIN, self.device_data.device_id), (DOMAIN, self.device_data.iot_code_tail)},
+            "name": self.device_data.device_name,
+            "manufacturer": "PurrSong",
+            "model": "Lavviebot S",
+            "sw_version": self.device_data.current_firmware
+        }
+
+    @property
+    def unique_id(self) -> str:
+        """ Sets unique ID for this entity. """
+
+        return str(self.device_data.device_id) + '_beacon_battery'
+
+    @property
+    def name(self) -> str:
+        """ Return name of the entity """
+
+        return "Beacon battery"
+
+    @property
+    def has_entity_name(self) -> bool:
+        """ Indicate that entity has name defined """
+
+        return True
+
+    @property
+    def native_value(self) -> int:
+        """ Return current battery level or 0 if there isn't one """
+
+        if self.device_data.beacon_battery is not None:
+            return self.device_data.beacon_battery
+        else:
+            return 0
+
+    @property
+    def native_unit_of_measurement(self) -> str:
+        """ Uses percentage as the unit """
+
+        return PERCENTAGE
+
+    @property
+    def device_class(self) -> SensorDeviceClass:
+        """ Return entity device class """
+
+        return SensorDeviceClass.BATTERY
+
+    @property
+    def state_class(self) -> SensorStateClass:
+        """ Return the type of state class """
+
+        return SensorStateClass.MEASUREMENT
+
+    @property
+    def entity_category(self) -> EntityCategory:
+        """ Set category to diagnostic. """
+
+        return EntityCategory.DIAGNOSTIC
+
+
+class BeaconBatteryDrainRate(CoordinatorEntity, SensorEntity):
+    """ Representation of LavvieBeacon battery drain rate """
+
+    def __init__(self, coordinator, device_id):
+        super().__init__(coordinator)
+        self.device_id = device_id
+
+
+    @property
+    def device_data(self) -> LitterBox:
+        """ Handle coordinator litter box data """
+
+        return self.coordinator.data.litterboxes[self.device_id]
+
+    @property
+    def available(self) -> bool:
+        """ Return True if litter box data is fresh """
+
+        return super().available and self.coordinator.is_fresh('litterboxes', self.device_id)
+
+    @property
+    def device_info(self) -> dict[str, Any]:
+        """ Return device registry information for this entity. """
+
+        return {
+            "identifiers": {(DOMAIN, self.device_data.device_id), (DOMAIN, self.device_data.iot_code_tail)},
+            "name": self.device_data.device_name,
+            "manufacturer": "PurrSong",
+            "model": "Lavviebot S",
+            "sw_version": self.device_data.current_firmware
+        }
+
+    @property
+    def unique_id(self) -> str:
+        """ Sets unique ID for this entity. """
+
+        return str(self.device_data.device_id) + '_beacon_battery_drain_rate'
+
+    @property
+    def name(self) -> str:
+        """ Return name of the entity """
+
+        return "Beacon battery drain rate"
+
+    @property
+    def has_entity_name(self) -> bool:
+        """ Indicate that entity has name defined """
+
+        return True
+
+    @property
+    def battery_model(self) -> BatteryModel:
+        """ Handle beacon battery model """
+
+        return self.coordinator.analytics.tracker('beacon_battery', self.device_id)
+
+    @property
+    def native_value(self) -> float | None:
+        """ Return battery drain in percent per day """
+
+        if self.battery_model.drain_rate is None:
+            return None
+        return round(self.battery_model.drain_rate, 2)
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """ Return battery replacement count and time """
+
+        replaced_at = self.battery_model.replaced_at
+        return {
+            "replacements": self.battery_model.replacements,
+            "last_replaced": None if replaced_at is None else dt_util.utc_from_timestamp(replaced_at).isoformat(),
+        }
+
+    @property
+    def native_unit_of_measurement(self) -> str:
+        """ Return percent per day as the native unit """
+
+        return f'{PERCENTAGE}/{UnitOfTime.DAYS}'
+
+    @property
+    def state_class(self) -> SensorStateClass:
+        """ Return the type of state_class """
+
+        return SensorStateClass.MEASUREMENT
+
+    @property
+    def entity_category(self) -> EntityCategory:
+        """ Set category to diagnostic. """
+
+        return EntityCategory.DIAGNOSTIC
+
+    @property
+    def icon(self) -> str:
+        return 'mdi:battery-arrow-down'
+
+
+class BeaconBatteryEmptyIn(CoordinatorEntity, SensorEntity):
+    """ Representation of LavvieBeacon days until battery is empty """
+
+    def __init__(self, coordinator, device_id):
+        super().__init__(coordinator)
+        self.device_id = device_id
+
+
+    @property
+    def device_data(self) -> LitterBox:
+        """ Handle coordinator litter box data """
+
+        return self.coordinator.data.litterboxes[self.device_id]
+
+    @property
+    def available(self) -> bool:
+        """ Return True if litter box data is fresh """
+
+        return super().available and self.coordinator.is_fresh('litterboxes', self.device_id)
+
+    @property
+    def device_info(self) -> dict[str, Any]:
+        """ Return device registry information for this entity. """
+
+        return {
+            "identifiers": {(DOMAIN, self.device_data.device_id), (DOMAIN, self.device_data.iot_code_tail)},
+            "name": self.device_data.device_name,
+            "manufacturer": "PurrSong",
+            "model": "Lavviebot S",
+            "sw_version": self.device_data.current_firmware
+        }
+
+    @property
+    def unique_id(self) -> str:
+        """ Sets unique ID for this entity. """
+
+        return str(self.device_data.device_id) + '_beacon_battery_empty_in'
+
+    @property
+    def name(self) -> str:
+        """ Return name of the entity """
+
+        return "Beacon battery empty in"
+
+    @property
+    def has_entity_name(self) -> bool:
+        """ Indicate that entity has name defined """
+
+        return True
+
+    @property
+    def battery_model(self) -> BatteryModel:
+        """ Handle beacon battery model """
+
+        return self.coordinator.analytics.tracker('beacon_battery', self.device_id)
+
+    @property
+    def native_value(self) -> float | None:
+        """ Return days until battery is predicted to be empty """
+
+        days = self.battery_model.days_remaining(dt_util.utcnow())
+        if days is None:
+            return None
+        return round(days, 1)
+
+    @property
+    def native_unit_of_measurement(self) -> UnitOfTime:
+        """ Return days as the native unit """
+
+        return UnitOfTime.DAYS
+
+    @property
+    def device_class(self) -> SensorDeviceClass:
+        """ Return entity device class """
+
+        return SensorDeviceClass.DURATION
+
+    @property
+    def entity_category(self) -> EntityCategory:
+        """ Set category to diagnostic. """
+
+        return EntityCategory.DIAGNOSTIC
+
+    @property
+    def icon(self) -> str:
+        return 'mdi:battery-clock'
+
+
+class LastCatUsed(CoordinatorEntity, SensorEntity):
+    """ Representation of last cat to have used the litter box """
+
+    def __init__(self, coordinator, device_id):
+        super().__init__(coordinator)
+        self.device_id = device_id
+
+
+    @property
+    def device_data(self) -> LitterBox:
+        """ Handle coordinator litter box data """
+
+        return self.coordinator.data.litterboxes[self.device_id]
+
+    @property
+    def available(self) -> bool:
+        """ Return True if litter box data is fresh """
+
+        return super().available and self.coordinator.is_fresh('litterboxes', self.device_id)
+
+    @property
+    def device_info(self) -> dict[str, Any]:
+        """ Return device registry information for this entity. """
+
+        return {
+            "identifiers": {(DOMAIN, self.device_data.device_id), (DOMAIN, self.device_data.iot_code_tail)},
+            "name": self.device_data.device_name,
+            "manufacturer": "PurrSong",
+            "model": "Lavviebot S",
+            "sw_version": self.device_data.current_firmware
+        }
+
+    @property
+    def unique_id(self) -> str:
+        """ Sets unique ID for this entity. """
+
+        return str(self.device_data.device_id) + '_last_cat_used'
+
+    @property
+    def name(self) -> str:
+        """ Return name of the entity """
+
+        return "Last cat used"
+
+    @property
+    def has_entity_name(self) -> bool:
+        """ Indicate that entity has name defined """
+
+        return True
+
+    @property
+    def native_value(self) -> str:
+        """ Return name of last cat to have used the litter box """
+
+        return self.device_data.last_cat_used_name
+
+    @property
+    def icon(self) -> str:
+        return 'mdi:cat'
+
+
+class LastSeen(CoordinatorEntity, SensorEntity):
+    """ Representation of last date/time litter box connected to PurrSong servers """
+
+    def __init__(self, coordinator, device_id):
+        super().__init__(coordinator)
+        self.device_id = device_id
+
+
+    @property
+    def device_data(self) -> LitterBox:
+        """ Handle coordinator litter box data """
+
+        return self.coordinator.data.litterboxes[self.device_id]
+
+    @property
+    def available(self) -> bool:
+        """ Return True if litter box data is fresh """
+
+        return super().available and self.coordinator.is_fresh('litterboxes', self.device_id)
+
+    @property
+    def device_info(self) -> dict[str, Any]:
+        """ Return device registry information for this entity. """
+
+        return {
+            "identifiers": {(DOMAIN, self.device_data.device_id), (DOMAIN, self.device_data.iot_code_tail)},
+            "name": self.device_data.device_name,
+            "manufacturer": "PurrSong",
+            "model": "Lavviebot S",
+            "sw_version": self.device_data.current_firmware
+        }
+
+    @property
+    def unique_id(self) -> str:
+        """ Sets unique ID for this entity. """
+
+        return str(self.device_data.device_id) + '_last_seen'
+
+    @property
+    def name(self) -> str:
+        """ Return name of the entity """
+
+        return "Last seen"
+
+    @property
+    def has_entity_name(self) -> bool:
+        """ Indicate that entity has name defined """
+
+        return True
+
+    @property
+    def native_value(self) -> datetime:
+        """ Returns date/time of the last time litter box connected to PurrSong servers """
+
+        return self.device_data.last_seen
+
+    @property
+    def device_class(self) -> SensorDeviceClass:
+        """ Return entity device class """
+
+        return SensorDeviceClass.TIMESTAMP
+
+    @property
+    def entity_category(self) -> EntityCategory:
+        """ Set category to diagnostic. """
+
+        return EntityCategory.DIAGNOSTIC
+
+    @property
+    def icon(self) -> str:
+        return 'mdi:web'
+
+
+class DataRefreshed(CoordinatorEntity, SensorEntity):
+    """ Representation of when litter box last had good data from PurrSong servers """
+
+    def __init__(self, coordinator, device_id):
+        super().__init__(coordinator)
+        self.device_id = device_id
+
+
+    @property
+    def device_data(self) -> LitterBox:
+        """ Handle coordinator litter box data """
+
+        return self.coordinator.data.litterboxes[self.device_id]
+
+    @property
+    def available(self) -> bool:
+        """ Refresh time is known even when the data is stale """
+
+        return True
+
+    @property
+    def device_info(self) -> dict[str, Any]:
+        """ Return device registry information for this entity. """
+
+        return {
+            "identifiers": {(DOMAIN, self.device_data.device_id), (DOMAIN, self.device_data.iot_code_tail)},
+            "name": self.device_data.device_name,
+            "manufacturer": "PurrSong",
+            "model": "Lavviebot S",
+            "sw_version": self.device_data.current_firmware
+        }
+
+    @property
+    def unique_id(self) -> str:
+        """ Sets unique ID for this entity. """
+
+        return str(self.device_data.device_id) + '_data_refreshed'
+
+    @property
+    def name(self) -> str:
+        """ Return name of the entity """
+
+        return "Data refreshed"
+
+    @property
+    def has_entity_name(self) -> bool:
+        """ Indicate that entity has name defined """
+
+        return True
+
+    @property
+    def native_value(self) -> datetime | None:
+        """ Returns date/time litter box data was last successfully refreshed """
+
+        return self.coordinator.refreshed_at['litterboxes'].get(self.device_id)
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """ Return whether the data is still fresh """
+
+        return {
+            "fresh": self.coordinator.is_fresh('litterboxes', self.device_id),
+        }
+
+    @property
+    def device_class(self) -> SensorDeviceClass:
+        """ Return entity device class """
+
+        return SensorDeviceClass.TIMESTAMP
+
+    @property
+    def entity_category(self) -> EntityCategory:
+        """ Set category to diagnostic. """
+
+        return EntityCategory.DIAGNOSTIC
+
+    @property
+    def icon(self) -> str:
+        return 'mdi:cloud-refresh'
+
+
+class LastUsed(CoordinatorEntity, SensorEntity):
+    """ Representation of last date/time litter box was used by a cat """
+
+    def __init__(self, coordinator, device_id):
+        super().__init__(coordinator)
+        self.device_id = device_id
+
+
+    @property
+    def device_data(self) -> LitterBox:
+        """ Handle coordinator litter box data """
+
+        return self.coordinator.data.litterboxes[self.device_id]
+
+    @property
+    def available(self) -> bool:
+        """ Return True if litter box data is fresh """
+
+        return super().available and self.coordinator.is_fresh('litterboxes', self.device_id)
+
+    @property
+    def device_info(self) -> dict[str, Any]:
+        """ Return device registry information for this entity. """
+
+        return {
+            "identifiers": {(DOMAIN, self.device_data.device_id), (DOMAIN, self.device_data.iot_code_tail)},
+            "name": self.device_data.device_name,
+            "manufacturer": "PurrSong",
+            "model": "Lavviebot S",
+            "sw_version": self.device_data.current_firmware
+        }
+
+    @property
+    def unique_id(self) -> str:
+        """ Sets unique ID for this entity. """
+
+        return str(self.device_data.device_id) + '_last_used'
+
+    @property
+    def name(self) -> str:
+        """ Return name of the entity """
+
+        return "Last used"
+
+    @property
+    def has_entity_name(self) -> bool:
+        """ Indicate that entity has name defined """
+
+        return True
+
+    @property
+    def native_value(self) -> datetime:
+        """ Returns date/time of the last time litter box was used by a cat """
+
+        return self.device_data.last_used
+
+    @property
+    def device_class(self) -> SensorDeviceClass:
+        """ Return entity device class """
+
+        return SensorDeviceClass.TIMESTAMP
+
+
+class LastUsedDuration(CoordinatorEntity, SensorEntity):
+    """ Representation of seconds litter box was used by most recent cat """
+
+    def __init__(self, coordinator, device_id):
+        super().__init__(coordinator)
+        self.device_id = device_id
+
+
+    @property
+    def device_data(self) -> LitterBox:
+        """ Handle coordinator litter box data """
+
+        return self.coordinator.data.litterboxes[self.device_id]
+
+    @property
+    def available(self) -> bool:
+        """ Return True if litter box data is fresh """
+
+        return super().available and self.coordinator.is_fresh('litterboxes', self.device_id)
+
+    @property
+    def device_info(self) -> dict[str, Any]:
+        """ Return device registry information for this entity. """
+
+        return {
+            "identifiers": {(DOMAIN, self.device_data.device_id), (DOMAIN, self.device_data.iot_code_tail)},
+            "name": self.device_data.device_name,
+            "manufacturer": "PurrSong",
+            "model": "Lavviebot S",
+            "sw_version": self.device_data.current_firmware
+        }
+
+    @property
+    def unique_id(self) -> str:
+        """ Sets unique ID for this entity. """
+
+        return str(self.device_data.device_id) + '_last_used_duration'
+
+    @property
+    def name(self) -> str:
+        """ Return name of the entity """
+
+        return "Last used duration"
+
+    @property
+    def has_entity_name(self) -> bool:
+        """ Indicate that entity has name defined """
+
+        return True
+
+    @property
+    def native_value(self) -> float:
+        """ Returns number of seconds last cat used the litter box """
+
+        return round(self.device_data.last_used_duration, 1)
+
+    @property
+    def native_unit_of_measurement(self) -> UnitOfTime:
+        """ Return seconds as the native unit """
+
+        return UnitOfTime.SECONDS
+
+    @property
+    def state_class(self) -> SensorStateClass:
+        """ Return the type of state class """
+
+        return SensorStateClass.MEASUREMENT
+
+    @property
+    def icon(self) -> str:
+        return 'mdi:clock-outline'
+
+
+class LitterBottomAmnt(CoordinatorEntity, SensorEntity):
+    """ Representation of current litter weight in tray """
+
+    def __init__(self, coordinator, device_id):
+        super().__init__(coordinator)
+        self.device_id = device_id
+        self.deadband = Deadband(self.device_data.litter_bottom_amount_pnds, dt_util.utcnow())
+
+
+    @property
+    def device_data(self) -> LitterBox:
+        """ Handle coordinator litter box data """
+
+        return self.coordinator.data.litterboxes[self.device_id]
+
+    @property
+    def available(self) -> bool:
+        """ Return True if litter box data is fresh """
+
+        return super().available and self.coordinator.is_fresh('litterboxes', self.device_id)
+
+    @property
+    def device_info(self) -> dict[str, Any]:
+        """ Return device registry information for this entity. """
+
+        return {
+            "identifiers": {(DOMAIN, self.device_data.device_id), (DOMAIN, self.device_data.iot_code_tail)},
+            "name": self.device_data.device_name,
+            "manufacturer": "PurrSong",
+            "model": "Lavviebot S",
+            "sw_version": self.device_data.current_firmware
+        }
+
+    @property
+    def unique_id(self) -> str:
+        """ Sets unique ID for this entity. """
+
+        return str(self.device_data.device_id) + '_litter_bottom_amnt'
+
+    @property
+    def name(self) -> str:
+        """ Return name of the entity """
+
+        return "Litter bottom amount"
+
+    @property
+    def has_entity_name(self) -> bool:
+        """ Indicate that entity has name defined """
+
+        return True
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """ Only report values that moved past the deadband. """
+
+        if self.device_id in self.coordinator.updated_ids['litterboxes']:
+            settings = self.coordinator.deadband_settings('litter_bottom_amount')
+            self.deadband.update(self.device_data.litter_bottom_amount_pnds, dt_util.utcnow(), *settings)
+        super()._handle_coordinator_update()
+
+    @property
+    def native_value(self) -> float:
+        """ Returns number of pounds of litter in the tray """
+
+        return round(self.deadband.value, 1)
+
+    @property
+    def native_unit_of_measurement(self) -> UnitOfMass:
+        """ Return pounds as the native unit """
+
+        return UnitOfMass.POUNDS
+
+    @property
+    def state_class(self) -> SensorStateClass:
+        """ Return the type of state class """
+
+        return SensorStateClass.MEASUREMENT
+
+    @property
+    def icon(self) -> str:
+        return 'mdi:scale'
+
+
+class LitterType(CoordinatorEntity, SensorEntity):
+    """ Representation of current litter type """
+
+    def __init__(self, coordinator, device_id):
+        super().__init__(coordinator)
+        self.device_id = device_id
+
+
+    @property
+    def device_data(self) -> LitterBox:
+        """ Handle coordinator litter box data """
+
+        return self.coordinator.data.litterboxes[self.device_id]
+
+    @property
+    def available(self) -> bool:
+        """ Return True if litter box data is fresh """
+
+        return super().available and self.coordinator.is_fresh('litterboxes', self.device_id)
+
+    @property
+    def device_info(self) -> dict[str, Any]:
+        """ Return device registry information for this entity. """
+
+        return {
+            "identifiers": {(DOMAIN, self.device_data.device_id), (DOMAIN, self.device_data.iot_code_tail)},
+            "name": self.device_data.device_name,
+            "manufacturer": "PurrSong",
+            "model": "Lavviebot S",
+            "sw_version": self.device_data.current_firmware
+        }
+
+    @property
+    def unique_id(self) -> str:
+        """ Sets unique ID for this entity. """
+
+        return str(self.device_data.device_id) + '_litter_type'
+
+    @property
+    def name(self) -> str:
+        """ Return name of the entity """
+
+        return "Litter type"
+
+    @property
+    def has_entity_name(self) -> bool:
+        """ Indicate that entity has name defined """
+
+        return True
+
+    @property
+    def native_value(self) -> str:
+        """ Returns litter type """
+
+        return LITTER_TYPE.get(self.device_data.litter_type, 'Unknown')
+
+    @property
+    def entity_category(self) -> EntityCategory:
+        """ Set category to diagnostic. """
+
+        return EntityCategory.DIAGNOSTIC
+
+    @property
+    def icon(self) -> str:
+        return 'mdi:tray'
+
+
+class MinBottomWeight(CoordinatorEntity, SensorEntity):
+    """ Representation of minimum bottom weight that is set up """
+
+    def __init__(self, coordinator, device_id):
+        super().__init__(coordinator)
+        self.device_id = device_id
+
+    @property
+    def device_data(self) -> LitterBox:
+        """ Handle coordinator litter box data """
+
+        return self.coordinator.data.litterboxes[self.device_id]
+
+    @property
+    def available(self) -> bool:
+        """ Return True if litter box data is fresh """
+
+        return super().available and self.coordinator.is_fresh('litterboxes', self.device_id)
+
+    @property
+    def device_info(self) -> dict[str, Any]:
+        """ Return device registry information for this entity. """
+
+        return {
+            "identifiers": {(DOMAIN, self.device_data.device_id), (DOMAIN, self.device_data.iot_code_tail)},
+            "name": self.device_data.device_name,
+            "manufacturer": "PurrSong",
+            "model": "Lavviebot S",
+            "sw_version": self.device_data.current_firmware
+        }
+
+    @property
+    def unique_id(self) -> str:
+        """ Sets unique ID for this entity. """
+
+        return str(self.device_data.device_id) + '_min_bottom_weight'
+
+    @property
+    def name(self) -> str:
+        """ Return name of the entity """
+
+        return "Minimum bottom weight"
+
+    @property
+    def has_entity_name(self) -> bool:
+        """ Indicate that entity has name defined """
+
+        return True
+
+    @property
+    def native_value(self) -> float:
+        """ Returns number of pounds minimum bottom weight is set to """
+
+        return round(self.device_data.min_bottom_weight_pnds, 1)
+
+    @property
+    def native_unit_of_measurement(self) -> UnitOfMass:
+        """ Return pounds as the native unit """
+
+        return UnitOfMass.POUNDS
+
+    @property
+    def state_class(self) -> SensorStateClass:
+        """ Return the type of state class """
+
+        return SensorStateClass.MEASUREMENT
+
+    @property
+    def entity_category(self) -> EntityCategory:
+        """ Set category to diagnostic. """
+
+        return EntityCategory.DIAGNOSTIC
+
+    @property
+    def icon(self) -> str:
+        return 'mdi:scale'
+
+
+class TopLitterStatus(CoordinatorEntity, SensorEntity):
+    """ Representation of litter storage status """
+
+    def __init__(self, coordinator, device_id):
+        super().__init__(coordinator)
+        self.device_id = device_id
+
+
+    @property
+    def device_data(self) -> LitterBox:
+        """ Handle coordinator litter box data """
+
+        return self.coordinator.data.litterboxes[self.device_id]
+
+    @property
+    def available(self) -> bool:
+        """ Return True if litter box data is fresh """
+
+        return super().available and self.coordinator.is_fresh('litterboxes', self.device_id)
+
+    @property
+    def device_info(self) -> dict[str, Any]:
+        """ Return device registry information for this entity. """
+
+        return {
+            "identifiers": {(DOMAIN, self.device_data.device_id), (DOMAIN, self.device_data.iot_code_tail)},
+            "name": self.device_data.device_name,
+            "manufacturer": "PurrSong",
+            "model": "Lavviebot S",
+            "sw_version": self.device_data.current_firmware
+        }
+
+    @property
+    def unique_id(self) -> str:
+        """ Sets unique ID for this entity. """
+
+        return str(self.device_data.device_id) + '_storage_status'
+
+    @property
+    def name(self) -> str:
+        """ Return name of the entity """
+
+        return "Storage status"
+
+    @property
+    def has_entity_name(self) -> bool:
+        """ Indicate that entity has name defined """
+
+        return True
+
+    @property
+    def native_value(self) -> str:
+        """ Returns status of litter storage compartment """
+
+        return STORAGE_STATUS.get(self.device_data.top_litter_status, 'Unknown')
+
+    @property
+    def icon(self) -> str:
+        """Set icon based on storage level"""
+        if self.device_data.top_litter_status == 2:
+            return 'mdi:gauge-full'
+        if self.device_data.top_litter_status == 1:
+            return 'mdi:gauge'
+        if self.device_data.top_litter_status == 0:
+            return 'mdi:gauge-empty'
+
+
+class LitterStorageEmpty(CoordinatorEntity, SensorEntity):
+    """ Representation of litter box days until litter storage is empty """
+
+    def __init__(self, coordinator, device_id):
+        super().__init__(coordinator)
+        self.device_id = device_id
+
+
+    @property
+    def device_data(self) -> LitterBox:
+        """ Handle coordinator litter box data """
+
+        return self.coordinator.data.litterboxes[self.device_id]
+
+    @property
+    def available(self) -> bool:
+        """ Return True if litter box data is fresh """
+
+        return super().available and self.coordinator.is_fresh('litterboxes', self.device_id)
+
+    @property
+    def device_info(self) -> dict[str, Any]:
+        """ Return device registry information for this entity. """
+
+        return {
+            "identifiers": {(DOMAIN, self.device_data.device_id), (DOMAIN, self.device_data.iot_code_tail)},
+            "name": self.device_data.device_name,
+            "manufacturer": "PurrSong",
+            "model": "Lavviebot S",
+            "sw_version": self.device_data.current_firmware
+        }
+
+    @property
+    def unique_id(self) -> str:
+        """ Sets unique ID for this entity. """
+
+        return str(self.device_data.device_id) + '_litter_storage_empty'
+
+    @property
+    def name(self) -> str:
+        """ Return name of the entity """
+
+        return "Litter storage empty in"
+
+    @property
+    def has_entity_name(self) -> bool:
+        """ Indicate that entity has name defined """
+
+        return True
+
+    @property
+    def litter_consumption(self) -> LitterConsumption:
+        """ Handle litter consumption estimator """
+
+        return self.coordinator.analytics.tracker('litter', self.device_id)
+
+    @property
+    def native_value(self) -> float | None:
+        """ Return days until the litter storage is predicted to be empty """
+
+        if self.litter_consumption.days_until_empty is None:
+            return None
+        return round(self.litter_consumption.days_until_empty, 1)
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """ Return learned storage capacity and days until tray reaches minimum weight """
+
+        capacity = self.litter_consumption.capacity
+        tray_days = self.litter_consumption.tray_days
+        return {
+            "storage_capacity": None if capacity is None else round(capacity, 2),
+            "tray_days_until_minimum": None if tray_days is None else round(tray_days, 1),
+        }
+
+    @property
+    def native_unit_of_measurement(self) -> UnitOfTime:
+        """ Return days as the native unit """
+
+        return UnitOfTime.DAYS
+
+    @property
+    def device_class(self) -> SensorDeviceClass:
+        """ Return entity device class """
+
+        return SensorDeviceClass.DURATION
+
+    @property
+    def icon(self) -> str:
+        return 'mdi:timer-sand'
+
+
+class LitterConsumptionRate(CoordinatorEntity, SensorEntity):
+    """ Representation of litter box litter consumption rate """
+
+    def __init__(self, coordinator, device_id):
+        super().__init__(coordinator)
+        self.device_id = device_id
+
+
+    @property
+    def device_data(self) -> LitterBox:
+        """ Handle coordinator litter box data """
+
+        return self.coordinator.data.litterboxes[self.device_id]
+
+    @property
+    def available(self) -> bool:
+        """ Return True if litter box data is fresh """
+
+        return super().available and self.coordinator.is_fresh('litterboxes', self.device_id)
+
+    @property
+    def device_info(self) -> dict[str, Any]:
+        """ Return device registry information for this entity. """
+
+        return {
+            "identifiers": {(DOMAIN, self.device_data.device_id), (DOMAIN, self.device_data.iot_code_tail)},
+            "name": self.device_data.device_name,
+            "manufacturer": "PurrSong",
+            "model": "Lavviebot S",
+            "sw_version": self.device_data.current_firmware
+        }
+
+    @property
+    def unique_id(self) -> str:
+        """ Sets unique ID for this entity. """
+
+        return str(self.device_data.device_id) + '_litter_consumption_rate'
+
+    @property
+    def name(self) -> str:
+        """ Return name of the entity """
+
+        return "Litter consumption rate"
+
+    @property
+    def has_entity_name(self) -> bool:
+        """ Indicate that entity has name defined """
+
+        return True
+
+    @property
+    def litter_consumption(self) -> LitterConsumption:
+        """ Handle litter consumption estimator """
+
+        return self.coordinator.analytics.tracker('litter', self.device_id)
+
+    @property
+    def native_value(self) -> float | None:
+        """ Return pounds of litter consumed per day """
+
+        if self.litter_consumption.daily_rate is None:
+            return None
+        return round(self.litter_consumption.daily_rate, 2)
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """ Return pounds of litter consumed per visit """
+
+        per_visit = self.litter_consumption.per_visit
+        return {
+            "per_visit": None if per_visit is None else round(per_visit, 3),
+        }
+
+    @property
+    def native_unit_of_measurement(self) -> str:
+        """ Return pounds per day as the native unit """
+
+        return f'{UnitOfMass.POUNDS}/{UnitOfTime.DAYS}'
+
+    @property
+    def state_class(self) -> SensorStateClass:
+        """ Return the type of state_class """
+
+        return SensorStateClass.MEASUREMENT
+
+    @property
+    def icon(self) -> str:
+        return 'mdi:chart-line'
+
+
+class WaitTime(CoordinatorEntity, SensorEntity):
+    """ Representation of minutes litter box is set to wait before scooping """
+
+    def __init__(self, coordinator, device_id):
+        super().__init__(coordinator)
+        self.device_id = device_id
+
+
+    @property
+    def device_data(self) -> LitterBox:
+        """ Handle coordinator litter box data """
+
+        return self.coordinator.data.litterboxes[self.device_id]
+
+    @property
+    def available(self) -> bool:
+        """ Return True if litter box data is fresh """
+
+        return super().available and self.coordinator.is_fresh('litterboxes', self.device_id)
+
+    @property
+    def device_info(self) -> dict[str, Any]:
+        """ Return device registry information for this entity. """
+
+        return {
+            "identifiers": {(DOMAIN, self.device_data.device_id), (DOMAIN, self.device_data.iot_code_tail)},
+            "name": self.device_data.device_name,
+            "manufacturer": "PurrSong",
+            "model": "Lavviebot S",
+            "sw_version": self.device_data.current_firmware
+        }
+
+    @property
+    def unique_id(self) -> str:
+        """ Sets unique ID for this entity. """
+
+        return str(self.device_data.device_id) + '_wait_time'
+
+    @property
+    def name(self) -> str:
+        """ Return name of the entity """
+
+        return "Wait time"
+
+    @property
+    def has_entity_name(self) -> bool:
+        """ Indicate that entity has name defined """
+
+        return True
+
+    @property
+    def native_value(self) -> int:
+        """ Returns number of minutes litter box is set to wait before scooping """
+
+        return self.device_data.wait_time
+
+    @property
+    def native_unit_of_measurement(self) -> UnitOfTime:
+        """ Return minutes as the native unit """
+
+        return UnitOfTime.MINUTES
+
+    @property
+    def entity_category(self) -> EntityCategory:
+        """ Set category to diagnostic. """
+
+        return EntityCategory.DIAGNOSTIC
+
+    @property
+    def icon(self) -> str:
+        return 'mdi:clock-outline'
+
+
+class WasteStatus(CoordinatorEntity, SensorEntity):
+    """ Representation of litter box waste status """
+
+    def __init__(self, coordinator, device_id):
+        super().__init__(coordinator)
+        self.device_id = device_id
+
+
+    @property
+    def device_data(self) -> LitterBox:
+        """ Handle coordinator litter box data """
+
+        return self.coordinator.data.litterboxes[self.device_id]
+
+    @property
+    def available(self) -> bool:
+        """ Return True if litter box data is fresh """
+
+        return super().available and self.coordinator.is_fresh('litterboxes', self.device_id)
+
+    @property
+    def device_info(self) -> dict[str, Any]:
+        """ Return device registry information for this entity. """
+
+        return {
+            "identifiers": {(DOMAIN, self.device_data.device_id), (DOMAIN, self.device_data.iot_code_tail)},
+            "name": self.device_data.device_name,
+            "manufacturer": "PurrSong",
+            "model": "Lavviebot S",
+            "sw_version": self.device_data.current_firmware
+        }
+
+    @property
+    def unique_id(self) -> str:
+        """ Sets unique ID for this entity. """
+
+        return str(self.device_data.device_id) + '_waste_status'
+
+    @property
+    def name(self) -> str:
+        """ Return name of the entity """
+
+        return "Waste status"
+
+    @property
+    def has_entity_name(self) -> bool:
+        """ Indicate that entity has name defined """
+
+        return True
+
+    @property
+    def native_value(self) -> str:
+        """ Returns status of litter storage compartment """
+
+        return WASTE_STATUS.get(self.device_data.waste_drawer_status, 'Unknown')
+
+    @property
+    def icon(self) -> str:
+        """Set icon based on storage level"""
+        if self.device_data.waste_drawer_status == 2:
+            return 'mdi:gauge-empty'
+        if self.device_data.waste_drawer_status == 1:
+            return 'mdi:gauge'
+        if self.device_data.waste_drawer_status == 0:
+            return 'mdi:gauge-full'
+
+
+class WasteFullForecast(CoordinatorEntity, SensorEntity):
+    """ Representation of litter box predicted waste drawer full time """
+
+    def __init__(self, coordinator, device_id):
+        super().__init__(coordinator)
+        self.device_id = device_id
+
+
+    @property
+    def device_data(self) -> LitterBox:
+        """ Handle coordinator litter box data """
+
+        return self.coordinator.data.litterboxes[self.device_id]
+
+    @property
+    def available(self) -> bool:
+        """ Return True if litter box data is fresh """
+
+        return super().available and self.coordinator.is_fresh('litterboxes', self.device_id)
+
+    @property
+    def device_info(self) -> dict[str, Any]:
+        """ Return device registry information for this entity. """
+
+        return {
+            "identifiers": {(DOMAIN, self.device_data.device_id), (DOMAIN, self.device_data.iot_code_tail)},
+            "name": self.device_data.device_name,
+            "manufacturer": "PurrSong",
+            "model": "Lavviebot S",
+            "sw_version": self.device_data.current_firmware
+        }
+
+    @property
+    def unique_id(self) -> str:
+        """ Sets unique ID for this entity. """
+
+        return str(self.device_data.device_id) + '_waste_full_forecast'
+
+    @property
+    def name(self) -> str:
+        """ Return name of the entity """
+
+        return "Waste drawer predicted full"
+
+    @property
+    def has_entity_name(self) -> bool:
+        """ Indicate that entity has name defined """
+
+        return True
+
+    @property
+    def drawer_forecast(self) -> DrawerForecast:
+        """ Handle waste drawer forecast """
+
+        return self.coordinator.analytics.tracker('waste_drawer', self.device_id)
+
+    @property
+    def native_value(self) -> datetime | None:
+        """ Return time the waste drawer is predicted to be full """
+
+        return self.drawer_forecast.predicted_full
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """ Return learned fill rate and visits since the drawer was emptied """
+
+        return {
+            "visits_since_emptied": self.drawer_forecast.cycle_visits,
+            "visits_per_fill": None if self.drawer_forecast.visits_per_fill is None else round(self.drawer_forecast.visits_per_fill, 1),
+            "learned_cycles": self.drawer_forecast.cycles,
+        }
+
+    @property
+    def device_class(self) -> SensorDeviceClass:
+        """ Return entity device class """
+
+        return SensorDeviceClass.TIMESTAMP
+
+    @property
+    def icon(self) -> str:
+        return 'mdi:delete-clock'
+
+
+class WasteHoursRemaining(CoordinatorEntity, SensorEntity):
+    """ Representation of litter box hours until waste drawer is full """
+
+    def __init__(self, coordinator, device_id):
+        super().__init__(coordinator)
+        self.device_id = device_id
+
+
+    @property
+    def device_data(self) -> LitterBox:
+        """ Handle coordinator litter box data """
+
+        return self.coordinator.data.litterboxes[self.device_id]
+
+    @property
+    def available(self) -> bool:
+        """ Return True if litter box data is fresh """
+
+        return super().available and self.coordinator.is_fresh('litterboxes', self.device_id)
+
+    @property
+    def device_info(self) -> dict[str, Any]:
+        """ Return device registry information for this entity. """
+
+        return {
+            "identifiers": {(DOMAIN, self.device_data.device_id), (DOMAIN, self.device_data.iot_code_tail)},
+            "name": self.device_data.device_name,
+            "manufacturer": "PurrSong",
+            "model": "Lavviebot S",
+            "sw_version": self.device_data.current_firmware
+        }
+
+    @property
+    def unique_id(self) -> str:
+        """ Sets unique ID for this entity. """
+
+        return str(self.device_data.device_id) + '_waste_hours_remaining'
+
+    @property
+    def name(self) -> str:
+        """ Return name of the entity """
+
+        return "Waste drawer time remaining"
+
+    @property
+    def has_entity_name(self) -> bool:
+        """ Indicate that entity has name defined """
+
+        return True
+
+    @property
+    def drawer_forecast(self) -> DrawerForecast:
+        """ Handle waste drawer forecast """
+
+        return self.coordinator.analytics.tracker('waste_drawer', self.device_id)
+
+    @property
+    def native_value(self) -> float | None:
+        """ Return hours until the waste drawer is predicted to be full """
+
+        hours = self.drawer_forecast.hours_remaining(dt_util.utcnow())
+        if hours is None:
+            return None
+        return round(hours, 1)
+
+    @property
+    def native_unit_of_measurement(self) -> UnitOfTime:
+        """ Return hours as the native unit """
+
+        return UnitOfTime.HOURS
+
+    @property
+    def device_class(self) -> SensorDeviceClass:
+        """ Return entity device class """
+
+        return SensorDeviceClass.DURATION
+
+    @property
+    def icon(self) -> str:
+        return 'mdi:delete-clock'
+
+
+class LitterBoxUseCount(CoordinatorEntity, SensorEntity):
+    """ Representation of litter box use count """
+
+    def __init__(self, coordinator, device_id):
+        super().__init__(coordinator)
+        self.device_id = device_id
+
+
+    @property
+    def device_data(self) -> LitterBox:
+        """ Handle coordinator litter box data """
+
+        return self.coordinator.data.litterboxes[self.device_id]
+
+    @property
+    def available(self) -> bool:
+        """ Return True if litter box data is fresh """
+
+        return super().available and self.coordinator.is_fresh('litterboxes', self.device_id)
+
+    @property
+    def device_info(self) -> dict[str, Any]:
+        """ Return device registry information for this entity. """
+
+        return {
+            "identifiers": {(DOMAIN, self.device_data.device_id), (DOMAIN, self.device_data.iot_code_tail)},
+            "name": self.device_data.device_name,
+            "manufacturer": "PurrSong",
+            "model": "Lavviebot S",
+            "sw_version": self.device_data.current_firmware
+        }
+
+    @property
+    def unique_id(self) -> str:
+        """ Sets unique ID for this entity. """
+
+        return str(self.device_data.device_id) + '_lb_use_count'
+
+    @property
+    def name(self) -> str:
+        """ Return name of the entity """
+
+        return "Use count"
+
+    @property
+    def has_entity_name(self) -> bool:
+        """ Indicate that entity has name defined """
+
+        return True
+
+    @property
+    def native_value(self) -> int:
+        """ Returns litter box usage count for today """
+
+        return self.device_data.times_used_today
+
+    @property
+    def icon(self) -> str:
+        """Set icon"""
+        
+        return 'mdi:counter'
+
+
+class LitterBoxLifetimeVisits(CoordinatorEntity, SensorEntity):
+    """ Representation of litter box lifetime visit count """
+
+    def __init__(self, coordinator, device_id):
+        super().__init__(coordinator)
+        self.device_id = device_id
+
+
+    @property
+    def device_data(self) -> LitterBox:
+        """ Handle coordinator litter box data """
+
+        return self.coordinator.data.litterboxes[self.device_id]
+
+    @property
+    def available(self) -> bool:
+        """ Return True if litter box data is fresh """
+
+        return super().available and self.coordinator.is_fresh('litterboxes', self.device_id)
+
+    @property
+    def device_info(self) -> dict[str, Any]:
+        """ Return device registry information for this entity. """
+
+        return {
+            "identifiers": {(DOMAIN, self.device_data.device_id), (DOMAIN, self.device_data.iot_code_tail)},
+            "name": self.device_data.device_name,
+            "manufacturer": "PurrSong",
+            "model": "Lavviebot S",
+            "sw_version": self.device_data.current_firmware
+        }
+
+    @property
+    def unique_id(self) -> str:
+        """ Sets unique ID for this entity. """
+
+        return str(self.device_data.device_id) + '_lifetime_visits'
+
+    @property
+    def name(self) -> str:
+        """ Return name of the entity """
+
+        return "Lifetime use count"
+
+    @property
+    def has_entity_name(self) -> bool:
+        """ Indicate that entity has name defined """
+
+        return True
+
+    @property
+    def lifetime(self) -> LifetimeCounter:
+        """ Handle litter box lifetime counters """
+
+        return self.coordinator.analytics.tracker('box_lifetime', self.device_id)
+
+    @property
+    def native_value(self) -> int:
+        """ Return total visits counted for the litter box """
+
+        return int(self.lifetime.totals['visits'])
+
+    @property
+    def state_class(self) -> SensorStateClass:
+        """ Return the type of state_class """
+
+        return SensorStateClass.TOTAL_INCREASING
+
+    @property
+    def icon(self) -> str:
+        return 'mdi:counter'
+
+
+class LitterBoxLifetimeDuration(CoordinatorEntity, SensorEntity):
+    """ Representation of litter box lifetime time in the litter box """
+
+    def __init__(self, coordinator, device_id):
+        super().__init__(coordinator)
+        self.device_id = device_id
+
+
+    @property
+    def device_data(self) -> LitterBox:
+        """ Handle coordinator litter box data """
+
+        return self.coordinator.data.litterboxes[self.device_id]
+
+    @property
+    def available(self) -> bool:
+        """ Return True if litter box data is fresh """
+
+        return super().available and self.coordinator.is_fresh('litterboxes', self.device_id)
+
+    @property
+    def device_info(self) -> dict[str, Any]:
+        """ Return device registry information for this entity. """
+
+        return {
+            "identifiers": {(DOMAIN, self.device_data.device_id), (DOMAIN, self.device_data.iot_code_tail)},
+            "name": self.device_data.device_name,
+            "manufacturer": "PurrSong",
+            "model": "Lavviebot S",
+            "sw_version": self.device_data.current_firmware
+        }
+
+    @property
+    def unique_id(self) -> str:
+        """ Sets unique ID for this entity. """
+
+        return str(self.device_data.device_id) + '_lifetime_duration'
+
+    @property
+    def name(self) -> str:
+        """ Return name of the entity """
+
+        return "Lifetime use time"
+
+    @property
+    def has_entity_name(self) -> bool:
+        """ Indicate that entity has name defined """
+
+        return True
+
+    @property
+    def lifetime(self) -> LifetimeCounter:
+        """ Handle litter box lifetime counters """
+
+        return self.coordinator.analytics.tracker('box_lifetime', self.device_id)
+
+    @property
+    def native_value(self) -> int:
+        """ Return total seconds the litter box has been in use """
+
+        return round(self.lifetime.totals['duration'])
+
+    @property
+    def native_unit_of_measurement(self) -> UnitOfTime:
+        """ Return seconds as the native unit """
+
+        return UnitOfTime.SECONDS
+
+    @property
+    def device_class(self) -> SensorDeviceClass:
+        """ Return entity device class """
+
+        return SensorDeviceClass.DURATION
+
+    @property
+    def state_class(self) -> SensorStateClass:
+        """ Return the type of state_class """
+
+        return SensorStateClass.TOTAL_INCREASING
+
+    @property
+    def icon(self) -> str:
+        return 'mdi:timer-outline'
+
+
+class LitterBoxCleaningCycles(CoordinatorEntity, SensorEntity):
+    """ Representation of litter box lifetime cleaning cycle count """
+
+    def __init__(self, coordinator, device_id):
+        super().__init__(coordinator)
+        self.device_id = device_id
+
+
+    @property
+    def device_data(self) -> LitterBox:
+        """ Handle coordinator litter box data """
+
+        return self.coordinator.data.litterboxes[self.device_id]
+
+    @property
+    def available(self) -> bool:
+        """ Return True if litter box data is fresh """
+
+        return super().available and self.coordinator.is_fresh('litterboxes', self.device_id)
+
+    @property
+    def device_info(self) -> dict[str, Any]:
+        """ Return device registry information for this entity. """
+
+        return {
+            "identifiers": {(DOMAIN, self.device_data.device_id), (DOMAIN, self.device_data.iot_code_tail)},
+            "name": self.device_data.device_name,
+            "manufacturer": "PurrSong",
+            "model": "Lavviebot S",
+            "sw_version": self.device_data.current_firmware
+        }
+
+    @property
+    def unique_id(self) -> str:
+        """ Sets unique ID for this entity. """
+
+        return str(self.device_data.device_id) + '_cleaning_cycles'
+
+    @property
+    def name(self) -> str:
+        """ Return name of the entity """
+
+        return "Cleaning cycles"
+
+    @property
+    def has_entity_name(self) -> bool:
+        """ Indicate that entity has name defined """
+
+        return True
+
+    @property
+    def cleaning_cycle(self) -> CleaningCycle:
+        """ Handle cleaning cycle state machine """
+
+        return self.coordinator.analytics.tracker('box_cleaning', self.device_id)
+
+    @property
+    def native_value(self) -> int:
+        """ Return total cleaning cycles detected for the litter box """
+
+        return int(self.coordinator.analytics.tracker('box_lifetime', self.device_id).totals['cleanings'])
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """ Return details of the latest cleaning and delays after visits """
+
+        cycle = self.cleaning_cycle
+        return {
+            "state": cycle.state,
+            "last_cleaning": None if cycle.last_cycle is None else dt_util.utc_from_timestamp(cycle.last_cycle).isoformat(),
+            "last_delay": None if cycle.last_delay is None else round(cycle.last_delay),
+            "average_delay": None if cycle.average_delay is None else round(cycle.average_delay),
+            "wait_time": self.device_data.wait_time * 60,
+            "missed_cycles": cycle.missed,
+        }
+
+    @property
+    def state_class(self) -> SensorStateClass:
+        """ Return the type of state_class """
+
+        return SensorStateClass.TOTAL_INCREASING
+
+    @property
+    def icon(self) -> str:
+        return 'mdi:broom'
+
+
+class LatestError(CoordinatorEntity, SensorEntity):
+    """ Representation of litter box latest error """
+
+    def __init__(self, coordinator, device_id):
+        super().__init__(coordinator)
+        self.device_id = device_id
+
+
+    @property
+    def device_data(self) -> LitterBox:
+        """ Handle coordinator litter box data """
+
+        return self.coordinator.data.litterboxes[self.device_id]
+
+    @property
+    def available(self) -> bool:
+        """ Return True if litter box data is fresh """
+
+        return super().available and self.coordinator.is_fresh('litterboxes', self.device_id)
+
+    @property
+    def device_info(self) -> dict[str, Any]:
+        """ Return device registry information for this entity. """
+
+        return {
+            "identifiers": {(DOMAIN, self.device_data.device_id), (DOMAIN, self.device_data.iot_code_tail)},
+            "name": self.device_data.device_name,
+            "manufacturer": "PurrSong",
+            "model": "Lavviebot S",
+            "sw_version": self.device_data.current_firmware
+        }
+
+    @property
+    def unique_id(self) -> str:
+        """ Sets unique ID for this entity. """
+
+        return str(self.device_data.device_id) + '_latest_error'
+
+    @property
+    def name(self) -> str:
+        """ Return name of the entity """
+
+        return "Latest error"
+
+    @property
+    def has_entity_name(self) -> bool:
+        """ Indicate that entity has name defined """
+
+        return True
+
+    @property
+    def entity_category(self) -> EntityCategory:
+        """ Set category to diagnostic. """
+
+        return EntityCategory.DIAGNOSTIC
+
+    @property
+    def native_value(self) -> str:
+        """ Returns the most recent error """
+
+        if self.device_data.error_log:
+            return ERROR_LOG_CODES.get(self.device_data.error_log[0]['status'], 'Unknown error code')
+        else:
+            return "No errors in log"
+
+    @property
+    def icon(self) -> str:
+        """Set icon"""
+        
+        return 'mdi:alert-circle'
+
+
+class ErrorTime(CoordinatorEntity, SensorEntity):
+    """ Representation of when latest error occurred """
+
+    def __init__(self, coordinator, device_id):
+        super().__init__(coordinator)
+        self.device_id = device_id
+
+
+    @property
+    def device_data(self) -> LitterBox:
+        """ Handle coordinator litter box data """
+
+        return self.coordinator.data.litterboxes[self.device_id]
+
+    @property
+    def device_info(self) -> dict[str, Any]:
+        """ Return device registry information for this entity. """
+
+        return {
+            "identifiers": {(DOMAIN, self.device_data.device_id), (DOMAIN, self.device_data.iot_code_tail)},
+            "name": self.device_data.device_name,
+            "manufacturer": "PurrSong",
+            "model": "Lavviebot S",
+            "sw_version": self.device_data.current_firmware
+        }
+
+    @property
+    def unique_id(self) -> str:
+        """ Sets unique ID for this entity. """
+
+        return str(self.device_data.device_id) + '_error_time'
+
+    @property
+    def name(self) -> str:
+        """ Return name of the entity """
+
+        return "Error time"
+
+    @property
+    def has_entity_name(self) -> bool:
+        """ Indicate that entity has name defined """
+
+        return True
+
+    @property
+    def entity_category(self) -> EntityCategory:
+        """ Set category to diagnostic. """
+
+        return EntityCategory.DIAGNOSTIC
+
+    @property
+    def native_value(self) -> datetime | str:
+        """ Returns datetime of the most recent error """
+
+        return datetime.utcfromtimestamp(int(self.device_data.error_log[0]['creationTime']) / 1000).replace(tzinfo=timezone.utc)
+
+    @property
+    def device_class(self) -> SensorDeviceClass:
+        """ Return entity device class """
+
+        return SensorDeviceClass.TIMESTAMP
+
+    @property
+    def icon(self) -> str:
+        """Set icon"""
+        
+        return 'mdi:calendar-clock'
+
+    @property
+    def available(self) -> bool:
+        """Make entity available if there is an error log"""
+
+        if self.device_data.error_log:
+            return super().available and self.coordinator.is_fresh('litterboxes', self.device_id)
+        else:
+            return False
+        
+
+class CloudUptime(CoordinatorEntity, SensorEntity):
+    """ Representation of litter box cloud uptime """
+
+    def __init__(self, coordinator, device_id):
+        super().__init__(coordinator)
+        self.device_id = device_id
+
+
+    @property
+    def device_data(self) -> LitterBox:
+        """ Handle coordinator litter box data """
+
+        return self.coordinator.data.litterboxes[self.device_id]
+
+    @property
+    def available(self) -> bool:
+        """ Return True if litter box data is fresh """
+
+        return super().available and self.coordinator.is_fresh('litterboxes', self.device_id)
+
+    @property
+    def device_info(self) -> dict[str, Any]:
+        """ Return device registry information for this entity. """
+
+        return {
+            "identifiers": {(DOMAIN, self.device_data.device_id), (DOMAIN, self.device_data.iot_code_tail)},
+            "name": self.device_data.device_name,
+            "manufacturer": "PurrSong",
+            "model": "Lavviebot S",
+            "sw_version": self.device_data.current_firmware
+        }
+
+    @property
+    def unique_id(self) -> str:
+        """ Sets unique ID for this entity. """
+
+        return str(self.device_data.device_id) + '_cloud_uptime'
+
+    @property
+    def name(self) -> str:
+        """ Return name of the entity """
+
+        return "Cloud uptime"
+
+    @property
+    def has_entity_name(self) -> bool:
+        """ Indicate that entity has name defined """
+
+        return True
+
+    @property
+    def connectivity(self) -> ConnectivityHealth:
+        """ Handle litter box connectivity health """
+
+        return self.coordinator.analytics.tracker('litterbox_connectivity', self.device_id)
+
+    @property
+    def native_value(self) -> float | None:
+        """ Return percentage of the last week the litter box was reporting """
+
+        if (uptime := self.connectivity.uptime_ratio) is None:
+            return None
+        return round(uptime * 100, 2)
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """ Return outage counts """
+
+        return {
+            "outages_last_week": self.connectivity.recent_outages,
+            "outages": self.connectivity.outages,
+        }
+
+    @property
+    def native_unit_of_measurement(self) -> str:
+        """ Return percent as the native unit """
+
+        return PERCENTAGE
+
+    @property
+    def state_class(self) -> SensorStateClass:
+        """ Return the type of state_class """
+
+        return SensorStateClass.MEASUREMENT
+
+    @property
+    def entity_category(self) -> EntityCategory:
+        """ Set category to diagnostic. """
+
+        return EntityCategory.DIAGNOSTIC
+
+    @property
+    def icon(self) -> str:
+        return 'mdi:cloud-percent'
+
+
+class ScannerLastSeen(CoordinatorEntity, SensorEntity):
+    """ Representation of last date/time LavvieScanner connected to PurrSong servers """
+
+    def __init__(self, coordinator, device_id):
+        super().__init__(coordinator)
+        self.device_id = device_id
+
+
+    @property
+    def device_data(self) -> LavvieScanner:
+        """ Handle coordinator LavvieScanner data """
+
+        return self.coordinator.data.lavvie_scanners[self.device_id]
+
+    @property
+    def available(self) -> bool:
+        """ Return True if LavvieScanner data is fresh """
+
+        return super().available and self.coordinator.is_fresh('lavvie_scanners', self.device_id)
+
+    @property
+    def device_info(self) -> dict[str, Any]:
+        """ Return device registry information for this entity. """
+
+        return {
+            "identifiers": {(DOMAIN, self.device_data.device_id), (DOMAIN, self.device_data.iot_code_tail)},
+            "name": self.device_data.device_name,
+            "manufacturer": "PurrSong",
+            "model": "LavvieScanner",
+            "sw_version": self.device_data.current_firmware
+        }
+
+    @property
+    def unique_id(self) -> str:
+        """ Sets unique ID for this entity. """
+
+        return str(self.device_data.device_id) + '_last_seen'
+
+    @property
+    def name(self) -> str:
+        """ Return name of the entity """
+
+        return "Last seen"
+
+    @property
+    def has_entity_name(self) -> bool:
+        """ Indicate that entity has name defined """
+
+        return True
+
+    @property
+    def native_value(self) -> datetime:
+        """ Returns date/time of the last time scanner connected to PurrSong servers """
+
+        return self.device_data.last_seen
+
+    @property
+    def device_class(self) -> SensorDeviceClass:
+        """ Return entity device class """
+
+        return SensorDeviceClass.TIMESTAMP
+
+    @property
+    def entity_category(self) -> EntityCategory:
+        """ Set category to diagnostic. """
+
+        return EntityCategory.DIAGNOSTIC
+
+    @property
+    def icon(self) -> str:
+        return 'mdi:web'
 
-class Temperature(CoordinatorEntity, SensorEntity):
-    """ Representation of Litter Box Temperature """
+
+class ScannerDataRefreshed(CoordinatorEntity, SensorEntity):
+    """ Representation of when LavvieScanner last had good data from PurrSong servers """
 
     def __init__(self, coordinator, device_id):
         super().__init__(coordinator)
@@ -694,10 +3710,16 @@ class Temperature(CoordinatorEntity, SensorEntity):
 
 
     @property
-    def device_data(self) -> LitterBox:
-        """ Handle coordinator litter box data """
+    def device_data(self) -> LavvieScanner:
+        """ Handle coordinator LavvieScanner data """
 
-        return self.coordinator.data.litterboxes[self.device_id]
+        return self.coordinator.data.lavvie_scanners[self.device_id]
+
+    @property
+    def available(self) -> bool:
+        """ Refresh time is known even when the data is stale """
+
+        return True
 
     @property
     def device_info(self) -> dict[str, Any]:
@@ -707,7 +3729,7 @@ class Temperature(CoordinatorEntity, SensorEntity):
             "identifiers": {(DOMAIN, self.device_data.device_id), (DOMAIN, self.device_data.iot_code_tail)},
             "name": self.device_data.device_name,
             "manufacturer": "PurrSong",
-            "model": "Lavviebot S",
+            "model": "LavvieScanner",
             "sw_version": self.device_data.current_firmware
         }
 
@@ -715,13 +3737,13 @@ class Temperature(CoordinatorEntity, SensorEntity):
     def unique_id(self) -> str:
         """ Sets unique ID for this entity. """
 
-        return str(self.device_data.device_id) + '_temperature'
+        return str(self.device_data.device_id) + '_scanner_data_refreshed'
 
     @property
     def name(self) -> str:
         """ Return name of the entity """
 
-        return "Temperature"
+        return "Data refreshed"
 
     @property
     def has_entity_name(self) -> bool:
@@ -730,32 +3752,38 @@ class Temperature(CoordinatorEntity, SensorEntity):
         return True
 
     @property
-    def native_value(self) -> int:
-        """ Return current temperature in Celsius """
+    def native_value(self) -> datetime | None:
+        """ Returns date/time LavvieScanner data was last successfully refreshed """
 
-        return self.device_data.temperature_c
+        return self.coordinator.refreshed_at['lavvie_scanners'].get(self.device_id)
 
     @property
-    def native_unit_of_measurement(self) -> UnitOfTemperature:
-        """ Return Celsius as the native unit """
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """ Return whether the data is still fresh """
 
-        return UnitOfTemperature.CELSIUS
+        return {
+            "fresh": self.coordinator.is_fresh('lavvie_scanners', self.device_id),
+        }
 
     @property
     def device_class(self) -> SensorDeviceClass:
         """ Return entity device class """
 
-        return SensorDeviceClass.TEMPERATURE
+        return SensorDeviceClass.TIMESTAMP
 
     @property
-    def state_class(self) -> SensorStateClass:
-        """ Return the type of state class """
+    def entity_category(self) -> EntityCategory:
+        """ Set category to diagnostic. """
 
-        return SensorStateClass.MEASUREMENT
+        return EntityCategory.DIAGNOSTIC
+
+    @property
+    def icon(self) -> str:
+        return 'mdi:cloud-refresh'
 
 
-class BeaconBattery(CoordinatorEntity, SensorEntity):
-    """ Representation of Beacon Battery Level """
+class ScannerCloudUptime(CoordinatorEntity, SensorEntity):
+    """ Representation of LavvieScanner cloud uptime """
 
     def __init__(self, coordinator, device_id):
         super().__init__(coordinator)
@@ -763,10 +3791,16 @@ class BeaconBattery(CoordinatorEntity, SensorEntity):
 
 
     @property
-    def device_data(self) -> LitterBox:
-        """ Handle coordinator litter box data """
+    def device_data(self) -> LavvieScanner:
+        """ Handle coordinator LavvieScanner data """
 
-        return self.coordinator.data.litterboxes[self.device_id]
+        return self.coordinator.data.lavvie_scanners[self.device_id]
+
+    @property
+    def available(self) -> bool:
+        """ Return True if LavvieScanner data is fresh """
+
+        return super().available and self.coordinator.is_fresh('lavvie_scanners', self.device_id)
 
     @property
     def device_info(self) -> dict[str, Any]:
@@ -776,7 +3810,7 @@ class BeaconBattery(CoordinatorEntity, SensorEntity):
             "identifiers": {(DOMAIN, self.device_data.device_id), (DOMAIN, self.device_data.iot_code_tail)},
             "name": self.device_data.device_name,
             "manufacturer": "PurrSong",
-            "model": "Lavviebot S",
+            "model": "LavvieScanner",
             "sw_version": self.device_data.current_firmware
         }
 
@@ -784,13 +3818,13 @@ class BeaconBattery(CoordinatorEntity, SensorEntity):
     def unique_id(self) -> str:
         """ Sets unique ID for this entity. """
 
-        return str(self.device_data.device_id) + '_beacon_battery'
+        return str(self.device_data.device_id) + '_cloud_uptime'
 
     @property
     def name(self) -> str:
         """ Return name of the entity """
 
-        return "Beacon battery"
+        return "Cloud uptime"
 
     @property
     def has_entity_name(self) -> bool:
@@ -799,29 +3833,37 @@ class BeaconBattery(CoordinatorEntity, SensorEntity):
         return True
 
     @property
-    def native_value(self) -> int:
-        """ Return current battery level or 0 if there isn't one """
+    def connectivity(self) -> ConnectivityHealth:
+        """ Handle LavvieScanner connectivity health """
 
-        if self.device_data.beacon_battery is not None:
-            return self.device_data.beacon_battery
-        else:
-            return 0
+        return self.coordinator.analytics.tracker('scanner_connectivity', self.device_id)
 
     @property
-    def native_unit_of_measurement(self) -> str:
-        """ Uses percentage as the unit """
+    def native_value(self) -> float | None:
+        """ Return percentage of the last week the LavvieScanner was reporting """
 
-        return PERCENTAGE
+        if (uptime := self.connectivity.uptime_ratio) is None:
+            return None
+        return round(uptime * 100, 2)
 
     @property
-    def device_class(self) -> SensorDeviceClass:
-        """ Return entity device class """
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """ Return outage counts """
 
-        return SensorDeviceClass.BATTERY
+        return {
+            "outages_last_week": self.connectivity.recent_outages,
+            "outages": self.connectivity.outages,
+        }
+
+    @property
+    def native_unit_of_measurement(self) -> str:
+        """ Return percent as the native unit """
+
+        return PERCENTAGE
 
     @property
     def state_class(self) -> SensorStateClass:
-        """ Return the type of state class """
+        """ Return the type of state_class """
 
         return SensorStateClass.MEASUREMENT
 
@@ -831,9 +3873,13 @@ class BeaconBattery(CoordinatorEntity, SensorEntity):
 
         return EntityCategory.DIAGNOSTIC
 
+    @property
+    def icon(self) -> str:
+        return 'mdi:cloud-percent'
 
-class LastCatUsed(CoordinatorEntity, SensorEntity):
-    """ Representation of last cat to have used the litter box """
+
+class TagLastSeen(CoordinatorEntity, SensorEntity):
+    """ Representation of last date/time LavvieTag connected """
 
     def __init__(self, coordinator, device_id):
         super().__init__(coordinator)
@@ -841,10 +3887,16 @@ class LastCatUsed(CoordinatorEntity, SensorEntity):
 
 
     @property
-    def device_data(self) -> LitterBox:
-        """ Handle coordinator litter box data """
+    def device_data(self) -> LavvieTag:
+        """ Handle coordinator LavvieTag data """
 
-        return self.coordinator.data.litterboxes[self.device_id]
+        return self.coordinator.data.lavvie_tags[self.device_id]
+
+    @property
+    def available(self) -> bool:
+        """ Return True if LavvieTag data is fresh """
+
+        return super().available and self.coordinator.is_fresh('lavvie_tags', self.device_id)
 
     @property
     def device_info(self) -> dict[str, Any]:
@@ -854,7 +3906,7 @@ class LastCatUsed(CoordinatorEntity, SensorEntity):
             "identifiers": {(DOMAIN, self.device_data.device_id), (DOMAIN, self.device_data.iot_code_tail)},
             "name": self.device_data.device_name,
             "manufacturer": "PurrSong",
-            "model": "Lavviebot S",
+            "model": "LavvieTag",
             "sw_version": self.device_data.current_firmware
         }
 
@@ -862,13 +3914,13 @@ class LastCatUsed(CoordinatorEntity, SensorEntity):
     def unique_id(self) -> str:
         """ Sets unique ID for this entity. """
 
-        return str(self.device_data.device_id) + '_last_cat_used'
+        return str(self.device_data.device_id) + '_tag_last_seen'
 
     @property
     def name(self) -> str:
         """ Return name of the entity """
 
-        return "Last cat used"
+        return "Last seen"
 
     @property
     def has_entity_name(self) -> bool:
@@ -877,18 +3929,30 @@ class LastCatUsed(CoordinatorEntity, SensorEntity):
         return True
 
     @property
-    def native_value(self) -> str:
-        """ Return name of last cat to have used the litter box """
+    def native_value(self) -> datetime:
+        """ Returns date/time of the last time tag connected """
 
-        return self.device_data.last_cat_used_name
+        return self.device_data.last_seen
+
+    @property
+    def device_class(self) -> SensorDeviceClass:
+        """ Return entity device class """
+
+        return SensorDeviceClass.TIMESTAMP
+
+    @property
+    def entity_category(self) -> EntityCategory:
+        """ Set category to diagnostic. """
+
+        return EntityCategory.DIAGNOSTIC
 
     @property
     def icon(self) -> str:
-        return 'mdi:cat'
+        return 'mdi:web'
 
 
-class LastSeen(CoordinatorEntity, SensorEntity):
-    """ Representation of last date/time litter box connected to PurrSong servers """
+class TagDataRefreshed(CoordinatorEntity, SensorEntity):
+    """ Representation of when LavvieTag last had good data from PurrSong servers """
 
     def __init__(self, coordinator, device_id):
         super().__init__(coordinator)
@@ -896,10 +3960,16 @@ class LastSeen(CoordinatorEntity, SensorEntity):
 
 
     @property
-    def device_data(self) -> LitterBox:
-        """ Handle coordinator litter box data """
+    def device_data(self) -> LavvieTag:
+        """ Handle coordinator LavvieTag data """
 
-        return self.coordinator.data.litterboxes[self.device_id]
+        return self.coordinator.data.lavvie_tags[self.device_id]
+
+    @property
+    def available(self) -> bool:
+        """ Refresh time is known even when the data is stale """
+
+        return True
 
     @property
     def device_info(self) -> dict[str, Any]:
@@ -909,7 +3979,7 @@ class LastSeen(CoordinatorEntity, SensorEntity):
             "identifiers": {(DOMAIN, self.device_data.device_id), (DOMAIN, self.device_data.iot_code_tail)},
             "name": self.device_data.device_name,
             "manufacturer": "PurrSong",
-            "model": "Lavviebot S",
+            "model": "LavvieTag",
             "sw_version": self.device_data.current_firmware
         }
 
@@ -917,13 +3987,13 @@ class LastSeen(CoordinatorEntity, SensorEntity):
     def unique_id(self) -> str:
         """ Sets unique ID for this entity. """
 
-        return str(self.device_data.device_id) + '_last_seen'
+        return str(self.device_data.device_id) + '_tag_data_refreshed'
 
     @property
     def name(self) -> str:
         """ Return name of the entity """
 
-        return "Last seen"
+        return "Data refreshed"
 
     @property
     def has_entity_name(self) -> bool:
@@ -932,10 +4002,18 @@ class LastSeen(CoordinatorEntity, SensorEntity):
         return True
 
     @property
-    def native_value(self) -> datetime:
-        """ Returns date/time of the last time litter box connected to PurrSong servers """
+    def native_value(self) -> datetime | None:
+        """ Returns date/time LavvieTag data was last successfully refreshed """
 
-        return self.device_data.last_seen
+        return self.coordinator.refreshed_at['lavvie_tags'].get(self.device_id)
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """ Return whether the data is still fresh """
+
+        return {
+            "fresh": self.coordinator.is_fresh('lavvie_tags', self.device_id),
+        }
 
     @property
     def device_class(self) -> SensorDeviceClass:
@@ -951,11 +4029,107 @@ class LastSeen(CoordinatorEntity, SensorEntity):
 
     @property
     def icon(self) -> str:
-        return 'mdi:web'
+        return 'mdi:cloud-refresh'
 
 
-class LastUsed(CoordinatorEntity, SensorEntity):
-    """ Representation of last date/time litter box was used by a cat """
+class TagCloudUptime(CoordinatorEntity, SensorEntity):
+    """ Representation of LavvieTag cloud uptime """
+
+    def __init__(self, coordinator, device_id):
+        super().__init__(coordinator)
+        self.device_id = device_id
+
+
+    @property
+    def device_data(self) -> LavvieTag:
+        """ Handle coordinator LavvieTag data """
+
+        return self.coordinator.data.lavvie_tags[self.device_id]
+
+    @property
+    def available(self) -> bool:
+        """ Return True if LavvieTag data is fresh """
+
+        return super().available and self.coordinator.is_fresh('lavvie_tags', self.device_id)
+
+    @property
+    def device_info(self) -> dict[str, Any]:
+        """ Return device registry information for this entity. """
+
+        return {
+            "identifiers": {(DOMAIN, self.device_data.device_id), (DOMAIN, self.device_data.iot_code_tail)},
+            "name": self.device_data.device_name,
+            "manufacturer": "PurrSong",
+            "model": "LavvieTag",
+            "sw_version": self.device_data.current_firmware
+        }
+
+    @property
+    def unique_id(self) -> str:
+        """ Sets unique ID for this entity. """
+
+        return str(self.device_data.device_id) + '_cloud_uptime'
+
+    @property
+    def name(self) -> str:
+        """ Return name of the entity """
+
+        return "Cloud uptime"
+
+    @property
+    def has_entity_name(self) -> bool:
+        """ Indicate that entity has name defined """
+
+        return True
+
+    @property
+    def connectivity(self) -> ConnectivityHealth:
+        """ Handle LavvieTag connectivity health """
+
+        return self.coordinator.analytics.tracker('tag_connectivity', self.device_id)
+
+    @property
+    def native_value(self) -> float | None:
+        """ Return percentage of the last week the LavvieTag was reporting """
+
+        if (uptime := self.connectivity.uptime_ratio) is None:
+            return None
+        return round(uptime * 100, 2)
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """ Return outage counts """
+
+        return {
+            "outages_last_week": self.connectivity.recent_outages,
+            "outages": self.connectivity.outages,
+        }
+
+    @property
+    def native_unit_of_measurement(self) -> str:
+        """ Return percent as the native unit """
+
+        return PERCENTAGE
+
+    @property
+    def state_class(self) -> SensorStateClass:
+        """ Return the type of state_class """
+
+        return SensorStateClass.MEASUREMENT
+
+    @property
+    def entity_category(self) -> EntityCategory:
+        """ Set category to diagnostic. """
+
+        return EntityCategory.DIAGNOSTIC
+
+    @property
+    def icon(self) -> str:
+        return 'mdi:cloud-percent'
+
+
+class TagBattery(CoordinatorEntity, SensorEntity):
+    """ Representation of LavvieTag Battery Level """
 
     def __init__(self, coordinator, device_id):
         super().__init__(coordinator)
@@ -963,10 +4137,16 @@ class LastUsed(CoordinatorEntity, SensorEntity):
 
 
     @property
-    def device_data(self) -> LitterBox:
-        """ Handle coordinator litter box data """
+    def device_data(self) -> LavvieTag:
+        """ Handle coordinator LavvieTag data """
+
+        return self.coordinator.data.lavvie_tags[self.device_id]
+
+    @property
+    def available(self) -> bool:
+        """ Return True if LavvieTag data is fresh """
 
-        return self.coordinator.data.litterboxes[self.device_id]
+        return super().available and self.coordinator.is_fresh('lavvie_tags', self.device_id)
 
     @property
     def device_info(self) -> dict[str, Any]:
@@ -976,7 +4156,7 @@ class LastUsed(CoordinatorEntity, SensorEntity):
             "identifiers": {(DOMAIN, self.device_data.device_id), (DOMAIN, self.device_data.iot_code_tail)},
             "name": self.device_data.device_name,
             "manufacturer": "PurrSong",
-            "model": "Lavviebot S",
+            "model": "LavvieTag",
             "sw_version": self.device_data.current_firmware
         }
 
@@ -984,13 +4164,13 @@ class LastUsed(CoordinatorEntity, SensorEntity):
     def unique_id(self) -> str:
         """ Sets unique ID for this entity. """
 
-        return str(self.device_data.device_id) + '_last_used'
+        return str(self.device_data.device_id) + '_tag_battery'
 
     @property
     def name(self) -> str:
         """ Return name of the entity """
 
-        return "Last used"
+        return "Battery"
 
     @property
     def has_entity_name(self) -> bool:
@@ -999,20 +4179,41 @@ class LastUsed(CoordinatorEntity, SensorEntity):
         return True
 
     @property
-    def native_value(self) -> datetime:
-        """ Returns date/time of the last time litter box was used by a cat """
+    def native_value(self) -> int:
+        """ Return current battery level or 0 if there isn't one """
 
-        return self.device_data.last_used
+        if self.device_data.battery is not None:
+            return self.device_data.battery
+        else:
+            return 0
+
+    @property
+    def native_unit_of_measurement(self) -> str:
+        """ Uses percentage as the unit """
+
+        return PERCENTAGE
 
     @property
     def device_class(self) -> SensorDeviceClass:
         """ Return entity device class """
 
-        return SensorDeviceClass.TIMESTAMP
+        return SensorDeviceClass.BATTERY
 
+    @property
+    def state_class(self) -> SensorStateClass:
+        """ Return the type of state class """
+
+        return SensorStateClass.MEASUREMENT
+
+    @property
+    def entity_category(self) -> EntityCategory:
+        """ Set category to diagnostic. """
+
+        return EntityCategory.DIAGNOSTIC
 
-class LastUsedDuration(CoordinatorEntity, SensorEntity):
-    """ Representation of seconds litter box was used by most recent cat """
+
+class TagBatteryDrainRate(CoordinatorEntity, SensorEntity):
+    """ Representation of LavvieTag battery drain rate """
 
     def __init__(self, coordinator, device_id):
         super().__init__(coordinator)
@@ -1020,10 +4221,16 @@ class LastUsedDuration(CoordinatorEntity, SensorEntity):
 
 
     @property
-    def device_data(self) -> LitterBox:
-        """ Handle coordinator litter box data """
+    def device_data(self) -> LavvieTag:
+        """ Handle coordinator LavvieTag data """
 
-        return self.coordinator.data.litterboxes[self.device_id]
+        return self.coordinator.data.lavvie_tags[self.device_id]
+
+    @property
+    def available(self) -> bool:
+        """ Return True if LavvieTag data is fresh """
+
+        return super().available and self.coordinator.is_fresh('lavvie_tags', self.device_id)
 
     @property
     def device_info(self) -> dict[str, Any]:
@@ -1033,7 +4240,7 @@ class LastUsedDuration(CoordinatorEntity, SensorEntity):
             "identifiers": {(DOMAIN, self.device_data.device_id), (DOMAIN, self.device_data.iot_code_tail)},
             "name": self.device_data.device_name,
             "manufacturer": "PurrSong",
-            "model": "Lavviebot S",
+            "model": "LavvieTag",
             "sw_version": self.device_data.current_firmware
         }
 
@@ -1041,13 +4248,13 @@ class LastUsedDuration(CoordinatorEntity, SensorEntity):
     def unique_id(self) -> str:
         """ Sets unique ID for this entity. """
 
-        return str(self.device_data.device_id) + '_last_used_duration'
+        return str(self.device_data.device_id) + '_battery_drain_rate'
 
     @property
     def name(self) -> str:
         """ Return name of the entity """
 
-        return "Last used duration"
+        return "Battery drain rate"
 
     @property
     def has_entity_name(self) -> bool:
@@ -1056,30 +4263,54 @@ class LastUsedDuration(CoordinatorEntity, SensorEntity):
         return True
 
     @property
-    def native_value(self) -> float:
-        """ Returns number of seconds last cat used the litter box """
+    def battery_model(self) -> BatteryModel:
+        """ Handle LavvieTag battery model """
 
-        return round(self.device_data.last_used_duration, 1)
+        return self.coordinator.analytics.tracker('tag_battery', self.device_id)
 
     @property
-    def native_unit_of_measurement(self) -> UnitOfTime:
-        """ Return seconds as the native unit """
+    def native_value(self) -> float | None:
+        """ Return battery drain in percent per day """
 
-        return UnitOfTime.SECONDS
+        if self.battery_model.drain_rate is None:
+            return None
+        return round(self.battery_model.drain_rate, 2)
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """ Return battery replacement count and time """
+
+        replaced_at = self.battery_model.replaced_at
+        return {
+            "replacements": self.battery_model.replacements,
+            "last_replaced": None if replaced_at is None else dt_util.utc_from_timestamp(replaced_at).isoformat(),
+        }
+
+    @property
+    def native_unit_of_measurement(self) -> str:
+        """ Return percent per day as the native unit """
+
+        return f'{PERCENTAGE}/{UnitOfTime.DAYS}'
 
     @property
     def state_class(self) -> SensorStateClass:
-        """ Return the type of state class """
+        """ Return the type of state_class """
 
         return SensorStateClass.MEASUREMENT
 
+    @property
+    def entity_category(self) -> EntityCategory:
+        """ Set category to diagnostic. """
+
+        return EntityCategory.DIAGNOSTIC
+
     @property
     def icon(self) -> str:
-        return 'mdi:clock-outline'
+        return 'mdi:battery-arrow-down'
 
 
-class LitterBottomAmnt(CoordinatorEntity, SensorEntity):
-    """ Representation of current litter weight in tray """
+class TagBatteryEmptyIn(CoordinatorEntity, SensorEntity):
+    """ Representation of LavvieTag days until battery is empty """
 
     def __init__(self, coordinator, device_id):
         super().__init__(coordinator)
@@ -1087,10 +4318,16 @@ class LitterBottomAmnt(CoordinatorEntity, SensorEntity):
 
 
     @property
-    def device_data(self) -> LitterBox:
-        """ Handle coordinator litter box data """
+    def device_data(self) -> LavvieTag:
+        """ Handle coordinator LavvieTag data """
 
-        return self.coordinator.data.litterboxes[self.device_id]
+        return self.coordinator.data.lavvie_tags[self.device_id]
+
+    @property
+    def available(self) -> bool:
+        """ Return True if LavvieTag data is fresh """
+
+        return super().available and self.coordinator.is_fresh('lavvie_tags', self.device_id)
 
     @property
     def device_info(self) -> dict[str, Any]:
@@ -1100,7 +4337,7 @@ class LitterBottomAmnt(CoordinatorEntity, SensorEntity):
             "identifiers": {(DOMAIN, self.device_data.device_id), (DOMAIN, self.device_data.iot_code_tail)},
             "name": self.device_data.device_name,
             "manufacturer": "PurrSong",
-            "model": "Lavviebot S",
+            "model": "LavvieTag",
             "sw_version": self.device_data.current_firmware
         }
 
@@ -1108,13 +4345,13 @@ class LitterBottomAmnt(CoordinatorEntity, SensorEntity):
     def unique_id(self) -> str:
         """ Sets unique ID for this entity. """
 
-        return str(self.device_data.device_id) + '_litter_bottom_amnt'
+        return str(self.device_data.device_id) + '_battery_empty_in'
 
     @property
     def name(self) -> str:
         """ Return name of the entity """
 
-        return "Litter bottom amount"
+        return "Battery empty in"
 
     @property
     def has_entity_name(self) -> bool:
@@ -1123,65 +4360,73 @@ class LitterBottomAmnt(CoordinatorEntity, SensorEntity):
         return True
 
     @property
-    def native_value(self) -> float:
-        """ Returns number of pounds of litter in the tray """
+    def battery_model(self) -> BatteryModel:
+        """ Handle LavvieTag battery model """
 
-        return round(self.device_data.litter_bottom_amount_pnds, 1)
+        return self.coordinator.analytics.tracker('tag_battery', self.device_id)
 
     @property
-    def native_unit_of_measurement(self) -> UnitOfMass:
-        """ Return pounds as the native unit """
+    def native_value(self) -> float | None:
+        """ Return days until battery is predicted to be empty """
 
-        return UnitOfMass.POUNDS
+        days = self.battery_model.days_remaining(dt_util.utcnow())
+        if days is None:
+            return None
+        return round(days, 1)
 
     @property
-    def state_class(self) -> SensorStateClass:
-        """ Return the type of state class """
+    def native_unit_of_measurement(self) -> UnitOfTime:
+        """ Return days as the native unit """
 
-        return SensorStateClass.MEASUREMENT
+        return UnitOfTime.DAYS
 
     @property
-    def icon(self) -> str:
-        return 'mdi:scale'
-
+    def device_class(self) -> SensorDeviceClass:
+        """ Return entity device class """
 
-class LitterType(CoordinatorEntity, SensorEntity):
-    """ Representation of current litter type """
+        return SensorDeviceClass.DURATION
 
-    def __init__(self, coordinator, device_id):
-        super().__init__(coordinator)
-        self.device_id = device_id
+    @property
+    def entity_category(self) -> EntityCategory:
+        """ Set category to diagnostic. """
 
+        return EntityCategory.DIAGNOSTIC
 
     @property
-    def device_data(self) -> LitterBox:
-        """ Handle coordinator litter box data """
+    def icon(self) -> str:
+        return 'mdi:battery-clock'
+
+
+class FleetVisitsToday(CoordinatorEntity, SensorEntity):
+    """ Representation of litter box visits today across the PurrSong account """
+
+    def __init__(self, coordinator):
+        super().__init__(coordinator)
 
-        return self.coordinator.data.litterboxes[self.device_id]
 
     @property
     def device_info(self) -> dict[str, Any]:
         """ Return device registry information for this entity. """
 
         return {
-            "identifiers": {(DOMAIN, self.device_data.device_id), (DOMAIN, self.device_data.iot_code_tail)},
-            "name": self.device_data.device_name,
+            "identifiers": {(DOMAIN, self.coordinator.entry.entry_id)},
+            "name": "PurrSong account",
             "manufacturer": "PurrSong",
-            "model": "Lavviebot S",
-            "sw_version": self.device_data.current_firmware
+            "model": "Cloud account",
+            "entry_type": DeviceEntryType.SERVICE,
         }
 
     @property
     def unique_id(self) -> str:
         """ Sets unique ID for this entity. """
 
-        return str(self.device_data.device_id) + '_litter_type'
+        return self.coordinator.entry.entry_id + '_fleet_visits_today'
 
     @property
     def name(self) -> str:
         """ Return name of the entity """
 
-        return "Litter type"
+        return "Visits today"
 
     @property
     def has_entity_name(self) -> bool:
@@ -1190,58 +4435,52 @@ class LitterType(CoordinatorEntity, SensorEntity):
         return True
 
     @property
-    def native_value(self) -> str:
-        """ Returns litter type """
+    def native_value(self) -> int | None:
+        """ Return litter box visits today """
 
-        return LITTER_TYPE.get(self.device_data.litter_type, 'Unknown')
+        return self.coordinator.analytics.fleet.total('visits_today')
 
     @property
-    def entity_category(self) -> EntityCategory:
-        """ Set category to diagnostic. """
+    def state_class(self) -> SensorStateClass:
+        """ Return the type of state_class """
 
-        return EntityCategory.DIAGNOSTIC
+        return SensorStateClass.MEASUREMENT
 
     @property
     def icon(self) -> str:
-        return 'mdi:tray'
+        return 'mdi:counter'
 
 
-class MinBottomWeight(CoordinatorEntity, SensorEntity):
-    """ Representation of minimum bottom weight that is set up """
+class FleetWasteFull(CoordinatorEntity, SensorEntity):
+    """ Representation of litter boxes with a full waste drawer across the PurrSong account """
 
-    def __init__(self, coordinator, device_id):
+    def __init__(self, coordinator):
         super().__init__(coordinator)
-        self.device_id = device_id
-
-    @property
-    def device_data(self) -> LitterBox:
-        """ Handle coordinator litter box data """
 
-        return self.coordinator.data.litterboxes[self.device_id]
 
     @property
     def device_info(self) -> dict[str, Any]:
         """ Return device registry information for this entity. """
 
         return {
-            "identifiers": {(DOMAIN, self.device_data.device_id), (DOMAIN, self.device_data.iot_code_tail)},
-            "name": self.device_data.device_name,
+            "identifiers": {(DOMAIN, self.coordinator.entry.entry_id)},
+            "name": "PurrSong account",
             "manufacturer": "PurrSong",
-            "model": "Lavviebot S",
-            "sw_version": self.device_data.current_firmware
+            "model": "Cloud account",
+            "entry_type": DeviceEntryType.SERVICE,
         }
 
     @property
     def unique_id(self) -> str:
         """ Sets unique ID for this entity. """
 
-        return str(self.device_data.device_id) + '_min_bottom_weight'
+        return self.coordinator.entry.entry_id + '_fleet_waste_full'
 
     @property
     def name(self) -> str:
         """ Return name of the entity """
 
-        return "Minimum bottom weight"
+        return "Waste drawers full"
 
     @property
     def has_entity_name(self) -> bool:
@@ -1250,71 +4489,52 @@ class MinBottomWeight(CoordinatorEntity, SensorEntity):
         return True
 
     @property
-    def native_value(self) -> float:
-        """ Returns number of pounds minimum bottom weight is set to """
-
-        return round(self.device_data.min_bottom_weight_pnds, 1)
-
-    @property
-    def native_unit_of_measurement(self) -> UnitOfMass:
-        """ Return pounds as the native unit """
+    def native_value(self) -> int | None:
+        """ Return litter boxes with a full waste drawer """
 
-        return UnitOfMass.POUNDS
+        return self.coordinator.analytics.fleet.total('waste_full')
 
     @property
     def state_class(self) -> SensorStateClass:
-        """ Return the type of state class """
+        """ Return the type of state_class """
 
         return SensorStateClass.MEASUREMENT
 
-    @property
-    def entity_category(self) -> EntityCategory:
-        """ Set category to diagnostic. """
-
-        return EntityCategory.DIAGNOSTIC
-
     @property
     def icon(self) -> str:
-        return 'mdi:scale'
+        return 'mdi:delete-alert'
 
 
-class TopLitterStatus(CoordinatorEntity, SensorEntity):
-    """ Representation of litter storage status """
+class FleetRefillNeeded(CoordinatorEntity, SensorEntity):
+    """ Representation of litter boxes needing a litter storage refill across the PurrSong account """
 
-    def __init__(self, coordinator, device_id):
+    def __init__(self, coordinator):
         super().__init__(coordinator)
-        self.device_id = device_id
-
-
-    @property
-    def device_data(self) -> LitterBox:
-        """ Handle coordinator litter box data """
 
-        return self.coordinator.data.litterboxes[self.device_id]
 
     @property
     def device_info(self) -> dict[str, Any]:
         """ Return device registry information for this entity. """
 
         return {
-            "identifiers": {(DOMAIN, self.device_data.device_id), (DOMAIN, self.device_data.iot_code_tail)},
-            "name": self.device_data.device_name,
+            "identifiers": {(DOMAIN, self.coordinator.entry.entry_id)},
+            "name": "PurrSong account",
             "manufacturer": "PurrSong",
-            "model": "Lavviebot S",
-            "sw_version": self.device_data.current_firmware
+            "model": "Cloud account",
+            "entry_type": DeviceEntryType.SERVICE,
         }
 
     @property
     def unique_id(self) -> str:
         """ Sets unique ID for this entity. """
 
-        return str(self.device_data.device_id) + '_storage_status'
+        return self.coordinator.entry.entry_id + '_fleet_refill_needed'
 
     @property
     def name(self) -> str:
         """ Return name of the entity """
 
-        return "Storage status"
+        return "Litter refills needed"
 
     @property
     def has_entity_name(self) -> bool:
@@ -1323,59 +4543,52 @@ class TopLitterStatus(CoordinatorEntity, SensorEntity):
         return True
 
     @property
-    def native_value(self) -> str:
-        """ Returns status of litter storage compartment """
+    def native_value(self) -> int | None:
+        """ Return litter boxes needing a litter storage refill """
 
-        return STORAGE_STATUS.get(self.device_data.top_litter_status, 'Unknown')
+        return self.coordinator.analytics.fleet.total('refill_needed')
 
     @property
-    def icon(self) -> str:
-        """Set icon based on storage level"""
-        if self.device_data.top_litter_status == 2:
-            return 'mdi:gauge-full'
-        if self.device_data.top_litter_status == 1:
-            return 'mdi:gauge'
-        if self.device_data.top_litter_status == 0:
-            return 'mdi:gauge-empty'
+    def state_class(self) -> SensorStateClass:
+        """ Return the type of state_class """
 
+        return SensorStateClass.MEASUREMENT
 
-class WaitTime(CoordinatorEntity, SensorEntity):
-    """ Representation of minutes litter box is set to wait before scooping """
+    @property
+    def icon(self) -> str:
+        return 'mdi:gauge-empty'
 
-    def __init__(self, coordinator, device_id):
-        super().__init__(coordinator)
-        self.device_id = device_id
 
+class FleetFirmwarePending(CoordinatorEntity, SensorEntity):
+    """ Representation of devices with a firmware update available across the PurrSong account """
 
-    @property
-    def device_data(self) -> LitterBox:
-        """ Handle coordinator litter box data """
+    def __init__(self, coordinator):
+        super().__init__(coordinator)
 
-        return self.coordinator.data.litterboxes[self.device_id]
 
     @property
     def device_info(self) -> dict[str, Any]:
         """ Return device registry information for this entity. """
 
         return {
-            "identifiers": {(DOMAIN, self.device_data.device_id), (DOMAIN, self.device_data.iot_code_tail)},
-            "name": self.device_data.device_name,
+            "identifiers": {(DOMAIN, self.coordinator.entry.entry_id)},
+            "name": "PurrSong account",
             "manufacturer": "PurrSong",
-            "model": "Lavviebot S",
-            "sw_version": self.device_data.current_firmware
+            "model": "Cloud account",
+            "entry_type": DeviceEntryType.SERVICE,
         }
 
     @property
     def unique_id(self) -> str:
         """ Sets unique ID for this entity. """
 
-        return str(self.device_data.device_id) + '_wait_time'
+        return self.coordinator.entry.entry_id + '_fleet_firmware_pending'
 
     @property
     def name(self) -> str:
         """ Return name of the entity """
 
-        return "Wait time"
+        return "Firmware updates pending"
 
     @property
     def has_entity_name(self) -> bool:
@@ -1384,65 +4597,52 @@ class WaitTime(CoordinatorEntity, SensorEntity):
         return True
 
     @property
-    def native_value(self) -> int:
-        """ Returns number of minutes litter box is set to wait before scooping """
-
-        return self.device_data.wait_time
-
-    @property
-    def native_unit_of_measurement(self) -> UnitOfTime:
-        """ Return minutes as the native unit """
+    def native_value(self) -> int | None:
+        """ Return devices with a firmware update available """
 
-        return UnitOfTime.MINUTES
+        return self.coordinator.analytics.fleet.total('firmware_pending')
 
     @property
-    def entity_category(self) -> EntityCategory:
-        """ Set category to diagnostic. """
+    def state_class(self) -> SensorStateClass:
+        """ Return the type of state_class """
 
-        return EntityCategory.DIAGNOSTIC
+        return SensorStateClass.MEASUREMENT
 
     @property
     def icon(self) -> str:
-        return 'mdi:clock-outline'
+        return 'mdi:package-up'
 
 
-class WasteStatus(CoordinatorEntity, SensorEntity):
-    """ Representation of litter box waste status """
+class FleetOffline(CoordinatorEntity, SensorEntity):
+    """ Representation of devices not reporting to PurrSong servers across the PurrSong account """
 
-    def __init__(self, coordinator, device_id):
+    def __init__(self, coordinator):
         super().__init__(coordinator)
-        self.device_id = device_id
-
-
-    @property
-    def device_data(self) -> LitterBox:
-        """ Handle coordinator litter box data """
 
-        return self.coordinator.data.litterboxes[self.device_id]
 
     @property
     def device_info(self) -> dict[str, Any]:
         """ Return device registry information for this entity. """
 
         return {
-            "identifiers": {(DOMAIN, self.device_data.device_id), (DOMAIN, self.device_data.iot_code_tail)},
-            "name": self.device_data.device_name,
+            "identifiers": {(DOMAIN, self.coordinator.entry.entry_id)},
+            "name": "PurrSong account",
             "manufacturer": "PurrSong",
-            "model": "Lavviebot S",
-            "sw_version": self.device_data.current_firmware
+            "model": "Cloud account",
+            "entry_type": DeviceEntryType.SERVICE,
         }
 
     @property
     def unique_id(self) -> str:
         """ Sets unique ID for this entity. """
 
-        return str(self.device_data.device_id) + '_waste_status'
+        return self.coordinator.entry.entry_id + '_fleet_offline'
 
     @property
     def name(self) -> str:
         """ Return name of the entity """
 
-        return "Waste status"
+        return "Devices offline"
 
     @property
     def has_entity_name(self) -> bool:
@@ -1451,59 +4651,52 @@ class WasteStatus(CoordinatorEntity, SensorEntity):
         return True
 
     @property
-    def native_value(self) -> str:
-        """ Returns status of litter storage compartment """
+    def native_value(self) -> int | None:
+        """ Return devices not reporting to PurrSong servers """
 
-        return WASTE_STATUS.get(self.device_data.waste_drawer_status, 'Unknown')
+        return self.coordinator.analytics.fleet.total('offline')
 
     @property
-    def icon(self) -> str:
-        """Set icon based on storage level"""
-        if self.device_data.waste_drawer_status == 2:
-            return 'mdi:gauge-empty'
-        if self.device_data.waste_drawer_status == 1:
-            return 'mdi:gauge'
-        if self.device_data.waste_drawer_status == 0:
-            return 'mdi:gauge-full'
+    def state_class(self) -> SensorStateClass:
+        """ Return the type of state_class """
 
+        return SensorStateClass.MEASUREMENT
 
-class LitterBoxUseCount(CoordinatorEntity, SensorEntity):
-    """ Representation of litter box use count """
+    @property
+    def icon(self) -> str:
+        return 'mdi:cloud-off-outline'
 
-    def __init__(self, coordinator, device_id):
-        super().__init__(coordinator)
-        self.device_id = device_id
 
+class CloudCircuit(CoordinatorEntity, SensorEntity):
+    """ Representation of the PurrSong cloud circuit breaker state """
 
-    @property
-    def device_data(self) -> LitterBox:
-        """ Handle coordinator litter box data """
+    def __init__(self, coordinator):
+        super().__init__(coordinator)
 
-        return self.coordinator.data.litterboxes[self.device_id]
 
     @property
     def device_info(self) -> dict[str, Any]:
         """ Return device registry information for this entity. """
 
         return {
-            "identifiers": {(DOMAIN, self.device_data.device_id), (DOMAIN, self.device_data.iot_code_tail)},
-            "name": self.device_data.device_name,
+            "identifiers": {(DOMAIN, self.coordinator.entry.entry_id)},
+            "name": "PurrSong account",
             "manufacturer": "PurrSong",
-            "model": "Lavviebot S",
-            "sw_version": self.device_data.current_firmware
+            "model": "Cloud account",
+            "entry_type": DeviceEntryType.SERVICE,
         }
 
     @property
     def unique_id(self) -> str:
         """ Sets unique ID for this entity. """
 
-        return str(self.device_data.device_id) + '_lb_use_count'
+        return self.coordinator.entry.entry_id + '_cloud_circuit'
 
     @property
     def name(self) -> str:
         """ Return name of the entity """
 
-        return "Use count"
+        return "Cloud circuit"
 
     @property
     def has_entity_name(self) -> bool:
@@ -1512,55 +4705,84 @@ class LitterBoxUseCount(CoordinatorEntity, SensorEntity):
         return True
 
     @property
-    def native_value(self) -> int:
-        """ Returns litter box usage count for today """
+    def native_value(self) -> str:
+        """ Return current circuit breaker state """
 
-        return self.device_data.times_used_today
+        return self.coordinator.breaker.state.value
 
     @property
-    def icon(self) -> str:
-        """Set icon"""
-        
-        return 'mdi:counter'
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """ Return consecutive failures and when the next probe is allowed """
 
+        return {
+            "consecutive_failures": self.coordinator.breaker.failures,
+            "next_probe": self.coordinator.breaker.probe_at,
+        }
 
-class LatestError(CoordinatorEntity, SensorEntity):
-    """ Representation of litter box latest error """
+    @property
+    def device_class(self) -> SensorDeviceClass:
+        """ Return entity device class """
 
-    def __init__(self, coordinator, device_id):
-        super().__init__(coordinator)
-        self.device_id = device_id
+        return SensorDeviceClass.ENUM
+
+    @property
+    def options(self) -> list[str]:
+        """ Return possible circuit breaker states """
 
+        return [state.value for state in CircuitState]
 
     @property
-    def device_data(self) -> LitterBox:
-        """ Handle coordinator litter box data """
+    def entity_category(self) -> EntityCategory:
+        """ Set category to diagnostic. """
+
+        return EntityCategory.DIAGNOSTIC
+
+    @property
+    def available(self) -> bool:
+        """ Circuit state is known even when the cloud is unreachable """
+
+        return True
+
+    @property
+    def icon(self) -> str:
+        """ Set icon based on circuit state """
+
+        if self.coordinator.breaker.state == CircuitState.CLOSED:
+            return 'mdi:cloud-check'
+        else:
+            return 'mdi:cloud-alert'
+
+
+class RefreshDuration(CoordinatorEntity, SensorEntity):
+    """ Representation of how long the latest refresh from PurrSong servers took """
+
+    def __init__(self, coordinator):
+        super().__init__(coordinator)
 
-        return self.coordinator.data.litterboxes[self.device_id]
 
     @property
     def device_info(self) -> dict[str, Any]:
         """ Return device registry information for this entity. """
 
         return {
-            "identifiers": {(DOMAIN, self.device_data.device_id), (DOMAIN, self.device_data.iot_code_tail)},
-            "name": self.device_data.device_name,
+            "identifiers": {(DOMAIN, self.coordinator.entry.entry_id)},
+            "name": "PurrSong account",
             "manufacturer": "PurrSong",
-            "model": "Lavviebot S",
-            "sw_version": self.device_data.current_firmware
+            "model": "Cloud account",
+            "entry_type": DeviceEntryType.SERVICE,
         }
 
     @property
     def unique_id(self) -> str:
         """ Sets unique ID for this entity. """
 
-        return str(self.device_data.device_id) + '_latest_error'
+        return self.coordinator.entry.entry_id + '_refresh_duration'
 
     @property
     def name(self) -> str:
         """ Return name of the entity """
 
-        return "Latest error"
+        return "Refresh duration"
 
     @property
     def has_entity_name(self) -> bool:
@@ -1568,6 +4790,49 @@ class LatestError(CoordinatorEntity, SensorEntity):
 
         return True
 
+    @property
+    def native_value(self) -> float | None:
+        """ Return duration of the latest refresh in seconds """
+
+        if self.coordinator.last_refresh_duration is None:
+            return None
+        return round(self.coordinator.last_refresh_duration, 2)
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """ Return request timeout, latency percentiles and stalled refreshes """
+
+        latency = self.coordinator.latency
+        median = latency.quantile(0.5)
+        upper = latency.quantile(latency.percentile)
+        return {
+            "request_timeout": self.coordinator.client.timeout,
+            "latency_p50": None if median is None else round(median, 3),
+            f"latency_p{round(latency.percentile * 100)}": None if upper is None else round(upper, 3),
+            "poll_interval": self.coordinator.update_interval.total_seconds(),
+            "refresh_deadline": self.coordinator.refresh_deadline,
+            "stalled_refreshes": self.coordinator.stalled_refreshes,
+            "last_stall_duration": self.coordinator.last_stall_duration,
+        }
+
+    @property
+    def native_unit_of_measurement(self) -> UnitOfTime:
+        """ Return seconds as the native unit """
+
+        return UnitOfTime.SECONDS
+
+    @property
+    def device_class(self) -> SensorDeviceClass:
+        """ Return entity device class """
+
+        return SensorDeviceClass.DURATION
+
+    @property
+    def state_class(self) -> SensorStateClass:
+        """ Return the type of state class """
+
+        return SensorStateClass.MEASUREMENT
+
     @property
     def entity_category(self) -> EntityCategory:
         """ Set category to diagnostic. """
@@ -1575,23 +4840,18 @@ class LatestError(CoordinatorEntity, SensorEntity):
         return EntityCategory.DIAGNOSTIC
 
     @property
-    def native_value(self) -> str:
-        """ Returns the most recent error """
+    def available(self) -> bool:
+        """ Refresh timing is known even when the cloud is unreachable """
 
-        if self.device_data.error_log:
-            return ERROR_LOG_CODES.get(self.device_data.error_log[0]['status'], 'Unknown error code')
-        else:
-            return "No errors in log"
+        return True
 
     @property
     def icon(self) -> str:
-        """Set icon"""
-        
-        return 'mdi:alert-circle'
+        return 'mdi:timer-sand'
 
 
-class ErrorTime(CoordinatorEntity, SensorEntity):
-    """ Representation of when latest error occurred """
+class LitterBoxSummary(CoordinatorEntity, SensorEntity):
+    """ Representation of a compact Lavviebot summary for summary mode """
 
     def __init__(self, coordinator, device_id):
         super().__init__(coordinator)
@@ -1604,6 +4864,12 @@ class ErrorTime(CoordinatorEntity, SensorEntity):
 
         return self.coordinator.data.litterboxes[self.device_id]
 
+    @property
+    def available(self) -> bool:
+        """ Return True if litter box data is fresh """
+
+        return super().available and self.coordinator.is_fresh('litterboxes', self.device_id)
+
     @property
     def device_info(self) -> dict[str, Any]:
         """ Return device registry information for this entity. """
@@ -1620,13 +4886,13 @@ class ErrorTime(CoordinatorEntity, SensorEntity):
     def unique_id(self) -> str:
         """ Sets unique ID for this entity. """
 
-        return str(self.device_data.device_id) + '_error_time'
+        return str(self.device_data.device_id) + '_summary'
 
     @property
     def name(self) -> str:
         """ Return name of the entity """
 
-        return "Error time"
+        return "Summary"
 
     @property
     def has_entity_name(self) -> bool:
@@ -1635,41 +4901,45 @@ class ErrorTime(CoordinatorEntity, SensorEntity):
         return True
 
     @property
-    def entity_category(self) -> EntityCategory:
-        """ Set category to diagnostic. """
-
-        return EntityCategory.DIAGNOSTIC
-
-    @property
-    def native_value(self) -> datetime | str:
-        """ Returns datetime of the most recent error """
+    def native_value(self) -> str:
+        """ Return overall status of litter box """
 
-        return datetime.utcfromtimestamp(int(self.device_data.error_log[0]['creationTime']) / 1000).replace(tzinfo=timezone.utc)
+        if self.device_data.waste_drawer_status == 0:
+            return 'Waste Full'
+        if self.device_data.top_litter_status == 0:
+            return 'Refill Needed'
+        if self.device_data.waste_drawer_status == 1 or self.device_data.top_litter_status == 1:
+            return 'Attention'
+        return 'OK'
 
     @property
-    def device_class(self) -> SensorDeviceClass:
-        """ Return entity device class """
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """ Return the main litter box readings """
 
-        return SensorDeviceClass.TIMESTAMP
+        latest_error = None
+        if self.device_data.error_log:
+            latest_error = ERROR_LOG_CODES.get(self.device_data.error_log[0]['status'], 'Unknown error code')
+        return {
+            "waste_status": WASTE_STATUS.get(self.device_data.waste_drawer_status, 'Unknown'),
+            "storage_status": STORAGE_STATUS.get(self.device_data.top_litter_status, 'Unknown'),
+            "litter_bottom_amount": round(self.device_data.litter_bottom_amount_pnds, 2),
+            "humidity": self.device_data.humidity,
+            "temperature": self.device_data.temperature_c,
+            "uses_today": self.device_data.times_used_today,
+            "last_used": self.device_data.last_used,
+            "last_cat_used": self.device_data.last_cat_used_name,
+            "last_seen": self.device_data.last_seen,
+            "firmware_update": self.device_data.latest_firmware != self.device_data.current_firmware,
+            "latest_error": latest_error,
+        }
 
     @property
     def icon(self) -> str:
-        """Set icon"""
-        
-        return 'mdi:calendar-clock'
-
-    @property
-    def available(self) -> bool:
-        """Make entity available if there is an error log"""
+        return 'mdi:robot'
 
-        if self.device_data.error_log:
-            return True
-        else:
-            return False
-        
 
-class ScannerLastSeen(CoordinatorEntity, SensorEntity):
-    """ Representation of last date/time LavvieScanner connected to PurrSong servers """
+class ScannerSummary(CoordinatorEntity, SensorEntity):
+    """ Representation of a compact LavvieScanner summary for summary mode """
 
     def __init__(self, coordinator, device_id):
         super().__init__(coordinator)
@@ -1682,6 +4952,12 @@ class ScannerLastSeen(CoordinatorEntity, SensorEntity):
 
         return self.coordinator.data.lavvie_scanners[self.device_id]
 
+    @property
+    def available(self) -> bool:
+        """ Return True if LavvieScanner data is fresh """
+
+        return super().available and self.coordinator.is_fresh('lavvie_scanners', self.device_id)
+
     @property
     def device_info(self) -> dict[str, Any]:
         """ Return device registry information for this entity. """
@@ -1698,13 +4974,13 @@ class ScannerLastSeen(CoordinatorEntity, SensorEntity):
     def unique_id(self) -> str:
         """ Sets unique ID for this entity. """
 
-        return str(self.device_data.device_id) + '_last_seen'
+        return str(self.device_data.device_id) + '_summary'
 
     @property
     def name(self) -> str:
         """ Return name of the entity """
 
-        return "Last seen"
+        return "Summary"
 
     @property
     def has_entity_name(self) -> bool:
@@ -1713,30 +4989,27 @@ class ScannerLastSeen(CoordinatorEntity, SensorEntity):
         return True
 
     @property
-    def native_value(self) -> datetime:
-        """ Returns date/time of the last time scanner connected to PurrSong servers """
-
-        return self.device_data.last_seen
-
-    @property
-    def device_class(self) -> SensorDeviceClass:
-        """ Return entity device class """
+    def native_value(self) -> str:
+        """ Return WiFi status of LavvieScanner """
 
-        return SensorDeviceClass.TIMESTAMP
+        return 'Connected' if self.device_data.wifi_status else 'Disconnected'
 
     @property
-    def entity_category(self) -> EntityCategory:
-        """ Set category to diagnostic. """
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """ Return the main LavvieScanner readings """
 
-        return EntityCategory.DIAGNOSTIC
+        return {
+            "last_seen": self.device_data.last_seen,
+            "firmware_update": self.device_data.latest_firmware != self.device_data.current_firmware,
+        }
 
     @property
     def icon(self) -> str:
-        return 'mdi:web'
+        return 'mdi:antenna'
 
 
-class TagLastSeen(CoordinatorEntity, SensorEntity):
-    """ Representation of last date/time LavvieTag connected """
+class TagSummary(CoordinatorEntity, SensorEntity):
+    """ Representation of a compact LavvieTag summary for summary mode """
 
     def __init__(self, coordinator, device_id):
         super().__init__(coordinator)
@@ -1749,6 +5022,12 @@ class TagLastSeen(CoordinatorEntity, SensorEntity):
 
         return self.coordinator.data.lavvie_tags[self.device_id]
 
+    @property
+    def available(self) -> bool:
+        """ Return True if LavvieTag data is fresh """
+
+        return super().available and self.coordinator.is_fresh('lavvie_tags', self.device_id)
+
     @property
     def device_info(self) -> dict[str, Any]:
         """ Return device registry information for this entity. """
@@ -1765,13 +5044,13 @@ class TagLastSeen(CoordinatorEntity, SensorEntity):
     def unique_id(self) -> str:
         """ Sets unique ID for this entity. """
 
-        return str(self.device_data.device_id) + '_tag_last_seen'
+        return str(self.device_data.device_id) + '_summary'
 
     @property
     def name(self) -> str:
         """ Return name of the entity """
 
-        return "Last seen"
+        return "Summary"
 
     @property
     def has_entity_name(self) -> bool:
@@ -1780,65 +5059,75 @@ class TagLastSeen(CoordinatorEntity, SensorEntity):
         return True
 
     @property
-    def native_value(self) -> datetime:
-        """ Returns date/time of the last time tag connected """
+    def native_value(self) -> int:
+        """ Return battery level of LavvieTag """
 
-        return self.device_data.last_seen
+        return self.device_data.battery
 
     @property
-    def device_class(self) -> SensorDeviceClass:
-        """ Return entity device class """
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """ Return the main LavvieTag readings """
 
-        return SensorDeviceClass.TIMESTAMP
+        return {
+            "last_seen": self.device_data.last_seen,
+            "firmware_update": self.device_data.latest_firmware != self.device_data.current_firmware,
+        }
 
     @property
-    def entity_category(self) -> EntityCategory:
-        """ Set category to diagnostic. """
+    def native_unit_of_measurement(self) -> str:
+        """ Return percent as the native unit """
 
-        return EntityCategory.DIAGNOSTIC
+        return PERCENTAGE
 
     @property
-    def icon(self) -> str:
-        return 'mdi:web'
+    def device_class(self) -> SensorDeviceClass:
+        """ Return entity device class """
 
+        return SensorDeviceClass.BATTERY
 
-class TagBattery(CoordinatorEntity, SensorEntity):
-    """ Representation of LavvieTag Battery Level """
 
-    def __init__(self, coordinator, device_id):
+class CatSummary(CoordinatorEntity, SensorEntity):
+    """ Representation of a compact Cat summary for summary mode """
+
+    def __init__(self, coordinator, cat_id):
         super().__init__(coordinator)
-        self.device_id = device_id
+        self.cat_id = cat_id
 
 
     @property
-    def device_data(self) -> LavvieTag:
-        """ Handle coordinator LavvieTag data """
+    def cat_data(self) -> Cat:
+        """ Handle coordinator cat data """
 
-        return self.coordinator.data.lavvie_tags[self.device_id]
+        return self.coordinator.data.cats[self.cat_id]
+
+    @property
+    def available(self) -> bool:
+        """ Return True if cat data is fresh """
+
+        return super().available and self.coordinator.is_fresh('cats', self.cat_id)
 
     @property
     def device_info(self) -> dict[str, Any]:
         """ Return device registry information for this entity. """
 
         return {
-            "identifiers": {(DOMAIN, self.device_data.device_id), (DOMAIN, self.device_data.iot_code_tail)},
-            "name": self.device_data.device_name,
+            "identifiers": {(DOMAIN, self.cat_data.cat_id)},
+            "name": self.cat_data.cat_name,
             "manufacturer": "PurrSong",
-            "model": "LavvieTag",
-            "sw_version": self.device_data.current_firmware
+            "model": "Cat",
         }
 
     @property
     def unique_id(self) -> str:
         """ Sets unique ID for this entity. """
 
-        return str(self.device_data.device_id) + '_tag_battery'
+        return str(self.cat_data.cat_id) + '_summary'
 
     @property
     def name(self) -> str:
         """ Return name of the entity """
 
-        return "Battery"
+        return "Summary"
 
     @property
     def has_entity_name(self) -> bool:
@@ -1848,33 +5137,28 @@ class TagBattery(CoordinatorEntity, SensorEntity):
 
     @property
     def native_value(self) -> int:
-        """ Return current battery level or 0 if there isn't one """
-
-        if self.device_data.battery is not None:
-            return self.device_data.battery
-        else:
-            return 0
-
-    @property
-    def native_unit_of_measurement(self) -> str:
-        """ Uses percentage as the unit """
+        """ Return number of litter box visits today """
 
-        return PERCENTAGE
+        return self.cat_data.poop_count
 
     @property
-    def device_class(self) -> SensorDeviceClass:
-        """ Return entity device class """
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """ Return the main cat readings, and activity if cat is using a LavvieTag """
 
-        return SensorDeviceClass.BATTERY
+        attributes = {
+            "weight": self.cat_data.cat_weight_pnds,
+            "use_duration": self.cat_data.duration,
+        }
+        if self.cat_data.has_lavvietag:
+            attributes.update({activity: getattr(self.cat_data, activity) for activity in ACTIVITIES})
+        return attributes
 
     @property
     def state_class(self) -> SensorStateClass:
-        """ Return the type of state class """
+        """ Return the type of state_class """
 
         return SensorStateClass.MEASUREMENT
 
     @property
-    def entity_category(self) -> EntityCategory:
-        """ Set category to diagnostic. """
-
-        return EntityCategory.DIAGNOSTIC
+    def icon(self) -> str:
+        return 'mdi:cat'
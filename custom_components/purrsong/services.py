@@ -0,0 +1,71 @@
+""" Services for PurrSong integration."""
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+import voluptuous as vol
+
+from homeassistant.const import ATTR_DEVICE_ID
+from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse, SupportsResponse, callback
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers import device_registry as dr
+
+from .const import ATTR_CONFIG_ENTRY_ID, DOMAIN, SERVICE_REFRESH
+from .coordinator import LavviebotDataUpdateCoordinator
+
+REFRESH_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_CONFIG_ENTRY_ID): str,
+        vol.Optional(ATTR_DEVICE_ID): str,
+    }
+)
+
+
+@callback
+def async_register_services(hass: HomeAssistant) -> None:
+    """ Register PurrSong services. """
+
+    async def async_refresh(call: ServiceCall) -> ServiceResponse:
+        """ Refresh one or all PurrSong accounts and report what changed.
+
+        When a device is given, its account is refreshed and only changes to
+        that device are reported.
+        """
+
+        coordinators: dict[str, LavviebotDataUpdateCoordinator] = hass.data.get(DOMAIN, {})
+        item_ids: set[Any] | None = None
+        if device_id := call.data.get(ATTR_DEVICE_ID):
+            if (device := dr.async_get(hass).async_get(device_id)) is None:
+                raise ServiceValidationError(f'Unknown device {device_id}')
+            entry_ids = [entry_id for entry_id in device.config_entries if entry_id in coordinators]
+            item_ids = {identifier for domain, identifier in device.identifiers if domain == DOMAIN}
+        elif entry_id := call.data.get(ATTR_CONFIG_ENTRY_ID):
+            entry_ids = [entry_id] if entry_id in coordinators else []
+        else:
+            entry_ids = list(coordinators)
+        if not entry_ids:
+            raise ServiceValidationError('No loaded PurrSong account matches the request')
+
+        results = await asyncio.gather(
+            *(coordinators[entry_id].async_manual_refresh() for entry_id in entry_ids)
+        )
+        response: dict[str, Any] = {}
+        for entry_id, (result, coalesced) in zip(entry_ids, results):
+            changed = result['changed']
+            if item_ids is not None:
+                changed = {
+                    resource: [item_id for item_id in items if item_id in item_ids]
+                    for resource, items in changed.items()
+                }
+                changed = {resource: items for resource, items in changed.items() if items}
+            response[entry_id] = {**result, 'changed': changed, 'coalesced': coalesced}
+        return response
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_REFRESH,
+        async_refresh,
+        schema=REFRESH_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
@@ -1,17 +1,22 @@
 """ Update platform for PurrSong integration."""
 from __future__ import annotations
 
+from typing import Any
+
 from lavviebot.model import Cat, LavvieScanner, LavvieTag, LitterBox
 
 from homeassistant.components.update import (
     UpdateDeviceClass,
     UpdateEntity,
+    UpdateEntityFeature,
 )
 
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
+import homeassistant.util.dt as dt_util
 
 from .const import DOMAIN
 from .coordinator import LavviebotDataUpdateCoordinator
@@ -36,7 +41,51 @@ async def async_setup_entry(
     for device_id, device_data in coordinator.data.lavvie_tags.items():
         update_sensors.append(TagFirmwareUpdate(coordinator, device_id))
 
-    async_add_entities(update_sensors)
+    async_add_entities(coordinator.async_filter_entities(Platform.UPDATE, update_sensors))
+
+
+def _format_date(timestamp: float) -> str:
+    """ Format a timestamp from the firmware record as a local date and time. """
+
+    return dt_util.as_local(dt_util.utc_from_timestamp(timestamp)).strftime('%Y-%m-%d %H:%M')
+
+
+def release_summary(
+    coordinator: LavviebotDataUpdateCoordinator, resource: str, device: Any
+) -> str | None:
+    """ Return when the latest firmware of a device was first offered. """
+
+    if (offered := coordinator.history.releases[resource].get(device.latest_firmware)) is None:
+        return None
+    return f"Version {device.latest_firmware} first offered on {_format_date(offered)}."
+
+
+def release_notes(
+    coordinator: LavviebotDataUpdateCoordinator, resource: str, device: Any, devices_name: str
+) -> str:
+    """ Return release notes built from the integration's firmware rollout record.
+
+    The PurrSong API does not publish release notes, so the notes tell when
+    the latest version was first offered, how much of the fleet runs it and
+    which versions this device has run.
+    """
+
+    history = coordinator.history
+    counts = history.fleet_versions(resource)
+    lines = []
+    if (offered := history.releases[resource].get(device.latest_firmware)) is not None:
+        lines.append(f"**{device.latest_firmware}** was first offered on {_format_date(offered)}.")
+    lines.append(
+        f"{counts.get(device.latest_firmware, 0)} of {sum(counts.values())} {devices_name} "
+        f"on this account run {device.latest_firmware}."
+    )
+    versions = history.firmware[resource].get(device.device_id, [])
+    if versions:
+        lines.append("\nFirmware on this device:")
+        first_version, first_seen = versions[0]
+        lines.append(f"- {first_version}, first seen {_format_date(first_seen)}")
+        lines.extend(f"- {version}, installed {_format_date(since)}" for version, since in versions[1:])
+    return "\n".join(lines)
 
 
 class FirmwareUpdate(CoordinatorEntity, UpdateEntity):
@@ -53,6 +102,12 @@ class FirmwareUpdate(CoordinatorEntity, UpdateEntity):
 
         return self.coordinator.data.litterboxes[self.device_id]
 
+    @property
+    def available(self) -> bool:
+        """ Return True if litter box data is fresh """
+
+        return super().available and self.coordinator.is_fresh('litterboxes', self.device_id)
+
     @property
     def device_info(self) -> dict[str, Any]:
         """ Return device registry information for this entity. """
@@ -101,6 +156,23 @@ class FirmwareUpdate(CoordinatorEntity, UpdateEntity):
 
         return UpdateDeviceClass.FIRMWARE
 
+    @property
+    def supported_features(self) -> UpdateEntityFeature:
+        """ Return supported features """
+
+        return UpdateEntityFeature.RELEASE_NOTES
+
+    @property
+    def release_summary(self) -> str | None:
+        """ Return when the latest firmware was first offered """
+
+        return release_summary(self.coordinator, 'litterboxes', self.device_data)
+
+    async def async_release_notes(self) -> str | None:
+        """ Return release notes from the firmware rollout record """
+
+        return release_notes(self.coordinator, 'litterboxes', self.device_data, 'litter boxes')
+
 
 class ScannerFirmwareUpdate(CoordinatorEntity, UpdateEntity):
     """ Representation of LavvieScanner Firmware Update Availability """
@@ -116,6 +188,12 @@ class ScannerFirmwareUpdate(CoordinatorEntity, UpdateEntity):
 
         return self.coordinator.data.lavvie_scanners[self.device_id]
 
+    @property
+    def available(self) -> bool:
+        """ Return True if LavvieScanner data is fresh """
+
+        return super().available and self.coordinator.is_fresh('lavvie_scanners', self.device_id)
+
     @property
     def device_info(self) -> dict[str, Any]:
         """ Return device registry information for this entity. """
@@ -164,6 +242,23 @@ class ScannerFirmwareUpdate(CoordinatorEntity, UpdateEntity):
 
         return UpdateDeviceClass.FIRMWARE
 
+    @property
+    def supported_features(self) -> UpdateEntityFeature:
+        """ Return supported features """
+
+        return UpdateEntityFeature.RELEASE_NOTES
+
+    @property
+    def release_summary(self) -> str | None:
+        """ Return when the latest firmware was first offered """
+
+        return release_summary(self.coordinator, 'lavvie_scanners', self.device_data)
+
+    async def async_release_notes(self) -> str | None:
+        """ Return release notes from the firmware rollout record """
+
+        return release_notes(self.coordinator, 'lavvie_scanners', self.device_data, 'LavvieScanners')
+
 
 class TagFirmwareUpdate(CoordinatorEntity, UpdateEntity):
     """ Representation of LavvieTag Firmware Update Availability """
@@ -179,6 +274,12 @@ class TagFirmwareUpdate(CoordinatorEntity, UpdateEntity):
 
         return self.coordinator.data.lavvie_tags[self.device_id]
 
+    @property
+    def available(self) -> bool:
+        """ Return True if LavvieTag data is fresh """
+
+        return super().available and self.coordinator.is_fresh('lavvie_tags', self.device_id)
+
     @property
     def device_info(self) -> dict[str, Any]:
         """ Return device registry information for this entity. """
@@ -226,3 +327,20 @@ class TagFirmwareUpdate(CoordinatorEntity, UpdateEntity):
         """ Return Firmware device class """
 
         return UpdateDeviceClass.FIRMWARE
+
+    @property
+    def supported_features(self) -> UpdateEntityFeature:
+        """ Return supported features """
+
+        return UpdateEntityFeature.RELEASE_NOTES
+
+    @property
+    def release_summary(self) -> str | None:
+        """ Return when the latest firmware was first offered """
+
+        return release_summary(self.coordinator, 'lavvie_tags', self.device_data)
+
+    async def async_release_notes(self) -> str | None:
+        """ Return release notes from the firmware rollout record """
+
+        return release_notes(self.coordinator, 'lavvie_tags', self.device_data, 'LavvieTags')
@@ -1,12 +1,19 @@
 """ Utilities for Purrsong Integration """
 from __future__ import annotations
 
+from collections import deque
+from dataclasses import fields
+from datetime import datetime, timedelta, timezone
+from enum import StrEnum
 from typing import Any
 
 from aiohttp import ClientSession
 import async_timeout
 from lavviebot import LavviebotClient
 from lavviebot.exceptions import LavviebotAuthError
+from lavviebot.model import Cat, LavviebotData, LavvieScanner, LavvieTag, LitterBox
+
+import homeassistant.util.dt as dt_util
 
 from .const import LOGGER, LAVVIEBOT_ERRORS, TIMEOUT
 
@@ -39,3 +46,278 @@ async def async_validate_api(email: str, password: str) -> None:
 
 class NoDevicesError(Exception):
     """ No Devices from PurrSong API """
+
+
+class CircuitState(StrEnum):
+    """ States of the PurrSong cloud circuit breaker """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """ Stop calling the PurrSong cloud after repeated failures.
+
+    After failure_threshold consecutive failures the circuit opens and no
+    requests are allowed until the open interval has passed. A single probe
+    is then let through (half-open). If the probe fails the circuit opens
+    again with a doubled interval, up to max_open_interval seconds.
+    """
+
+    def __init__(
+        self, failure_threshold: int, open_interval: float, max_open_interval: float
+    ) -> None:
+        self.failure_threshold = failure_threshold
+        self.open_interval = open_interval
+        self.max_open_interval = max_open_interval
+        self.state = CircuitState.CLOSED
+        self.failures: int = 0
+        self.trips: int = 0
+        self.probe_at: datetime | None = None
+
+    def allow_request(self) -> bool:
+        """ Return True if a request may be sent to the cloud. """
+
+        if self.state == CircuitState.OPEN:
+            if dt_util.utcnow() < self.probe_at:
+                return False
+            self.state = CircuitState.HALF_OPEN
+        return True
+
+    def record_success(self) -> None:
+        """ Close the circuit after a successful request. """
+
+        self.state = CircuitState.CLOSED
+        self.failures = 0
+        self.trips = 0
+        self.probe_at = None
+
+    def record_failure(self) -> None:
+        """ Count a failed request, opening the circuit when needed. """
+
+        self.failures += 1
+        if self.state == CircuitState.HALF_OPEN or self.failures >= self.failure_threshold:
+            self.trips += 1
+            interval = min(self.open_interval * 2 ** (self.trips - 1), self.max_open_interval)
+            self.state = CircuitState.OPEN
+            self.probe_at = dt_util.utcnow() + timedelta(seconds=interval)
+
+
+SNAPSHOT_RESOURCES = {
+    'litterboxes': LitterBox,
+    'lavvie_scanners': LavvieScanner,
+    'lavvie_tags': LavvieTag,
+    'cats': Cat,
+}
+
+
+def snapshot_to_dict(data: LavviebotData) -> dict[str, Any]:
+    """ Serialize PurrSong data into a compact, JSON-safe snapshot.
+
+    Each resource is stored as a list of field names followed by one
+    row of values per device. Datetimes are stored as epoch seconds.
+    """
+
+    snapshot: dict[str, Any] = {}
+    for resource, model in SNAPSHOT_RESOURCES.items():
+        names = [field.name for field in fields(model)]
+        rows = []
+        for item in getattr(data, resource).values():
+            row = []
+            for name in names:
+                value = getattr(item, name)
+                if isinstance(value, datetime):
+                    value = value.timestamp()
+                row.append(value)
+            rows.append(row)
+        snapshot[resource] = {'fields': names, 'rows': rows}
+    return snapshot
+
+
+def snapshot_from_dict(snapshot: dict[str, Any]) -> LavviebotData:
+    """ Rebuild PurrSong data from a snapshot created by snapshot_to_dict.
+
+    Raises KeyError, TypeError or ValueError if the snapshot does not
+    match the installed lavviebot models.
+    """
+
+    resources: dict[str, dict[int, Any]] = {}
+    for resource, model in SNAPSHOT_RESOURCES.items():
+        timestamps = {
+            field.name for field in fields(model) if field.type in ('datetime', datetime)
+        }
+        names = snapshot[resource]['fields']
+        items: dict[int, Any] = {}
+        for row in snapshot[resource]['rows']:
+            values = dict(zip(names, row, strict=True))
+            for name in timestamps:
+                values[name] = datetime.fromtimestamp(values[name], tz=timezone.utc)
+            item = model(**values)
+            items[values['cat_id' if model is Cat else 'device_id']] = item
+        resources[resource] = items
+    return LavviebotData(**resources)
+
+
+def snapshot_items(snapshot: dict[str, Any]) -> dict[str, dict[int, dict[str, Any]]]:
+    """ Return the fields of each device and cat in a snapshot, keyed by resource and id. """
+
+    items: dict[str, dict[int, dict[str, Any]]] = {}
+    for resource, model in SNAPSHOT_RESOURCES.items():
+        key = 'cat_id' if model is Cat else 'device_id'
+        names = snapshot[resource]['fields']
+        rows = (dict(zip(names, row)) for row in snapshot[resource]['rows'])
+        items[resource] = {values[key]: values for values in rows}
+    return items
+
+
+def snapshot_diff(
+    previous: dict[str, Any], current: dict[str, Any]
+) -> dict[str, dict[int, dict[str, Any] | None]]:
+    """ Return the fields that changed between two snapshots, per device and cat.
+
+    New devices and cats have all of their fields, removed ones are None, and
+    resources without changes are left out.
+    """
+
+    before = snapshot_items(previous)
+    changes: dict[str, dict[int, dict[str, Any] | None]] = {}
+    for resource, items in snapshot_items(current).items():
+        old_items = before[resource]
+        changed: dict[int, dict[str, Any] | None] = {}
+        for item_id, values in items.items():
+            if (old := old_items.get(item_id)) is None:
+                changed[item_id] = values
+            elif fields_changed := {
+                name: value for name, value in values.items() if old.get(name) != value
+            }:
+                changed[item_id] = fields_changed
+        for item_id in old_items.keys() - items.keys():
+            changed[item_id] = None
+        if changed:
+            changes[resource] = changed
+    return changes
+
+
+class LatencyTracker:
+    """ Keep a window of recent request latencies and derive a timeout from them. """
+
+    def __init__(
+        self,
+        window: int,
+        percentile: float,
+        multiplier: float,
+        minimum: float,
+        maximum: float,
+        default: float,
+        min_samples: int,
+    ) -> None:
+        self.samples: deque[float] = deque(maxlen=window)
+        self.percentile = percentile
+        self.multiplier = multiplier
+        self.minimum = minimum
+        self.maximum = maximum
+        self.default = default
+        self.min_samples = min_samples
+
+    def add(self, seconds: float) -> None:
+        """ Record the latency of a single request. """
+
+        self.samples.append(seconds)
+
+    def quantile(self, q: float) -> float | None:
+        """ Return the q quantile of recorded latencies, if there are any. """
+
+        if not self.samples:
+            return None
+        ordered = sorted(self.samples)
+        return ordered[min(int(q * len(ordered)), len(ordered) - 1)]
+
+    @property
+    def timeout(self) -> float:
+        """ Return a per-request timeout based on the latency percentile. """
+
+        if len(self.samples) < self.min_samples:
+            return self.default
+        timeout = self.quantile(self.percentile) * self.multiplier
+        return round(min(max(timeout, self.minimum), self.maximum), 1)
+
+
+class Debouncer:
+    """ Filter a flapping boolean state.
+
+    A change is accepted once the new value has been seen in the required
+    number of consecutive updates and the current state has been held for
+    the minimum hold time. A pending change that reverts before it is
+    accepted is counted as a suppressed flap. None is treated as no evidence
+    either way, which lets callers define a hysteresis band.
+    """
+
+    def __init__(self, state: bool | None) -> None:
+        self.state = state
+        self.changed_at: datetime | None = None
+        self.pending: bool | None = None
+        self.confirmations: int = 0
+        self.suppressed: int = 0
+
+    def update(
+        self, value: bool | None, now: datetime, hold_time: float, confirmations: int
+    ) -> bool:
+        """ Add a raw value. Return True if the accepted state changed. """
+
+        if value is None:
+            return False
+        if value == self.state:
+            if self.pending is not None:
+                self.suppressed += 1
+            self.pending = None
+            self.confirmations = 0
+            return False
+        if value != self.pending:
+            self.pending = value
+            self.confirmations = 0
+        self.confirmations += 1
+        held = self.changed_at is None or (now - self.changed_at).total_seconds() >= hold_time
+        if self.confirmations < confirmations or not held:
+            return False
+        self.state = value
+        self.changed_at = now
+        self.pending = None
+        self.confirmations = 0
+        return True
+
+
+class Deadband:
+    """ Limit how often a noisy numeric value is reported.
+
+    A new value is reported once it differs from the last reported value by
+    at least the deadband and the minimum interval has passed, or once the
+    maximum silence has passed, so slow trends still show up.
+    """
+
+    def __init__(self, value: float | None, now: datetime) -> None:
+        self.value = value
+        self.reported_at = now
+
+    def update(
+        self,
+        value: float | None,
+        now: datetime,
+        deadband: float,
+        min_interval: float,
+        max_silence: float,
+    ) -> bool:
+        """ Add a raw value. Return True if it was reported. """
+
+        if value == self.value:
+            return False
+        elapsed = (now - self.reported_at).total_seconds()
+        if value is None or self.value is None:
+            moved = True
+        else:
+            moved = abs(value - self.value) >= deadband and elapsed >= min_interval
+        if not moved and elapsed < max_silence:
+            return False
+        self.value = value
+        self.reported_at = now
+        return True
@@ -0,0 +1,271 @@
+""" Websocket API for PurrSong integration."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Iterable
+from typing import Any
+
+import voluptuous as vol
+
+from homeassistant.components import websocket_api
+from homeassistant.core import HomeAssistant, callback
+import homeassistant.helpers.config_validation as cv
+import homeassistant.util.dt as dt_util
+
+from .const import (
+    DOMAIN,
+    HISTORY_CHUNK_SIZE,
+    HISTORY_MAX_PAGE_SIZE,
+    HISTORY_METRICS,
+    HISTORY_MIN_BUCKET,
+    HISTORY_PAGE_SIZE,
+)
+from .coordinator import LavviebotDataUpdateCoordinator
+from .history import FIRMWARE_RESOURCES, KINDS, bucket_events, bucket_samples
+from .util import snapshot_items
+
+# Options shared by the history commands. A cursor is the start time of the
+# next row and the number of rows with that start time already returned.
+HISTORY_SCHEMA = {
+    vol.Required("entry_id"): str,
+    vol.Required("start_time"): cv.datetime,
+    vol.Required("end_time"): cv.datetime,
+    vol.Optional("limit", default=HISTORY_PAGE_SIZE): vol.All(
+        vol.Coerce(int), vol.Range(min=1, max=HISTORY_MAX_PAGE_SIZE)
+    ),
+    vol.Optional("cursor"): vol.ExactSequence([vol.Coerce(float), vol.Coerce(int)]),
+    vol.Optional("bucket"): vol.All(vol.Coerce(int), vol.Range(min=HISTORY_MIN_BUCKET)),
+}
+
+
+@callback
+def async_register_websocket_commands(hass: HomeAssistant) -> None:
+    """ Register PurrSong websocket commands. """
+
+    websocket_api.async_register_command(hass, ws_history_events)
+    websocket_api.async_register_command(hass, ws_history_metrics)
+    websocket_api.async_register_command(hass, ws_subscribe_changes)
+    websocket_api.async_register_command(hass, ws_firmware_rollout)
+
+
+def _coordinator(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict[str, Any]
+) -> LavviebotDataUpdateCoordinator | None:
+    """ Return the coordinator for a config entry, or send an error if it isn't loaded. """
+
+    if (coordinator := hass.data.get(DOMAIN, {}).get(msg["entry_id"])) is None:
+        connection.send_error(msg["id"], websocket_api.ERR_NOT_FOUND, "Config entry not loaded")
+    return coordinator
+
+
+def _time_range(
+    connection: websocket_api.ActiveConnection, msg: dict[str, Any]
+) -> tuple[float, float] | None:
+    """ Return the requested time range in epoch seconds, or send an error if it is empty. """
+
+    start = dt_util.as_utc(msg["start_time"]).timestamp()
+    end = dt_util.as_utc(msg["end_time"]).timestamp()
+    if end <= start:
+        connection.send_error(
+            msg["id"], websocket_api.ERR_INVALID_FORMAT, "end_time must be after start_time"
+        )
+        return None
+    # Rows before the cursor were returned by earlier pages. Aggregated
+    # results are never paged, so buckets stay aligned to start_time.
+    if "cursor" in msg and "bucket" not in msg:
+        start = max(start, msg["cursor"][0])
+    return start, end
+
+
+def _page(
+    rows: Iterable[tuple[float, dict[str, Any]]], cursor: list[Any] | None, limit: int
+) -> tuple[list[dict[str, Any]], list[Any] | None]:
+    """ Return up to limit rows after the cursor, and the cursor of the next page.
+
+    Rows are read lazily, so only one page (plus one row) is ever held.
+    """
+
+    cursor_start, skip = cursor or (None, 0)
+    page: list[tuple[float, dict[str, Any]]] = []
+    skipped = 0
+    for start, row in rows:
+        if start == cursor_start and skipped < skip:
+            skipped += 1
+            continue
+        if len(page) == limit:
+            returned = sum(1 for page_start, _ in page if page_start == start)
+            if start == cursor_start:
+                returned += skip
+            return [row for _, row in page], [start, returned]
+        page.append((start, row))
+    return [row for _, row in page], None
+
+
+async def _async_stream(
+    connection: websocket_api.ActiveConnection,
+    msg_id: int,
+    rows: list[dict[str, Any]],
+    next_cursor: list[Any] | None = None,
+) -> None:
+    """ Send rows as a series of event messages, yielding to the event loop between them.
+
+    The last message has done set, and carries the cursor of the next page if there is one.
+    """
+
+    cancelled = False
+
+    @callback
+    def _async_cancel() -> None:
+        nonlocal cancelled
+        cancelled = True
+
+    connection.subscriptions[msg_id] = _async_cancel
+    connection.send_result(msg_id)
+    try:
+        for offset in range(0, max(len(rows), 1), HISTORY_CHUNK_SIZE):
+            if cancelled:
+                return
+            done = offset + HISTORY_CHUNK_SIZE >= len(rows)
+            message: dict[str, Any] = {
+                "rows": rows[offset:offset + HISTORY_CHUNK_SIZE], "done": done
+            }
+            if done:
+                message["next_cursor"] = next_cursor
+            connection.send_message(websocket_api.event_message(msg_id, message))
+            await asyncio.sleep(0)
+    finally:
+        connection.subscriptions.pop(msg_id, None)
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "purrsong/history/events",
+        **HISTORY_SCHEMA,
+        vol.Optional("device_id"): vol.Coerce(int),
+        vol.Optional("cat_id"): vol.Coerce(int),
+        vol.Optional("kinds"): [vol.In(KINDS)],
+    }
+)
+@websocket_api.async_response
+async def ws_history_events(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """ Stream visits, cleaning cycles and errors that started in a time range. """
+
+    if (coordinator := _coordinator(hass, connection, msg)) is None:
+        return
+    if (time_range := _time_range(connection, msg)) is None:
+        return
+    start, end = time_range
+    events = coordinator.history.events(
+        start, end, msg.get("device_id"), msg.get("cat_id"), msg.get("kinds")
+    )
+    if "bucket" in msg:
+        await _async_stream(connection, msg["id"], bucket_events(events, start, msg["bucket"]))
+        return
+    rows = (
+        (
+            event.start,
+            {
+                "start": event.start,
+                "end": event.end,
+                "kind": event.kind,
+                "summary": event.summary,
+                "description": event.description,
+                "device_id": device_id,
+                "cat_id": event.cat_id,
+            },
+        )
+        for device_id, event in events
+    )
+    page, next_cursor = _page(rows, msg.get("cursor"), msg["limit"])
+    await _async_stream(connection, msg["id"], page, next_cursor)
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "purrsong/history/metrics",
+        **HISTORY_SCHEMA,
+        vol.Required("resource"): vol.In(list(HISTORY_METRICS)),
+        vol.Required("subject_id"): vol.Coerce(int),
+        vol.Required("metric"): str,
+    }
+)
+@websocket_api.async_response
+async def ws_history_metrics(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """ Stream samples of a litter box or cat metric taken in a time range. """
+
+    if (coordinator := _coordinator(hass, connection, msg)) is None:
+        return
+    if msg["metric"] not in HISTORY_METRICS[msg["resource"]]:
+        connection.send_error(msg["id"], websocket_api.ERR_INVALID_FORMAT, "Unknown metric")
+        return
+    if (time_range := _time_range(connection, msg)) is None:
+        return
+    start, end = time_range
+    samples = coordinator.history.samples(
+        msg["resource"], msg["subject_id"], msg["metric"], start, end
+    )
+    if "bucket" in msg:
+        await _async_stream(connection, msg["id"], bucket_samples(samples, start, msg["bucket"]))
+        return
+    rows = ((timestamp, {"time": timestamp, "value": value}) for timestamp, value in samples)
+    page, next_cursor = _page(rows, msg.get("cursor"), msg["limit"])
+    await _async_stream(connection, msg["id"], page, next_cursor)
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "purrsong/subscribe_changes",
+        vol.Required("entry_id"): str,
+    }
+)
+@callback
+def ws_subscribe_changes(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """ Send every device and cat once, then only the fields that change after each refresh. """
+
+    if (coordinator := _coordinator(hass, connection, msg)) is None:
+        return
+
+    @callback
+    def _async_send_changes(changes: dict[str, Any]) -> None:
+        connection.send_message(websocket_api.event_message(msg["id"], {"changes": changes}))
+
+    connection.subscriptions[msg["id"]] = coordinator.async_subscribe_changes(_async_send_changes)
+    connection.send_result(msg["id"])
+    connection.send_message(
+        websocket_api.event_message(
+            msg["id"], {"snapshot": snapshot_items(coordinator.published)}
+        )
+    )
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "purrsong/firmware/rollout",
+        vol.Required("entry_id"): str,
+    }
+)
+@callback
+def ws_firmware_rollout(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """ Return when each firmware version was first offered and when each device moved to it. """
+
+    if (coordinator := _coordinator(hass, connection, msg)) is None:
+        return
+    history = coordinator.history
+    connection.send_result(
+        msg["id"],
+        {
+            resource: {
+                "releases": history.releases[resource],
+                "devices": history.firmware[resource],
+            }
+            for resource in FIRMWARE_RESOURCES
+        },
+    )
@@ -0,0 +1,107 @@
+""" Fixtures for PurrSong tests. """
+from __future__ import annotations
+
+from collections.abc import AsyncGenerator
+from typing import Any
+from unittest.mock import patch
+
+from lavviebot.exceptions import LavviebotError
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from homeassistant.const import CONF_EMAIL, CONF_PASSWORD
+from homeassistant.core import HomeAssistant
+import homeassistant.util.dt as dt_util
+
+from custom_components.purrsong.const import DOMAIN
+
+LITTER_BOX_ID = 1
+
+
+@pytest.fixture(autouse=True)
+def auto_enable_custom_integrations(enable_custom_integrations):
+    """ Enable custom integrations in every test. """
+
+    yield
+
+
+class FakeLavviebotClient:
+    """ PurrSong cloud client returning a single litter box. """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        self.cookie: str | None = None
+        self.token: str | None = None
+        self.timeout = kwargs.get('timeout')
+        self.has_cat = False
+        self._session = None
+        self.top_litter_status = 2
+        self.fail = False
+
+    async def login(self) -> None:
+        self.cookie = self.token = 'token'
+
+    async def async_discover_devices(self) -> dict[str, Any]:
+        if self.fail:
+            raise LavviebotError('PurrSong cloud unavailable')
+        return {'data': {'getLocations': [{
+            'id': 9,
+            'hasUnknownCat': False,
+            'getIots': [{
+                'id': LITTER_BOX_ID,
+                'lavviebot': {'nickname': 'Litter box'},
+                'lavvieScanner': None,
+                'lavvieTag': None,
+            }],
+        }]}}
+
+    async def async_get_litter_box_status(self, device_id: int) -> list[dict[str, Any]]:
+        now = str(int(dt_util.utcnow().timestamp() * 1000))
+        return [
+            {'data': {'getIotDetail': {
+                'iotCodeTail': 'abc',
+                'latestFirmwareVersion': '1.0',
+                'lavviebot': {
+                    'routerSSID': 'ssid',
+                    'minBottomWeight': 455.1,
+                    'beaconBattery': None,
+                    'recentLavviebotLog': {
+                        'currentFirmwareVersion': '1.0',
+                        'motorState': 0,
+                        'topLitterStatus': self.top_litter_status,
+                        'wasteDrawerStatus': 2,
+                        'waitTime': 3,
+                        'litterType': 0,
+                        'litterBottomAmount': 2500,
+                        'humidity': 40,
+                        'temperature': 22,
+                        'creationTime': now,
+                    },
+                },
+            }}},
+            {'data': {'getIotPoopRecord': {'catUsageHistory': [
+                {'nickname': 'Tom', 'duration': 30, 'creationTime': now},
+            ]}}},
+            {'data': {'getIotErrorLog': {'errorLogs': []}}},
+        ]
+
+
+@pytest.fixture
+async def client(hass: HomeAssistant) -> AsyncGenerator[FakeLavviebotClient, None]:
+    """ Set up a PurrSong config entry backed by a fake cloud client. """
+
+    fake = FakeLavviebotClient()
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        version=3,
+        unique_id='cat@example.com',
+        data={CONF_EMAIL: 'cat@example.com', CONF_PASSWORD: 'password'},
+    )
+    entry.add_to_hass(hass)
+    with patch(
+        'custom_components.purrsong.coordinator.LavviebotClient', return_value=fake
+    ) as client_class:
+        assert await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+    fake.entry = entry
+    yield fake
+    await client_class.call_args.kwargs['session'].close()
@@ -0,0 +1,125 @@
+""" Tests for PurrSong analytics. """
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+import json
+from types import SimpleNamespace
+from zoneinfo import ZoneInfo
+
+from custom_components.purrsong.analytics import (
+    ActivityRollup,
+    FleetAggregates,
+    LifetimeCounter,
+    UsageBaseline,
+    VisitCounter,
+)
+from custom_components.purrsong.const import ANOMALY_SCORE_THRESHOLD, CLOUD_TIME_ZONE
+
+
+def _cat(running: float) -> SimpleNamespace:
+    """ Return cat activity totals for today. """
+
+    return SimpleNamespace(zoomies=0, running=running, walking=0, resting=0, sleeping=0)
+
+
+def test_activity_rollup_waits_for_cloud_reset() -> None:
+    """ A local day change before the cloud resets its totals adds nothing. """
+
+    rollup = ActivityRollup()
+    rollup.update(_cat(100), datetime(2024, 1, 1, 22, 0))
+    rollup.update(_cat(160), datetime(2024, 1, 1, 23, 30))
+    # Home Assistant's midnight has passed, the cloud still reports yesterday
+    rollup.update(_cat(170), datetime(2024, 1, 2, 0, 10))
+    assert rollup.hour_totals(datetime(2024, 1, 2, 0, 10))['running'] == 10
+    # The cloud's midnight resets the total
+    rollup.update(_cat(5), datetime(2024, 1, 2, 6, 5))
+    assert rollup.hour_totals(datetime(2024, 1, 2, 6, 5))['running'] == 5
+    assert rollup.today_totals(datetime(2024, 1, 2).date())['running'] == 15
+
+
+def test_usage_baseline_follows_the_cloud_day() -> None:
+    """ A poll just after Home Assistant's midnight is not scored as a new day. """
+
+    cloud_midnight = datetime(2024, 1, 1, tzinfo=ZoneInfo(CLOUD_TIME_ZONE))
+    visit_hours = (8, 12, 16, 20)
+    baseline = UsageBaseline()
+    for day in range(10):
+        for hour in range(24):
+            visits = sum(1 for visit_hour in visit_hours if visit_hour < hour)
+            now = cloud_midnight + timedelta(days=day, hours=hour, minutes=5)
+            baseline.update(visits, 60.0, now)
+    # The totals reset at the cloud's midnight, which closes the tenth day
+    baseline.update(0, 0.0, cloud_midnight + timedelta(days=10, minutes=5))
+    assert baseline.overall['visits'].count == 10
+    assert baseline.overall['visits'].mean == 4
+    assert baseline.score < ANOMALY_SCORE_THRESHOLD
+
+    # 00:05 in UTC+1 is 18:05 of the same cloud day, three quarters through it
+    local_midnight = datetime(2024, 1, 12, 0, 5, tzinfo=timezone(timedelta(hours=1)))
+    baseline.update(3, 60.0, local_midnight)
+    assert baseline.overall['visits'].count == 10
+    assert baseline.score < ANOMALY_SCORE_THRESHOLD
+
+
+def test_usage_baseline_closes_days_without_visits() -> None:
+    """ A day without visits closes once the reset grace period has passed. """
+
+    cloud_midnight = datetime(2024, 1, 1, tzinfo=ZoneInfo(CLOUD_TIME_ZONE))
+    baseline = UsageBaseline()
+    baseline.update(0, 0.0, cloud_midnight + timedelta(hours=12))
+    baseline.update(0, 0.0, cloud_midnight + timedelta(days=1, minutes=5))
+    assert baseline.overall['visits'].count == 0
+    baseline.update(0, 0.0, cloud_midnight + timedelta(days=1, hours=1))
+    assert baseline.overall['visits'].count == 1
+    assert baseline.overall['visits'].mean == 0
+
+
+def test_lifetime_counter_counts_daily_totals_once() -> None:
+    """ Yesterday's total is not added again before the cloud resets it. """
+
+    counter = LifetimeCounter()
+    counter.add_daily(3, 30)
+    counter.add_daily(4, 30)
+    # Home Assistant's midnight has passed, the cloud still reports yesterday
+    counter.add_daily(4, 30)
+    counter.add_daily(1, 20)
+    assert counter.totals['visits'] == 5
+    assert counter.totals['duration'] == 140
+
+
+def test_lifetime_counter_sums_visit_times_from_the_average() -> None:
+    """ A shorter visit lowers today's average without being taken as a reset. """
+
+    counter = LifetimeCounter()
+    # Visits of 60, 30 and 60 seconds
+    counter.add_daily(1, 60)
+    counter.add_daily(2, 45)
+    counter.add_daily(3, 50)
+    assert counter.totals['visits'] == 3
+    assert counter.totals['duration'] == 150
+
+
+def test_visit_counter_counts_daily_visits_once() -> None:
+    """ Visits are only counted from the whole count once it drops. """
+
+    counter = VisitCounter()
+    assert counter.update(4, datetime(2024, 1, 1, 23, 0, tzinfo=timezone.utc)) == 0
+    assert counter.update(4, datetime(2024, 1, 1, 23, 0, tzinfo=timezone.utc)) == 0
+    assert counter.update(1, datetime(2024, 1, 2, 5, 10, tzinfo=timezone.utc)) == 1
+
+
+def test_fleet_aggregates_survive_a_restart() -> None:
+    """ Saved contributions restore the totals, and later refreshes stay incremental. """
+
+    fleet = FleetAggregates()
+    fleet.set('litterboxes', 1, {'visits_today': 3, 'waste_full': 1})
+    fleet.set('litterboxes', 2, {'visits_today': 2, 'waste_full': 0})
+    fleet.set('lavvie_tags', 3, {'offline': 1})
+
+    restored = FleetAggregates.from_dict(json.loads(json.dumps(fleet.as_dict())))
+    assert restored.totals == fleet.totals
+    restored.set('litterboxes', 1, {'visits_today': 4, 'waste_full': 0})
+    restored.prune('litterboxes', {1})
+    assert restored.total('visits_today') == 4
+    assert restored.total('waste_full') == 0
+    assert restored.total('offline') == 1
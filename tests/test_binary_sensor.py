@@ -0,0 +1,35 @@
+""" Tests for PurrSong binary sensors. """
+from __future__ import annotations
+
+from homeassistant.const import STATE_OFF, Platform
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+
+from custom_components.purrsong.const import DOMAIN
+
+from .conftest import LITTER_BOX_ID, FakeLavviebotClient
+
+
+async def test_failed_refresh_is_not_a_debounce_confirmation(
+    hass: HomeAssistant, client: FakeLavviebotClient
+) -> None:
+    """ A held value served after a failed refresh must not confirm a pending change. """
+
+    entity_id = er.async_get(hass).async_get_entity_id(
+        Platform.BINARY_SENSOR, DOMAIN, f'{LITTER_BOX_ID}_storage_refill_needed'
+    )
+    coordinator = hass.data[DOMAIN][client.entry.entry_id]
+    assert hass.states.get(entity_id).state == STATE_OFF
+
+    # A single reading of an empty storage is pending a second confirmation
+    client.top_litter_status = 0
+    await coordinator.async_refresh()
+    await hass.async_block_till_done()
+    assert hass.states.get(entity_id).state == STATE_OFF
+
+    # The failed refresh serves the same reading again, which is not a new confirmation
+    client.fail = True
+    await coordinator.async_refresh()
+    await hass.async_block_till_done()
+    assert coordinator.failed_attempts == 1
+    assert hass.states.get(entity_id).state == STATE_OFF
@@ -0,0 +1,70 @@
+""" Tests for the PurrSong config and options flows. """
+from __future__ import annotations
+
+from datetime import timedelta
+
+from homeassistant.const import CONF_SCAN_INTERVAL
+from homeassistant.core import HomeAssistant
+from homeassistant.data_entry_flow import FlowResultType
+
+from custom_components.purrsong.const import CONF_MIN_POLL_INTERVAL, DOMAIN
+
+from .conftest import FakeLavviebotClient
+
+
+async def test_options_flow_applies_without_reload(
+    hass: HomeAssistant, client: FakeLavviebotClient
+) -> None:
+    """ Saved options reach the running coordinator without setting it up again. """
+
+    coordinator = hass.data[DOMAIN][client.entry.entry_id]
+    result = await hass.config_entries.options.async_init(client.entry.entry_id)
+    assert result["type"] is FlowResultType.FORM
+    assert result["step_id"] == "init"
+
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"], {CONF_SCAN_INTERVAL: 40, CONF_MIN_POLL_INTERVAL: 60}
+    )
+    assert result["type"] is FlowResultType.FORM
+    assert result["errors"] == {CONF_SCAN_INTERVAL: "min_poll_interval_above_scan_interval"}
+
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"], {CONF_SCAN_INTERVAL: 120}
+    )
+    await hass.async_block_till_done()
+    assert result["type"] is FlowResultType.CREATE_ENTRY
+    assert hass.data[DOMAIN][client.entry.entry_id] is coordinator
+    assert coordinator.scan_interval == timedelta(seconds=120)
+
+
+async def test_options_flow_sets_debounce(
+    hass: HomeAssistant, client: FakeLavviebotClient
+) -> None:
+    """ Debounce settings from the form are used by the binary sensors. """
+
+    coordinator = hass.data[DOMAIN][client.entry.entry_id]
+    result = await hass.config_entries.options.async_init(client.entry.entry_id)
+    await hass.config_entries.options.async_configure(
+        result["flow_id"], {"storage_refill_hold_time": 0, "storage_refill_confirmations": 3}
+    )
+    await hass.async_block_till_done()
+    assert coordinator.debounce_settings('storage_refill') == (0, 3)
+
+
+async def test_options_flow_sets_deadband_intervals(
+    hass: HomeAssistant, client: FakeLavviebotClient
+) -> None:
+    """ Deadband reporting intervals from the form are used by the sensors. """
+
+    coordinator = hass.data[DOMAIN][client.entry.entry_id]
+    result = await hass.config_entries.options.async_init(client.entry.entry_id)
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"], {"humidity_min_interval": 900, "humidity_max_silence": 600}
+    )
+    assert result["errors"] == {"humidity_max_silence": "min_interval_above_max_silence"}
+
+    await hass.config_entries.options.async_configure(
+        result["flow_id"], {"humidity_min_interval": 60, "humidity_max_silence": 1800}
+    )
+    await hass.async_block_till_done()
+    assert coordinator.deadband_settings('humidity') == (2, 60, 1800)
@@ -0,0 +1,78 @@
+""" Tests for the PurrSong data update coordinator. """
+from __future__ import annotations
+
+from datetime import timedelta
+
+from freezegun.api import FrozenDateTimeFactory
+
+from homeassistant.const import STATE_OFF, STATE_UNAVAILABLE, Platform
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er, issue_registry as ir
+
+from custom_components.purrsong.const import (
+    CIRCUIT_FAILURE_THRESHOLD,
+    CIRCUIT_OPEN_INTERVAL,
+    DEFAULT_STALE_AFTER,
+    DOMAIN,
+    ISSUE_CLOUD_UNREACHABLE,
+    RETRY_BACKOFF_MIN,
+)
+from custom_components.purrsong.util import CircuitState
+
+from .conftest import LITTER_BOX_ID, FakeLavviebotClient
+
+
+async def test_circuit_raises_and_clears_repair_issue(
+    hass: HomeAssistant, client: FakeLavviebotClient, freezer: FrozenDateTimeFactory
+) -> None:
+    """ An open circuit raises a repair issue, which is cleared once a probe succeeds. """
+
+    coordinator = hass.data[DOMAIN][client.entry.entry_id]
+    issues = ir.async_get(hass)
+    issue_id = f'{ISSUE_CLOUD_UNREACHABLE}_{client.entry.entry_id}'
+
+    client.fail = True
+    for _ in range(CIRCUIT_FAILURE_THRESHOLD):
+        assert issues.async_get_issue(DOMAIN, issue_id) is None
+        await coordinator.async_refresh()
+    assert coordinator.breaker.state == CircuitState.OPEN
+    assert issues.async_get_issue(DOMAIN, issue_id) is not None
+
+    # No request is sent while the circuit is open, so the recovered cloud goes unnoticed
+    client.fail = False
+    await coordinator.async_refresh()
+    assert coordinator.breaker.state == CircuitState.OPEN
+    assert coordinator.last_update_success
+
+    freezer.tick(CIRCUIT_OPEN_INTERVAL)
+    await coordinator.async_refresh()
+    assert coordinator.breaker.state == CircuitState.CLOSED
+    assert issues.async_get_issue(DOMAIN, issue_id) is None
+    assert coordinator.failed_attempts == 0
+
+
+async def test_last_good_data_is_served_until_stale(
+    hass: HomeAssistant, client: FakeLavviebotClient, freezer: FrozenDateTimeFactory
+) -> None:
+    """ Failed refreshes serve the last good data with a backoff until it goes stale. """
+
+    entity_id = er.async_get(hass).async_get_entity_id(
+        Platform.BINARY_SENSOR, DOMAIN, f'{LITTER_BOX_ID}_storage_refill_needed'
+    )
+    coordinator = hass.data[DOMAIN][client.entry.entry_id]
+    data = coordinator.data
+
+    client.fail = True
+    for attempt in range(2):
+        await coordinator.async_refresh()
+        await hass.async_block_till_done()
+        assert coordinator.last_update_success
+        assert coordinator.data is data
+        assert coordinator.update_interval == timedelta(seconds=RETRY_BACKOFF_MIN * 2 ** attempt)
+        assert hass.states.get(entity_id).state == STATE_OFF
+
+    freezer.tick(DEFAULT_STALE_AFTER + 1)
+    await coordinator.async_refresh()
+    await hass.async_block_till_done()
+    assert not coordinator.last_update_success
+    assert hass.states.get(entity_id).state == STATE_UNAVAILABLE
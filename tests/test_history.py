@@ -0,0 +1,16 @@
+""" Tests for the PurrSong event history. """
+from __future__ import annotations
+
+from custom_components.purrsong.history import KIND_CLEANING, KIND_VISIT, HistoryEvent, IntervalIndex
+
+
+def test_current_event_is_only_an_event_in_progress() -> None:
+    """ A finished event is not the calendar's current event. """
+
+    index = IntervalIndex()
+    index.add(HistoryEvent(100, 160, KIND_VISIT, "Tom visit"))
+    index.add(HistoryEvent(400, 460, KIND_CLEANING, "Cleaning cycle"))
+    assert index.current(130).summary == "Tom visit"
+    assert index.current(300) is None
+    assert index.current(430).summary == "Cleaning cycle"
+    assert index.current(500) is None
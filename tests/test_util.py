@@ -0,0 +1,72 @@
+""" Tests for PurrSong helpers. """
+from __future__ import annotations
+
+from datetime import timedelta
+import json
+
+from freezegun.api import FrozenDateTimeFactory
+
+from homeassistant.core import HomeAssistant
+import homeassistant.util.dt as dt_util
+
+from custom_components.purrsong.const import DOMAIN
+from custom_components.purrsong.util import (
+    CircuitBreaker,
+    CircuitState,
+    snapshot_from_dict,
+    snapshot_to_dict,
+)
+
+from .conftest import FakeLavviebotClient
+
+
+def test_circuit_breaker_opens_probes_and_closes(freezer: FrozenDateTimeFactory) -> None:
+    """ The circuit opens after repeated failures and backs off failed probes. """
+
+    breaker = CircuitBreaker(3, 60, 150)
+    for _ in range(2):
+        breaker.record_failure()
+        assert breaker.state == CircuitState.CLOSED
+        assert breaker.allow_request()
+
+    breaker.record_failure()
+    assert breaker.state == CircuitState.OPEN
+    assert breaker.probe_at == dt_util.utcnow() + timedelta(seconds=60)
+    assert not breaker.allow_request()
+
+    # A single probe is let through once the open interval has passed
+    freezer.tick(60)
+    assert breaker.allow_request()
+    assert breaker.state == CircuitState.HALF_OPEN
+
+    # Each failed probe doubles the interval, up to the maximum
+    breaker.record_failure()
+    assert breaker.state == CircuitState.OPEN
+    assert breaker.probe_at == dt_util.utcnow() + timedelta(seconds=120)
+    freezer.tick(120)
+    assert breaker.allow_request()
+    breaker.record_failure()
+    assert breaker.probe_at == dt_util.utcnow() + timedelta(seconds=150)
+
+    freezer.tick(150)
+    assert breaker.allow_request()
+    breaker.record_success()
+    assert breaker.state == CircuitState.CLOSED
+    assert breaker.failures == 0
+    assert breaker.probe_at is None
+
+
+async def test_snapshot_round_trip(hass: HomeAssistant, client: FakeLavviebotClient) -> None:
+    """ Data saved to disk is restored unchanged, along with its freshness. """
+
+    coordinator = hass.data[DOMAIN][client.entry.entry_id]
+    data = coordinator.data
+    assert snapshot_from_dict(json.loads(json.dumps(snapshot_to_dict(data)))) == data
+
+    refreshed_at = coordinator.refreshed_at
+    await coordinator.snapshot_store.async_save(coordinator._snapshot())
+    coordinator.data = None
+    coordinator.refreshed_at = {resource: {} for resource in refreshed_at}
+    assert await coordinator.async_restore_snapshot()
+    assert coordinator.data == data
+    assert coordinator.refreshed_at == refreshed_at